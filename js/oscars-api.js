@@ -25,18 +25,32 @@ function toInt(value) {
   return Number.isFinite(n) ? Math.round(n) : null;
 }
 
+function resolvePosterUrl(posterUrl) {
+  return typeof posterUrl === 'string' && posterUrl.startsWith('/posters/')
+    ? (API_BASE ? `${API_BASE}${posterUrl}` : posterUrl)
+    : posterUrl;
+}
+
+function resolveSrcset(srcset) {
+  if (typeof srcset !== 'string' || !srcset) return srcset;
+  return srcset
+    .split(',')
+    .map((entry) => {
+      const [url, width] = entry.trim().split(/\s+/);
+      return width ? `${resolvePosterUrl(url)} ${width}` : resolvePosterUrl(url);
+    })
+    .join(', ');
+}
+
 function normalizeRow(row) {
-  const posterUrl = row.poster_url;
-  const resolvedPoster =
-    typeof posterUrl === 'string' && posterUrl.startsWith('/posters/')
-      ? (API_BASE ? `${API_BASE}${posterUrl}` : posterUrl)
-      : posterUrl;
   return {
     ...row,
     watched: toBool(row.watched),
     rating_1_10: toNumber(row.rating_1_10),
     nominations_number: toInt(row.nominations_number),
-    poster_url: resolvedPoster
+    poster_url: resolvePosterUrl(row.poster_url),
+    poster_srcset: resolveSrcset(row.poster_srcset),
+    poster_thumb_url: resolvePosterUrl(row.poster_thumb_url)
   };
 }
 
@@ -55,7 +69,7 @@ async function parseJson(res) {
 }
 
 export async function fetchOscars(year) {
-  const res = await fetch(withYear('/api/oscars', year), { cache: 'no-store' });
+  const res = await fetch(withYear('/api/oscars', year), { cache: 'no-cache' });
   if (!res.ok) {
     const err = await parseJson(res);
     throw new Error(err.error || `API error: ${res.status}`);
@@ -136,7 +150,7 @@ export async function resetOscars(year) {
 }
 
 export async function fetchOscarsYears() {
-  const res = await fetch(`${API_BASE}/api/oscars/years`, { cache: 'no-store' });
+  const res = await fetch(`${API_BASE}/api/oscars/years`, { cache: 'no-cache' });
   if (!res.ok) {
     const err = await parseJson(res);
     throw new Error(err.error || `API error: ${res.status}`);
@@ -145,3 +159,52 @@ export async function fetchOscarsYears() {
   const years = Array.isArray(data) ? data : data.years || [];
   return years.map((y) => Number(y)).filter((y) => Number.isFinite(y));
 }
+
+export async function fetchBatch(requests) {
+  const res = await fetch(`${API_BASE}/api/batch`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    cache: 'no-store',
+    body: JSON.stringify({ requests })
+  });
+  if (!res.ok) {
+    const err = await parseJson(res);
+    throw new Error(err.error || `API error: ${res.status}`);
+  }
+  const data = await res.json();
+  return data.responses || [];
+}
+
+export async function fetchOscarsStartup(year) {
+  // Page load: the year list and the requested year's rows in one round trip, read from one snapshot.
+  const requests = [{ id: 'years', path: '/api/oscars/years' }];
+  if (Number.isFinite(year)) requests.push({ id: 'rows', path: `/api/oscars?year=${encodeURIComponent(year)}` });
+  const responses = await fetchBatch(requests);
+  const byId = new Map(responses.map((item) => [item.id, item]));
+  const yearsRes = byId.get('years');
+  if (!yearsRes || yearsRes.status !== 200) {
+    throw new Error((yearsRes && yearsRes.body && yearsRes.body.error) || 'API error: years');
+  }
+  const years = (yearsRes.body.years || []).map((y) => Number(y)).filter((y) => Number.isFinite(y));
+  const rowsRes = byId.get('rows');
+  const rows = rowsRes && rowsRes.status === 200 ? normalizeRows(rowsRes.body.rows) : null;
+  return { years, rows };
+}
+
+export async function fetchSeedBundle(year) {
+  const res = await fetch(`${API_BASE}/api/oscars/seeds`, { cache: 'no-cache' });
+  if (!res.ok) {
+    const err = await parseJson(res);
+    throw new Error(err.error || `API error: ${res.status}`);
+  }
+  const manifest = await res.json();
+  const entry = (manifest.years || []).find((item) => Number(item.year) === Number(year));
+  if (!entry) return null;
+  // Bundle URLs are content-hashed and immutable, so the HTTP cache serves years already downloaded.
+  const bundle = await fetch(`${API_BASE}${entry.url}`);
+  if (!bundle.ok) {
+    throw new Error(`API error: ${bundle.status}`);
+  }
+  const data = await bundle.json();
+  return Array.isArray(data) ? data : data.rows || [];
+}
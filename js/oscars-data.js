@@ -160,6 +160,14 @@ function migrateLegacyStorage(year, apiBase) {
 }
 
 async function loadSeed(year, staticBase, apiBase) {
+  if (apiBase) {
+    try {
+      const rows = await api.fetchSeedBundle(year);
+      if (rows) return normalizeRows(rows, apiBase, year);
+    } catch {
+      // fall back to the static data file
+    }
+  }
   const res = await fetch(`${staticBase}/${year}.json`, { cache: 'no-store' });
   if (!res.ok) {
     throw new Error(`Missing data file for ${year}`);
@@ -367,6 +375,12 @@ export async function fetchOscarsYears() {
   return years.map((y) => Number(y)).filter((y) => Number.isFinite(y));
 }
 
+export async function fetchOscarsStartup(year) {
+  const mode = await resolveMode();
+  if (mode === 'api') return api.fetchOscarsStartup(year);
+  return { years: await fetchOscarsYears(), rows: null };
+}
+
 export async function fetchOscarsAll(years = null) {
   const list = Array.isArray(years) && years.length ? years : await fetchOscarsYears();
   const uniq = Array.from(new Set(list.filter((y) => Number.isFinite(y))));
@@ -1,527 +0,0 @@
-export const OSCARS_SEED_1929 = [
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "7th Heaven",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 5,
-    "nominated_categories": "Actress in a Leading Role; Directing; Writing (Adapted Screenplay); Production Design; Best Picture",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=7th%20Heaven",
-    "imdb_url": "https://www.imdb.com/find/?q=7th%20Heaven",
-    "id": 1
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "A Ship Comes In",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actress in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=A%20Ship%20Comes%20In",
-    "imdb_url": "https://www.imdb.com/find/?q=A%20Ship%20Comes%20In",
-    "id": 2
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Chang",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Best Picture",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Chang",
-    "imdb_url": "https://www.imdb.com/find/?q=Chang",
-    "id": 3
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Glorious Betsy",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Glorious%20Betsy",
-    "imdb_url": "https://www.imdb.com/find/?q=Glorious%20Betsy",
-    "id": 4
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Sadie Thompson",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actress in a Leading Role; Cinematography",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Sadie%20Thompson",
-    "imdb_url": "https://www.imdb.com/find/?q=Sadie%20Thompson",
-    "id": 5
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Sorrell and Son",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Directing",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Sorrell%20and%20Son",
-    "imdb_url": "https://www.imdb.com/find/?q=Sorrell%20and%20Son",
-    "id": 6
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Speedy",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Directing",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Speedy",
-    "imdb_url": "https://www.imdb.com/find/?q=Speedy",
-    "id": 7
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Street Angel",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actress in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Street%20Angel",
-    "imdb_url": "https://www.imdb.com/find/?q=Street%20Angel",
-    "id": 8
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Sunrise",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 4,
-    "nominated_categories": "Actress in a Leading Role; Cinematography; Best Picture; Production Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Sunrise",
-    "imdb_url": "https://www.imdb.com/find/?q=Sunrise",
-    "id": 9
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Tempest",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Production Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Tempest",
-    "imdb_url": "https://www.imdb.com/find/?q=Tempest",
-    "id": 10
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Circus",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Special Award",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Circus",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Circus",
-    "id": 11
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Crowd",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Directing; Best Picture",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Crowd",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Crowd",
-    "id": 12
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Devil Dancer",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Cinematography",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Devil%20Dancer",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Devil%20Dancer",
-    "id": 13
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Dove",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Production Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Dove",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Dove",
-    "id": 14
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Jazz Singer",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Special Award; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Jazz%20Singer",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Jazz%20Singer",
-    "id": 15
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Last Command",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actor in a Leading Role; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Last%20Command",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Last%20Command",
-    "id": 16
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Magic Flame",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Cinematography",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Magic%20Flame",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Magic%20Flame",
-    "id": 17
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Noose",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actor in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Noose",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Noose",
-    "id": 18
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Patent Leather Kid",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actor in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Patent%20Leather%20Kid",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Patent%20Leather%20Kid",
-    "id": 19
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Private Life of Helen of Troy",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Private%20Life%20of%20Helen%20of%20Troy",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Private%20Life%20of%20Helen%20of%20Troy",
-    "id": 20
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Racket",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Best Picture",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Racket",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Racket",
-    "id": 21
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Way of All Flesh",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actor in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Way%20of%20All%20Flesh",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Way%20of%20All%20Flesh",
-    "id": 22
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Two Arabian Knights",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Directing",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Two%20Arabian%20Knights",
-    "imdb_url": "https://www.imdb.com/find/?q=Two%20Arabian%20Knights",
-    "id": 23
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Underworld",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Underworld",
-    "imdb_url": "https://www.imdb.com/find/?q=Underworld",
-    "id": 24
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Wings",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Visual Effects; Best Picture",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Wings",
-    "imdb_url": "https://www.imdb.com/find/?q=Wings",
-    "id": 25
-  }
-];
@@ -1,1115 +0,0 @@
-export const OSCARS_SEED_2022 = [
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Affairs of the Art",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Affairs%20of%20the%20Art",
-    "imdb_url": "https://www.imdb.com/find/?q=Affairs%20of%20the%20Art",
-    "id": 1
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Ala Kachuu - Take and Run",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Ala%20Kachuu%20-%20Take%20and%20Run",
-    "imdb_url": "https://www.imdb.com/find/?q=Ala%20Kachuu%20-%20Take%20and%20Run",
-    "id": 2
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Ascension",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Ascension",
-    "imdb_url": "https://www.imdb.com/find/?q=Ascension",
-    "id": 3
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Attica",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Attica",
-    "imdb_url": "https://www.imdb.com/find/?q=Attica",
-    "id": 4
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Audible",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Audible",
-    "imdb_url": "https://www.imdb.com/find/?q=Audible",
-    "id": 5
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Being the Ricardos",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Actor in a Leading Role; Actor in a Supporting Role; Actress in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Being%20the%20Ricardos",
-    "imdb_url": "https://www.imdb.com/find/?q=Being%20the%20Ricardos",
-    "id": 6
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Belfast",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 7,
-    "nominated_categories": "Best Picture; Directing; Actor in a Supporting Role; Actress in a Supporting Role; Writing (Original Screenplay); Sound; Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Belfast",
-    "imdb_url": "https://www.imdb.com/find/?q=Belfast",
-    "id": 7
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Bestia",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Bestia",
-    "imdb_url": "https://www.imdb.com/find/?q=Bestia",
-    "id": 8
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Boxballet",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Boxballet",
-    "imdb_url": "https://www.imdb.com/find/?q=Boxballet",
-    "id": 9
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "CODA",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Best Picture; Actor in a Supporting Role; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=CODA",
-    "imdb_url": "https://www.imdb.com/find/?q=CODA",
-    "id": 10
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Coming 2 America",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Makeup and Hairstyling",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Coming%202%20America",
-    "imdb_url": "https://www.imdb.com/find/?q=Coming%202%20America",
-    "id": 11
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Cruella",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Costume Design; Makeup and Hairstyling",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Cruella",
-    "imdb_url": "https://www.imdb.com/find/?q=Cruella",
-    "id": 12
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Cyrano",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Costume Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Cyrano",
-    "imdb_url": "https://www.imdb.com/find/?q=Cyrano",
-    "id": 13
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Don't Look Up",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 4,
-    "nominated_categories": "Best Picture; Film Editing; Music (Original Score); Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Don%27t%20Look%20Up",
-    "imdb_url": "https://www.imdb.com/find/?q=Don%27t%20Look%20Up",
-    "id": 14
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Drive My Car",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Japan",
-    "nominations_number": 4,
-    "nominated_categories": "Best Picture; Directing; Writing (Adapted Screenplay); International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Drive%20My%20Car",
-    "imdb_url": "https://www.imdb.com/find/?q=Drive%20My%20Car",
-    "id": 15
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Dune",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 10,
-    "nominated_categories": "Best Picture; Cinematography; Costume Design; Film Editing; Makeup and Hairstyling; Music (Original Score); Production Design; Sound; Visual Effects; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Dune",
-    "imdb_url": "https://www.imdb.com/find/?q=Dune",
-    "id": 16
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Encanto",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Animated Feature Film; Music (Original Score); Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Encanto",
-    "imdb_url": "https://www.imdb.com/find/?q=Encanto",
-    "id": 17
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Flee",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Denmark",
-    "nominations_number": 3,
-    "nominated_categories": "Animated Feature Film; Documentary Feature Film; International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Flee",
-    "imdb_url": "https://www.imdb.com/find/?q=Flee",
-    "id": 18
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Four Good Days",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Four%20Good%20Days",
-    "imdb_url": "https://www.imdb.com/find/?q=Four%20Good%20Days",
-    "id": 19
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Free Guy",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Free%20Guy",
-    "imdb_url": "https://www.imdb.com/find/?q=Free%20Guy",
-    "id": 20
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "House of Gucci",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Makeup and Hairstyling",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=House%20of%20Gucci",
-    "imdb_url": "https://www.imdb.com/find/?q=House%20of%20Gucci",
-    "id": 21
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "King Richard",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 6,
-    "nominated_categories": "Best Picture; Actor in a Leading Role; Actress in a Supporting Role; Film Editing; Music (Original Song); Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=King%20Richard",
-    "imdb_url": "https://www.imdb.com/find/?q=King%20Richard",
-    "id": 22
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Lead Me Home",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Lead%20Me%20Home",
-    "imdb_url": "https://www.imdb.com/find/?q=Lead%20Me%20Home",
-    "id": 23
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Licorice Pizza",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Best Picture; Directing; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Licorice%20Pizza",
-    "imdb_url": "https://www.imdb.com/find/?q=Licorice%20Pizza",
-    "id": 24
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Luca",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Luca",
-    "imdb_url": "https://www.imdb.com/find/?q=Luca",
-    "id": 25
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Lunana: A Yak in the Classroom",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Bhutan",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Lunana%3A%20A%20Yak%20in%20the%20Classroom",
-    "imdb_url": "https://www.imdb.com/find/?q=Lunana%3A%20A%20Yak%20in%20the%20Classroom",
-    "id": 26
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Nightmare Alley",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 4,
-    "nominated_categories": "Best Picture; Cinematography; Costume Design; Production Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Nightmare%20Alley",
-    "imdb_url": "https://www.imdb.com/find/?q=Nightmare%20Alley",
-    "id": 27
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "No Time to Die",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Music (Original Song); Sound; Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=No%20Time%20to%20Die",
-    "imdb_url": "https://www.imdb.com/find/?q=No%20Time%20to%20Die",
-    "id": 28
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "On My Mind",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=On%20My%20Mind",
-    "imdb_url": "https://www.imdb.com/find/?q=On%20My%20Mind",
-    "id": 29
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Parallel Mothers",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actress in a Leading Role; Music (Original Score)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Parallel%20Mothers",
-    "imdb_url": "https://www.imdb.com/find/?q=Parallel%20Mothers",
-    "id": 30
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Please Hold",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Please%20Hold",
-    "imdb_url": "https://www.imdb.com/find/?q=Please%20Hold",
-    "id": 31
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Raya and the Last Dragon",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Raya%20and%20the%20Last%20Dragon",
-    "imdb_url": "https://www.imdb.com/find/?q=Raya%20and%20the%20Last%20Dragon",
-    "id": 32
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Robin Robin",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Robin%20Robin",
-    "imdb_url": "https://www.imdb.com/find/?q=Robin%20Robin",
-    "id": 33
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Shang-Chi and the Legend of the Ten Rings",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Shang-Chi%20and%20the%20Legend%20of%20the%20Ten%20Rings",
-    "imdb_url": "https://www.imdb.com/find/?q=Shang-Chi%20and%20the%20Legend%20of%20the%20Ten%20Rings",
-    "id": 34
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Spencer",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actress in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Spencer",
-    "imdb_url": "https://www.imdb.com/find/?q=Spencer",
-    "id": 35
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Spider-Man: No Way Home",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Spider-Man%3A%20No%20Way%20Home",
-    "imdb_url": "https://www.imdb.com/find/?q=Spider-Man%3A%20No%20Way%20Home",
-    "id": 36
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Summer of Soul (...Or, When the Revolution Could Not Be Televised)",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Summer%20of%20Soul%20%28...Or%2C%20When%20the%20Revolution%20Could%20Not%20Be%20Televised%29",
-    "imdb_url": "https://www.imdb.com/find/?q=Summer%20of%20Soul%20%28...Or%2C%20When%20the%20Revolution%20Could%20Not%20Be%20Televised%29",
-    "id": 37
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Dress",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Dress",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Dress",
-    "id": 38
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Eyes of Tammy Faye",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actress in a Leading Role; Makeup and Hairstyling",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Eyes%20of%20Tammy%20Faye",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Eyes%20of%20Tammy%20Faye",
-    "id": 39
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Hand of God",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Italy",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Hand%20of%20God",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Hand%20of%20God",
-    "id": 40
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Long Goodbye",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Long%20Goodbye",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Long%20Goodbye",
-    "id": 41
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Lost Daughter",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Actress in a Leading Role; Actress in a Supporting Role; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Lost%20Daughter",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Lost%20Daughter",
-    "id": 42
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Mitchells vs. the Machines",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Mitchells%20vs.%20the%20Machines",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Mitchells%20vs.%20the%20Machines",
-    "id": 43
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Power of the Dog",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 11,
-    "nominated_categories": "Best Picture; Directing; Actor in a Leading Role; Actor in a Supporting Role; Actress in a Supporting Role; Cinematography; Film Editing; Music (Original Score); Production Design; Sound; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Power%20of%20the%20Dog",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Power%20of%20the%20Dog",
-    "id": 44
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Queen of Basketball",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Queen%20of%20Basketball",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Queen%20of%20Basketball",
-    "id": 45
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Tragedy of Macbeth",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Actor in a Leading Role; Cinematography; Production Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Tragedy%20of%20Macbeth",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Tragedy%20of%20Macbeth",
-    "id": 46
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Windshield Wiper",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Windshield%20Wiper",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Windshield%20Wiper",
-    "id": 47
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Worst Person in the World",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Norway",
-    "nominations_number": 2,
-    "nominated_categories": "International Feature Film; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Worst%20Person%20in%20the%20World",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Worst%20Person%20in%20the%20World",
-    "id": 48
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Three Songs for Benazir",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Three%20Songs%20for%20Benazir",
-    "imdb_url": "https://www.imdb.com/find/?q=Three%20Songs%20for%20Benazir",
-    "id": 49
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "tick, tick... Boom!",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actor in a Leading Role; Film Editing",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=tick%2C%20tick...%20Boom%21",
-    "imdb_url": "https://www.imdb.com/find/?q=tick%2C%20tick...%20Boom%21",
-    "id": 50
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "West Side Story",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 7,
-    "nominated_categories": "Best Picture; Directing; Actress in a Supporting Role; Cinematography; Costume Design; Production Design; Sound",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=West%20Side%20Story",
-    "imdb_url": "https://www.imdb.com/find/?q=West%20Side%20Story",
-    "id": 51
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "When We Were Bullies",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=When%20We%20Were%20Bullies",
-    "imdb_url": "https://www.imdb.com/find/?q=When%20We%20Were%20Bullies",
-    "id": 52
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Writing with Fire",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Writing%20with%20Fire",
-    "imdb_url": "https://www.imdb.com/find/?q=Writing%20with%20Fire",
-    "id": 53
-  }
-];
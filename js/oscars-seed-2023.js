@@ -1,1136 +0,0 @@
-export const OSCARS_SEED_2023 = [
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "A House Made of Splinters",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=A%20House%20Made%20of%20Splinters",
-    "imdb_url": "https://www.imdb.com/find/?q=A%20House%20Made%20of%20Splinters",
-    "id": 1
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Aftersun",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actor in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Aftersun",
-    "imdb_url": "https://www.imdb.com/find/?q=Aftersun",
-    "id": 2
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "All Quiet on the Western Front",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Germany",
-    "nominations_number": 9,
-    "nominated_categories": "Best Picture; International Feature Film; Cinematography; Makeup and Hairstyling; Music (Original Score); Production Design; Sound; Visual Effects; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=All%20Quiet%20on%20the%20Western%20Front",
-    "imdb_url": "https://www.imdb.com/find/?q=All%20Quiet%20on%20the%20Western%20Front",
-    "id": 3
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "All That Breathes",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=All%20That%20Breathes",
-    "imdb_url": "https://www.imdb.com/find/?q=All%20That%20Breathes",
-    "id": 4
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "All the Beauty and the Bloodshed",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=All%20the%20Beauty%20and%20the%20Bloodshed",
-    "imdb_url": "https://www.imdb.com/find/?q=All%20the%20Beauty%20and%20the%20Bloodshed",
-    "id": 5
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "An Irish Goodbye",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=An%20Irish%20Goodbye",
-    "imdb_url": "https://www.imdb.com/find/?q=An%20Irish%20Goodbye",
-    "id": 6
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "An Ostrich Told Me the World Is Fake and I Think I Believe It",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=An%20Ostrich%20Told%20Me%20the%20World%20Is%20Fake%20and%20I%20Think%20I%20Believe%20It",
-    "imdb_url": "https://www.imdb.com/find/?q=An%20Ostrich%20Told%20Me%20the%20World%20Is%20Fake%20and%20I%20Think%20I%20Believe%20It",
-    "id": 7
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Argentina, 1985",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Argentina",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Argentina%2C%201985",
-    "imdb_url": "https://www.imdb.com/find/?q=Argentina%2C%201985",
-    "id": 8
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Avatar: The Way of Water",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 4,
-    "nominated_categories": "Best Picture; Production Design; Sound; Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Avatar%3A%20The%20Way%20of%20Water",
-    "imdb_url": "https://www.imdb.com/find/?q=Avatar%3A%20The%20Way%20of%20Water",
-    "id": 9
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Babylon",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Costume Design; Production Design; Music (Original Score)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Babylon",
-    "imdb_url": "https://www.imdb.com/find/?q=Babylon",
-    "id": 10
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Bardo, False Chronicle of a Handful of Truths",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Cinematography",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Bardo%2C%20False%20Chronicle%20of%20a%20Handful%20of%20Truths",
-    "imdb_url": "https://www.imdb.com/find/?q=Bardo%2C%20False%20Chronicle%20of%20a%20Handful%20of%20Truths",
-    "id": 11
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Black Panther: Wakanda Forever",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 5,
-    "nominated_categories": "Actress in a Supporting Role; Costume Design; Makeup and Hairstyling; Music (Original Song); Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Black%20Panther%3A%20Wakanda%20Forever",
-    "imdb_url": "https://www.imdb.com/find/?q=Black%20Panther%3A%20Wakanda%20Forever",
-    "id": 12
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Blonde",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actress in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Blonde",
-    "imdb_url": "https://www.imdb.com/find/?q=Blonde",
-    "id": 13
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Causeway",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actor in a Supporting Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Causeway",
-    "imdb_url": "https://www.imdb.com/find/?q=Causeway",
-    "id": 14
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Close",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Belgium",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Close",
-    "imdb_url": "https://www.imdb.com/find/?q=Close",
-    "id": 15
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Elvis",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 8,
-    "nominated_categories": "Best Picture; Actor in a Leading Role; Cinematography; Costume Design; Film Editing; Makeup and Hairstyling; Production Design; Sound",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Elvis",
-    "imdb_url": "https://www.imdb.com/find/?q=Elvis",
-    "id": 16
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Empire of Light",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Cinematography",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Empire%20of%20Light",
-    "imdb_url": "https://www.imdb.com/find/?q=Empire%20of%20Light",
-    "id": 17
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "EO",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Poland",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=EO",
-    "imdb_url": "https://www.imdb.com/find/?q=EO",
-    "id": 18
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Everything Everywhere All at Once",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 10,
-    "nominated_categories": "Best Picture; Directing; Actor in a Supporting Role; Actress in a Leading Role; Actress in a Supporting Role; Writing (Original Screenplay); Film Editing; Music (Original Score); Music (Original Song); Costume Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Everything%20Everywhere%20All%20at%20Once",
-    "imdb_url": "https://www.imdb.com/find/?q=Everything%20Everywhere%20All%20at%20Once",
-    "id": 19
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Fire of Love",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Fire%20of%20Love",
-    "imdb_url": "https://www.imdb.com/find/?q=Fire%20of%20Love",
-    "id": 20
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Glass Onion: A Knives Out Mystery",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Glass%20Onion%3A%20A%20Knives%20Out%20Mystery",
-    "imdb_url": "https://www.imdb.com/find/?q=Glass%20Onion%3A%20A%20Knives%20Out%20Mystery",
-    "id": 21
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Guillermo del Toro's Pinocchio",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Guillermo%20del%20Toro%27s%20Pinocchio",
-    "imdb_url": "https://www.imdb.com/find/?q=Guillermo%20del%20Toro%27s%20Pinocchio",
-    "id": 22
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Haulout",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Haulout",
-    "imdb_url": "https://www.imdb.com/find/?q=Haulout",
-    "id": 23
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "How Do You Measure a Year?",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=How%20Do%20You%20Measure%20a%20Year%3F",
-    "imdb_url": "https://www.imdb.com/find/?q=How%20Do%20You%20Measure%20a%20Year%3F",
-    "id": 24
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Ice Merchants",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Ice%20Merchants",
-    "imdb_url": "https://www.imdb.com/find/?q=Ice%20Merchants",
-    "id": 25
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Ivalu",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Ivalu",
-    "imdb_url": "https://www.imdb.com/find/?q=Ivalu",
-    "id": 26
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Le Pupille",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Le%20Pupille",
-    "imdb_url": "https://www.imdb.com/find/?q=Le%20Pupille",
-    "id": 27
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Living",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actor in a Leading Role; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Living",
-    "imdb_url": "https://www.imdb.com/find/?q=Living",
-    "id": 28
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Marcel the Shell with Shoes On",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Marcel%20the%20Shell%20with%20Shoes%20On",
-    "imdb_url": "https://www.imdb.com/find/?q=Marcel%20the%20Shell%20with%20Shoes%20On",
-    "id": 29
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Mrs. Harris Goes to Paris",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Costume Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Mrs.%20Harris%20Goes%20to%20Paris",
-    "imdb_url": "https://www.imdb.com/find/?q=Mrs.%20Harris%20Goes%20to%20Paris",
-    "id": 30
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "My Year of Dicks",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=My%20Year%20of%20Dicks",
-    "imdb_url": "https://www.imdb.com/find/?q=My%20Year%20of%20Dicks",
-    "id": 31
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Navalny",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Navalny",
-    "imdb_url": "https://www.imdb.com/find/?q=Navalny",
-    "id": 32
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Night Ride",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Night%20Ride",
-    "imdb_url": "https://www.imdb.com/find/?q=Night%20Ride",
-    "id": 33
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Puss in Boots: The Last Wish",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Puss%20in%20Boots%3A%20The%20Last%20Wish",
-    "imdb_url": "https://www.imdb.com/find/?q=Puss%20in%20Boots%3A%20The%20Last%20Wish",
-    "id": 34
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "RRR",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=RRR",
-    "imdb_url": "https://www.imdb.com/find/?q=RRR",
-    "id": 35
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Stranger at the Gate",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Stranger%20at%20the%20Gate",
-    "imdb_url": "https://www.imdb.com/find/?q=Stranger%20at%20the%20Gate",
-    "id": 36
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "T?r",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 6,
-    "nominated_categories": "Best Picture; Directing; Actress in a Leading Role; Writing (Original Screenplay); Film Editing; Cinematography",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=T%3Fr",
-    "imdb_url": "https://www.imdb.com/find/?q=T%3Fr",
-    "id": 37
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Tell It like a Woman",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Tell%20It%20like%20a%20Woman",
-    "imdb_url": "https://www.imdb.com/find/?q=Tell%20It%20like%20a%20Woman",
-    "id": 38
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Banshees of Inisherin",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 8,
-    "nominated_categories": "Best Picture; Directing; Actor in a Leading Role; Actor in a Supporting Role; Actress in a Supporting Role; Writing (Original Screenplay); Film Editing; Music (Original Score)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Banshees%20of%20Inisherin",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Banshees%20of%20Inisherin",
-    "id": 39
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Batman",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Makeup and Hairstyling; Sound; Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Batman",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Batman",
-    "id": 40
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Boy, the Mole, the Fox and the Horse",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Boy%2C%20the%20Mole%2C%20the%20Fox%20and%20the%20Horse",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Boy%2C%20the%20Mole%2C%20the%20Fox%20and%20the%20Horse",
-    "id": 41
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Elephant Whisperers",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Elephant%20Whisperers",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Elephant%20Whisperers",
-    "id": 42
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Fabelmans",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 7,
-    "nominated_categories": "Best Picture; Directing; Actor in a Supporting Role; Actress in a Leading Role; Writing (Original Screenplay); Production Design; Music (Original Score)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Fabelmans",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Fabelmans",
-    "id": 43
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Flying Sailor",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Flying%20Sailor",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Flying%20Sailor",
-    "id": 44
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Martha Mitchell Effect",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Martha%20Mitchell%20Effect",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Martha%20Mitchell%20Effect",
-    "id": 45
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Quiet Girl",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Ireland",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Quiet%20Girl",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Quiet%20Girl",
-    "id": 46
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Red Suitcase",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Red%20Suitcase",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Red%20Suitcase",
-    "id": 47
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Sea Beast",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Sea%20Beast",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Sea%20Beast",
-    "id": 48
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Whale",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Actor in a Leading Role; Actress in a Supporting Role; Makeup and Hairstyling",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Whale",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Whale",
-    "id": 49
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "To Leslie",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actress in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=To%20Leslie",
-    "imdb_url": "https://www.imdb.com/find/?q=To%20Leslie",
-    "id": 50
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Top Gun: Maverick",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 6,
-    "nominated_categories": "Best Picture; Film Editing; Sound; Visual Effects; Writing (Adapted Screenplay); Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Top%20Gun%3A%20Maverick",
-    "imdb_url": "https://www.imdb.com/find/?q=Top%20Gun%3A%20Maverick",
-    "id": 51
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Triangle of Sadness",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Best Picture; Directing; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Triangle%20of%20Sadness",
-    "imdb_url": "https://www.imdb.com/find/?q=Triangle%20of%20Sadness",
-    "id": 52
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Turning Red",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Turning%20Red",
-    "imdb_url": "https://www.imdb.com/find/?q=Turning%20Red",
-    "id": 53
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Women Talking",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Best Picture; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Women%20Talking",
-    "imdb_url": "https://www.imdb.com/find/?q=Women%20Talking",
-    "id": 54
-  }
-];
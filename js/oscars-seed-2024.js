@@ -1,1115 +0,0 @@
-export const OSCARS_SEED_2024 = [
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "20 Days in Mariupol",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=20%20Days%20in%20Mariupol",
-    "imdb_url": "https://www.imdb.com/find/?q=20%20Days%20in%20Mariupol",
-    "id": 1
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "American Fiction",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 5,
-    "nominated_categories": "Best Picture; Actor in a Leading Role; Actor in a Supporting Role; Music (Original Score); Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=American%20Fiction",
-    "imdb_url": "https://www.imdb.com/find/?q=American%20Fiction",
-    "id": 2
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "American Symphony",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=American%20Symphony",
-    "imdb_url": "https://www.imdb.com/find/?q=American%20Symphony",
-    "id": 3
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Anatomy of a Fall",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 5,
-    "nominated_categories": "Best Picture; Directing; Actress in a Leading Role; Film Editing; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Anatomy%20of%20a%20Fall",
-    "imdb_url": "https://www.imdb.com/find/?q=Anatomy%20of%20a%20Fall",
-    "id": 4
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Barbie",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 7,
-    "nominated_categories": "Best Picture; Actor in a Supporting Role; Actress in a Supporting Role; Costume Design; Production Design; Music (Original Song); Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Barbie",
-    "imdb_url": "https://www.imdb.com/find/?q=Barbie",
-    "id": 5
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Bobi Wine: The People's President",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Bobi%20Wine%3A%20The%20People%27s%20President",
-    "imdb_url": "https://www.imdb.com/find/?q=Bobi%20Wine%3A%20The%20People%27s%20President",
-    "id": 6
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "El Conde",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Cinematography",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=El%20Conde",
-    "imdb_url": "https://www.imdb.com/find/?q=El%20Conde",
-    "id": 7
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Elemental",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Elemental",
-    "imdb_url": "https://www.imdb.com/find/?q=Elemental",
-    "id": 8
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Flamin' Hot",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Flamin%27%20Hot",
-    "imdb_url": "https://www.imdb.com/find/?q=Flamin%27%20Hot",
-    "id": 9
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Four Daughters",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Four%20Daughters",
-    "imdb_url": "https://www.imdb.com/find/?q=Four%20Daughters",
-    "id": 10
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Godzilla Minus One",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Godzilla%20Minus%20One",
-    "imdb_url": "https://www.imdb.com/find/?q=Godzilla%20Minus%20One",
-    "id": 11
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Golda",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Makeup and Hairstyling",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Golda",
-    "imdb_url": "https://www.imdb.com/find/?q=Golda",
-    "id": 12
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Guardians of the Galaxy Vol. 3",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Guardians%20of%20the%20Galaxy%20Vol.%203",
-    "imdb_url": "https://www.imdb.com/find/?q=Guardians%20of%20the%20Galaxy%20Vol.%203",
-    "id": 13
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Indiana Jones and the Dial of Destiny",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Music (Original Score)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Indiana%20Jones%20and%20the%20Dial%20of%20Destiny",
-    "imdb_url": "https://www.imdb.com/find/?q=Indiana%20Jones%20and%20the%20Dial%20of%20Destiny",
-    "id": 14
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Invincible",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Invincible",
-    "imdb_url": "https://www.imdb.com/find/?q=Invincible",
-    "id": 15
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Io Capitano",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Italy",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Io%20Capitano",
-    "imdb_url": "https://www.imdb.com/find/?q=Io%20Capitano",
-    "id": 16
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Island in Between",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Island%20in%20Between",
-    "imdb_url": "https://www.imdb.com/find/?q=Island%20in%20Between",
-    "id": 17
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Killers of the Flower Moon",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 10,
-    "nominated_categories": "Best Picture; Directing; Actress in a Leading Role; Actor in a Supporting Role; Cinematography; Costume Design; Film Editing; Production Design; Music (Original Score); Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Killers%20of%20the%20Flower%20Moon",
-    "imdb_url": "https://www.imdb.com/find/?q=Killers%20of%20the%20Flower%20Moon",
-    "id": 18
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Knight of Fortune",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Knight%20of%20Fortune",
-    "imdb_url": "https://www.imdb.com/find/?q=Knight%20of%20Fortune",
-    "id": 19
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Letter to a Pig",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Letter%20to%20a%20Pig",
-    "imdb_url": "https://www.imdb.com/find/?q=Letter%20to%20a%20Pig",
-    "id": 20
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Maestro",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 7,
-    "nominated_categories": "Best Picture; Actor in a Leading Role; Actress in a Leading Role; Cinematography; Makeup and Hairstyling; Sound; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Maestro",
-    "imdb_url": "https://www.imdb.com/find/?q=Maestro",
-    "id": 21
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "May December",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=May%20December",
-    "imdb_url": "https://www.imdb.com/find/?q=May%20December",
-    "id": 22
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Mission: Impossible - Dead Reckoning Part One",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Sound; Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Mission%3A%20Impossible%20-%20Dead%20Reckoning%20Part%20One",
-    "imdb_url": "https://www.imdb.com/find/?q=Mission%3A%20Impossible%20-%20Dead%20Reckoning%20Part%20One",
-    "id": 23
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "N?i Nai & W?i P?",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=N%3Fi%20Nai%20%26%20W%3Fi%20P%3F",
-    "imdb_url": "https://www.imdb.com/find/?q=N%3Fi%20Nai%20%26%20W%3Fi%20P%3F",
-    "id": 24
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Napoleon",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Costume Design; Production Design; Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Napoleon",
-    "imdb_url": "https://www.imdb.com/find/?q=Napoleon",
-    "id": 25
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Nimona",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Nimona",
-    "imdb_url": "https://www.imdb.com/find/?q=Nimona",
-    "id": 26
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Ninety-Five Senses",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Ninety-Five%20Senses",
-    "imdb_url": "https://www.imdb.com/find/?q=Ninety-Five%20Senses",
-    "id": 27
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Nyad",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actress in a Leading Role; Actress in a Supporting Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Nyad",
-    "imdb_url": "https://www.imdb.com/find/?q=Nyad",
-    "id": 28
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Oppenheimer",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 13,
-    "nominated_categories": "Best Picture; Directing; Actor in a Leading Role; Actor in a Supporting Role; Actress in a Supporting Role; Cinematography; Costume Design; Film Editing; Makeup and Hairstyling; Music (Original Score); Production Design; Sound; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Oppenheimer",
-    "imdb_url": "https://www.imdb.com/find/?q=Oppenheimer",
-    "id": 29
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Our Uniform",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Our%20Uniform",
-    "imdb_url": "https://www.imdb.com/find/?q=Our%20Uniform",
-    "id": 30
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Pachyderme",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Pachyderme",
-    "imdb_url": "https://www.imdb.com/find/?q=Pachyderme",
-    "id": 31
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Past Lives",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Best Picture; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Past%20Lives",
-    "imdb_url": "https://www.imdb.com/find/?q=Past%20Lives",
-    "id": 32
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Perfect Days",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Japan",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Perfect%20Days",
-    "imdb_url": "https://www.imdb.com/find/?q=Perfect%20Days",
-    "id": 33
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Poor Things",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 11,
-    "nominated_categories": "Best Picture; Directing; Actress in a Leading Role; Actor in a Supporting Role; Cinematography; Costume Design; Film Editing; Makeup and Hairstyling; Production Design; Music (Original Score); Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Poor%20Things",
-    "imdb_url": "https://www.imdb.com/find/?q=Poor%20Things",
-    "id": 34
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Red, White and Blue",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Red%2C%20White%20and%20Blue",
-    "imdb_url": "https://www.imdb.com/find/?q=Red%2C%20White%20and%20Blue",
-    "id": 35
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Robot Dreams",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Robot%20Dreams",
-    "imdb_url": "https://www.imdb.com/find/?q=Robot%20Dreams",
-    "id": 36
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Rustin",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actor in a Leading Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Rustin",
-    "imdb_url": "https://www.imdb.com/find/?q=Rustin",
-    "id": 37
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Society of the Snow",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Spain",
-    "nominations_number": 2,
-    "nominated_categories": "International Feature Film; Makeup and Hairstyling",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Society%20of%20the%20Snow",
-    "imdb_url": "https://www.imdb.com/find/?q=Society%20of%20the%20Snow",
-    "id": 38
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Spider-Man: Across the Spider-Verse",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Spider-Man%3A%20Across%20the%20Spider-Verse",
-    "imdb_url": "https://www.imdb.com/find/?q=Spider-Man%3A%20Across%20the%20Spider-Verse",
-    "id": 39
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The ABCs of Book Banning",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20ABCs%20of%20Book%20Banning",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20ABCs%20of%20Book%20Banning",
-    "id": 40
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The After",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20After",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20After",
-    "id": 41
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Barber of Little Rock",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Barber%20of%20Little%20Rock",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Barber%20of%20Little%20Rock",
-    "id": 42
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Boy and the Heron",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Boy%20and%20the%20Heron",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Boy%20and%20the%20Heron",
-    "id": 43
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Color Purple",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Actress in a Supporting Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Color%20Purple",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Color%20Purple",
-    "id": 44
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Creator",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Sound; Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Creator",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Creator",
-    "id": 45
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Eternal Memory",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Eternal%20Memory",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Eternal%20Memory",
-    "id": 46
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Holdovers",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 5,
-    "nominated_categories": "Best Picture; Actor in a Leading Role; Actress in a Supporting Role; Film Editing; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Holdovers",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Holdovers",
-    "id": 47
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Last Repair Shop",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Last%20Repair%20Shop",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Last%20Repair%20Shop",
-    "id": 48
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Teachers' Lounge",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Germany",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Teachers%27%20Lounge",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Teachers%27%20Lounge",
-    "id": 49
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Wonderful Story of Henry Sugar",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Wonderful%20Story%20of%20Henry%20Sugar",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Wonderful%20Story%20of%20Henry%20Sugar",
-    "id": 50
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Zone of Interest",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "United Kingdom",
-    "nominations_number": 5,
-    "nominated_categories": "Best Picture; Directing; International Feature Film; Sound; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Zone%20of%20Interest",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Zone%20of%20Interest",
-    "id": 51
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "To Kill a Tiger",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=To%20Kill%20a%20Tiger",
-    "imdb_url": "https://www.imdb.com/find/?q=To%20Kill%20a%20Tiger",
-    "id": 52
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "WAR IS OVER! Inspired by the Music of John & Yoko",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=WAR%20IS%20OVER%21%20Inspired%20by%20the%20Music%20of%20John%20%26%20Yoko",
-    "imdb_url": "https://www.imdb.com/find/?q=WAR%20IS%20OVER%21%20Inspired%20by%20the%20Music%20of%20John%20%26%20Yoko",
-    "id": 53
-  }
-];
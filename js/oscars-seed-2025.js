@@ -1,1052 +0,0 @@
-export const OSCARS_SEED_2025 = [
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "A Complete Unknown",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 8,
-    "nominated_categories": "Best Picture; Directing; Actor in a Leading Role; Actor in a Supporting Role; Actress in a Supporting Role; Costume Design; Sound; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=A%20Complete%20Unknown",
-    "imdb_url": "https://www.imdb.com/find/?q=A%20Complete%20Unknown",
-    "id": 1
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "A Different Man",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Makeup and Hairstyling",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=A%20Different%20Man",
-    "imdb_url": "https://www.imdb.com/find/?q=A%20Different%20Man",
-    "id": 2
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "A Lien",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=A%20Lien",
-    "imdb_url": "https://www.imdb.com/find/?q=A%20Lien",
-    "id": 3
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "A Real Pain",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actor in a Supporting Role; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=A%20Real%20Pain",
-    "imdb_url": "https://www.imdb.com/find/?q=A%20Real%20Pain",
-    "id": 4
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Alien: Romulus",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Alien%3A%20Romulus",
-    "imdb_url": "https://www.imdb.com/find/?q=Alien%3A%20Romulus",
-    "id": 5
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Anora",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 6,
-    "nominated_categories": "Best Picture; Directing; Actress in a Leading Role; Actor in a Supporting Role; Film Editing; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Anora",
-    "imdb_url": "https://www.imdb.com/find/?q=Anora",
-    "id": 6
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Anuja",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Anuja",
-    "imdb_url": "https://www.imdb.com/find/?q=Anuja",
-    "id": 7
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Beautiful Men",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Beautiful%20Men",
-    "imdb_url": "https://www.imdb.com/find/?q=Beautiful%20Men",
-    "id": 8
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Better Man",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Better%20Man",
-    "imdb_url": "https://www.imdb.com/find/?q=Better%20Man",
-    "id": 9
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Black Box Diaries",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Black%20Box%20Diaries",
-    "imdb_url": "https://www.imdb.com/find/?q=Black%20Box%20Diaries",
-    "id": 10
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Conclave",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 8,
-    "nominated_categories": "Best Picture; Actor in a Leading Role; Actress in a Supporting Role; Costume Design; Film Editing; Music (Original Score); Production Design; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Conclave",
-    "imdb_url": "https://www.imdb.com/find/?q=Conclave",
-    "id": 11
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Death by Numbers",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Death%20by%20Numbers",
-    "imdb_url": "https://www.imdb.com/find/?q=Death%20by%20Numbers",
-    "id": 12
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Dune: Part Two",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 5,
-    "nominated_categories": "Best Picture; Cinematography; Production Design; Sound; Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Dune%3A%20Part%20Two",
-    "imdb_url": "https://www.imdb.com/find/?q=Dune%3A%20Part%20Two",
-    "id": 13
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Elton John: Never Too Late",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Elton%20John%3A%20Never%20Too%20Late",
-    "imdb_url": "https://www.imdb.com/find/?q=Elton%20John%3A%20Never%20Too%20Late",
-    "id": 14
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Emilia P?rez",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "France",
-    "nominations_number": 12,
-    "nominated_categories": "Best Picture; Directing; Actress in a Leading Role; Actress in a Supporting Role; Cinematography; Film Editing; International Feature Film; Makeup and Hairstyling; Music (Original Score); Music (Original Song); Sound; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Emilia%20P%3Frez",
-    "imdb_url": "https://www.imdb.com/find/?q=Emilia%20P%3Frez",
-    "id": 15
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Flow",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Latvia",
-    "nominations_number": 2,
-    "nominated_categories": "Animated Feature Film; International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Flow",
-    "imdb_url": "https://www.imdb.com/find/?q=Flow",
-    "id": 16
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Gladiator II",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Costume Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Gladiator%20II",
-    "imdb_url": "https://www.imdb.com/find/?q=Gladiator%20II",
-    "id": 17
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "I Am Ready, Warden",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=I%20Am%20Ready%2C%20Warden",
-    "imdb_url": "https://www.imdb.com/find/?q=I%20Am%20Ready%2C%20Warden",
-    "id": 18
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "I'm Not a Robot",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=I%27m%20Not%20a%20Robot",
-    "imdb_url": "https://www.imdb.com/find/?q=I%27m%20Not%20a%20Robot",
-    "id": 19
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "I'm Still Here",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Brazil",
-    "nominations_number": 3,
-    "nominated_categories": "Best Picture; Actress in a Leading Role; International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=I%27m%20Still%20Here",
-    "imdb_url": "https://www.imdb.com/find/?q=I%27m%20Still%20Here",
-    "id": 20
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "In the Shadow of the Cypress",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=In%20the%20Shadow%20of%20the%20Cypress",
-    "imdb_url": "https://www.imdb.com/find/?q=In%20the%20Shadow%20of%20the%20Cypress",
-    "id": 21
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Incident",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Incident",
-    "imdb_url": "https://www.imdb.com/find/?q=Incident",
-    "id": 22
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Inside Out 2",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Inside%20Out%202",
-    "imdb_url": "https://www.imdb.com/find/?q=Inside%20Out%202",
-    "id": 23
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Instruments of a Beating Heart",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Instruments%20of%20a%20Beating%20Heart",
-    "imdb_url": "https://www.imdb.com/find/?q=Instruments%20of%20a%20Beating%20Heart",
-    "id": 24
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Kingdom of the Planet of the Apes",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Kingdom%20of%20the%20Planet%20of%20the%20Apes",
-    "imdb_url": "https://www.imdb.com/find/?q=Kingdom%20of%20the%20Planet%20of%20the%20Apes",
-    "id": 25
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Magic Candies",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Magic%20Candies",
-    "imdb_url": "https://www.imdb.com/find/?q=Magic%20Candies",
-    "id": 26
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Maria",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Cinematography",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Maria",
-    "imdb_url": "https://www.imdb.com/find/?q=Maria",
-    "id": 27
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Memoir of a Snail",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Memoir%20of%20a%20Snail",
-    "imdb_url": "https://www.imdb.com/find/?q=Memoir%20of%20a%20Snail",
-    "id": 28
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Nickel Boys",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Best Picture; Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Nickel%20Boys",
-    "imdb_url": "https://www.imdb.com/find/?q=Nickel%20Boys",
-    "id": 29
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "No Other Land",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=No%20Other%20Land",
-    "imdb_url": "https://www.imdb.com/find/?q=No%20Other%20Land",
-    "id": 30
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Nosferatu",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 4,
-    "nominated_categories": "Cinematography; Costume Design; Makeup and Hairstyling; Production Design",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Nosferatu",
-    "imdb_url": "https://www.imdb.com/find/?q=Nosferatu",
-    "id": 31
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Porcelain War",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Porcelain%20War",
-    "imdb_url": "https://www.imdb.com/find/?q=Porcelain%20War",
-    "id": 32
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "September 5",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=September%205",
-    "imdb_url": "https://www.imdb.com/find/?q=September%205",
-    "id": 33
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Sing Sing",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Actor in a Leading Role; Music (Original Song); Writing (Adapted Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Sing%20Sing",
-    "imdb_url": "https://www.imdb.com/find/?q=Sing%20Sing",
-    "id": 34
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Soundtrack to a Coup d'Etat",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Soundtrack%20to%20a%20Coup%20d%27Etat",
-    "imdb_url": "https://www.imdb.com/find/?q=Soundtrack%20to%20a%20Coup%20d%27Etat",
-    "id": 35
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Sugarcane",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Sugarcane",
-    "imdb_url": "https://www.imdb.com/find/?q=Sugarcane",
-    "id": 36
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Apprentice",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 2,
-    "nominated_categories": "Actor in a Leading Role; Actor in a Supporting Role",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Apprentice",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Apprentice",
-    "id": 37
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Brutalist",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 10,
-    "nominated_categories": "Best Picture; Directing; Actor in a Leading Role; Actor in a Supporting Role; Actress in a Supporting Role; Cinematography; Film Editing; Music (Original Score); Production Design; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Brutalist",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Brutalist",
-    "id": 38
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Girl with the Needle",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Denmark",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Girl%20with%20the%20Needle",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Girl%20with%20the%20Needle",
-    "id": 39
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Last Ranger",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Last%20Ranger",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Last%20Ranger",
-    "id": 40
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Man Who Could Not Remain Silent",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Live Action Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Man%20Who%20Could%20Not%20Remain%20Silent",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Man%20Who%20Could%20Not%20Remain%20Silent",
-    "id": 41
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Only Girl in the Orchestra",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Documentary Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Only%20Girl%20in%20the%20Orchestra",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Only%20Girl%20in%20the%20Orchestra",
-    "id": 42
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Seed of the Sacred Fig",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": "Germany",
-    "nominations_number": 1,
-    "nominated_categories": "International Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Seed%20of%20the%20Sacred%20Fig",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Seed%20of%20the%20Sacred%20Fig",
-    "id": 43
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Six Triple Eight",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Music (Original Song)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Six%20Triple%20Eight",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Six%20Triple%20Eight",
-    "id": 44
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Substance",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 5,
-    "nominated_categories": "Best Picture; Directing; Actress in a Leading Role; Makeup and Hairstyling; Writing (Original Screenplay)",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Substance",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Substance",
-    "id": 45
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "The Wild Robot",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 3,
-    "nominated_categories": "Animated Feature Film; Music (Original Score); Sound",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=The%20Wild%20Robot",
-    "imdb_url": "https://www.imdb.com/find/?q=The%20Wild%20Robot",
-    "id": 46
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Wallace & Gromit: Vengeance Most Fowl",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Feature Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Wallace%20%26%20Gromit%3A%20Vengeance%20Most%20Fowl",
-    "imdb_url": "https://www.imdb.com/find/?q=Wallace%20%26%20Gromit%3A%20Vengeance%20Most%20Fowl",
-    "id": 47
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Wander to Wonder",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Wander%20to%20Wonder",
-    "imdb_url": "https://www.imdb.com/find/?q=Wander%20to%20Wonder",
-    "id": 48
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Wicked",
-    "type": "Feature",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 10,
-    "nominated_categories": "Best Picture; Actress in a Leading Role; Actress in a Supporting Role; Costume Design; Film Editing; Makeup and Hairstyling; Music (Original Score); Production Design; Sound; Visual Effects",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Wicked",
-    "imdb_url": "https://www.imdb.com/find/?q=Wicked",
-    "id": 49
-  },
-  {
-    "watched": false,
-    "watched_date": null,
-    "title": "Yuck!",
-    "type": "Short",
-    "runtime_helper": null,
-    "runtime_helper_2": null,
-    "runtime": null,
-    "rating_1_10": null,
-    "director_s": null,
-    "country": null,
-    "nominations_number": 1,
-    "nominated_categories": "Animated Short Film",
-    "wikipedia_link": "Wikipedia",
-    "imdb_link": "IMDb",
-    "where_to_watch": null,
-    "notes": null,
-    "wikipedia_url": "https://en.wikipedia.org/wiki/Special:Search?search=Yuck%21",
-    "imdb_url": "https://www.imdb.com/find/?q=Yuck%21",
-    "id": 50
-  }
-];
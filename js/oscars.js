@@ -4,7 +4,7 @@ import {
   fetchPosters,
   fetchOscarsDetails,
   fetchOscarsWinners,
-  fetchOscarsYears,
+  fetchOscarsStartup,
   fetchOscarsAll,
   getOscarsFootnote,
   getOscarsMode,
@@ -552,8 +552,10 @@ function syncTypeSelect() {
   }
 }
 
-async function refresh() {
-  if (OSCARS_YEAR === ALL_YEARS_VALUE) {
+async function refresh(preloaded = null) {
+  if (preloaded) {
+    data = preloaded;
+  } else if (OSCARS_YEAR === ALL_YEARS_VALUE) {
     data = await fetchOscarsAll(AVAILABLE_YEARS);
   } else {
     data = await fetchOscars(OSCARS_YEAR);
@@ -859,8 +861,18 @@ function renderRow(item) {
   const poster = document.createElement('div');
   poster.className = 'oscars-poster';
   if (item.poster_url) {
+    if (item.poster_color) poster.style.backgroundColor = item.poster_color;
+    if (item.poster_lqip) {
+      poster.style.backgroundImage = `url("${item.poster_lqip}")`;
+      poster.style.backgroundSize = 'cover';
+      poster.style.backgroundPosition = 'center';
+    }
     const img = document.createElement('img');
     img.src = item.poster_url;
+    if (item.poster_srcset) {
+      img.srcset = item.poster_srcset;
+      img.sizes = '(max-width: 1400px) 160px, 200px';
+    }
     img.alt = `${item.title || 'Poster'}`;
     img.loading = 'lazy';
     img.referrerPolicy = 'no-referrer';
@@ -1326,14 +1338,17 @@ function render() {
 
 async function init() {
   DATA_MODE = await resolveOscarsMode();
+  const urlYear = getYearFromUrl();
+  let initialRows = null;
   try {
-    AVAILABLE_YEARS = await fetchOscarsYears();
+    const startup = await fetchOscarsStartup(urlYear);
+    AVAILABLE_YEARS = startup.years;
+    initialRows = startup.rows;
   } catch (e) {
     console.error(e);
     AVAILABLE_YEARS = [];
   }
 
-  const urlYear = getYearFromUrl();
   OSCARS_YEAR = pickYear(urlYear, AVAILABLE_YEARS);
   renderYearSelect(AVAILABLE_YEARS, OSCARS_YEAR);
   setYearTitle(OSCARS_YEAR);
@@ -1345,7 +1360,7 @@ async function init() {
   setSourceBadge(DATA_MODE);
 
   try {
-    await refresh();
+    await refresh(initialRows);
     setFoot(getOscarsFootnote());
   } catch (e) {
     console.error(e);
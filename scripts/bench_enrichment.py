@@ -0,0 +1,170 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import server  # noqa: E402
+from fake_providers import provider_env, start_fake_server  # noqa: E402
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def synthetic_rows(size, years, dup_ratio):
+    rows = []
+    unique = max(1, int(size * (1 - dup_ratio)))
+    for i in range(size):
+        n = i if i < unique else i % unique
+        rows.append({
+            "title": f"Synthetic Film {n:06d}",
+            "type": "Feature",
+            "oscars_year": years[i % len(years)],
+            "watched": "FALSE",
+        })
+    return rows
+
+
+def prepare_sandbox(tmp, size, years, dup_ratio):
+    server.DB_PATH = tmp / "watchlist.sqlite"
+    server.LOG_PATH = tmp / "server.log"
+    server.OSCARS_DATA_DIR = tmp / "oscars"
+    server.POSTERS_DIR = tmp / "posters"
+    server.POSTER_MIRROR_DIR = server.POSTERS_DIR / "mirror"
+    server.POSTER_PROXY_DIR = tmp / "poster-cache"
+    server.OSCARS_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    server.POSTERS_DIR.mkdir(parents=True, exist_ok=True)
+    server.ensure_db()
+    conn = sqlite3.connect(server.DB_PATH)
+    server.insert_seed(conn, synthetic_rows(size, years, dup_ratio))
+    conn.close()
+
+
+def reset_provider_state():
+    server.TMDB_CONFIG.clear()
+    server.PROVIDER_CACHE.clear()
+    server.PROVIDER_LIMITS.clear()
+
+
+def run_jobs(job, job_limit, max_jobs):
+    durations = []
+    totals = {"attempted": 0, "updated": 0, "reused": 0, "missing": 0, "errors": 0}
+    for _ in range(max_jobs):
+        t0 = time.perf_counter()
+        result = job(limit=job_limit)
+        durations.append(time.perf_counter() - t0)
+        for key in totals:
+            totals[key] += int(result.get(key) or 0)
+        if not result.get("attempted") or not (result.get("updated") or result.get("reused")):
+            break
+    return durations, totals
+
+
+def count_rows(sql):
+    conn = sqlite3.connect(server.DB_PATH)
+    try:
+        return conn.execute(sql).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def bench_size(size, args, fake_state):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        prepare_sandbox(Path(tmpdir), size, args.years, args.dup_ratio)
+        out = {"rows": size, "films": count_rows("SELECT COUNT(DISTINCT film_key) FROM watchlist;")}
+        for name, job, done_sql in (
+            ("posters", server.update_posters,
+             "SELECT COUNT(1) FROM watchlist WHERE poster_url IS NOT NULL AND poster_url != '';"),
+            ("details", server.update_details,
+             "SELECT COUNT(1) FROM watchlist WHERE runtime IS NOT NULL AND country IS NOT NULL;"),
+        ):
+            reset_provider_state()
+            before = fake_state.snapshot().get("total", 0)
+            t0 = time.perf_counter()
+            durations, totals = run_jobs(job, args.job_limit, args.max_jobs)
+            elapsed = time.perf_counter() - t0
+            requests = fake_state.snapshot().get("total", 0) - before
+            enriched = count_rows(done_sql)
+            out[name] = {
+                "jobs": len(durations),
+                "enriched_rows": enriched,
+                "elapsed_s": round(elapsed, 3),
+                "rows_per_s": round(enriched / elapsed, 2) if elapsed else 0.0,
+                "requests": requests,
+                "requests_per_row": round(requests / enriched, 3) if enriched else None,
+                "job_p50_s": round(percentile(durations, 50), 4),
+                "job_p95_s": round(percentile(durations, 95), 4),
+                **totals,
+            }
+        return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark update_posters/update_details against fake providers")
+    parser.add_argument("--sizes", default="100,500,1000", help="Comma-separated watchlist sizes")
+    parser.add_argument("--years", default="2022,2023,2024,2025", help="Comma-separated oscars_year values to spread rows over")
+    parser.add_argument("--dup-ratio", type=float, default=0.1, help="Fraction of rows that repeat an earlier title")
+    parser.add_argument("--job-limit", type=int, default=25, help="limit passed to each enrichment job (UI default is 25-50)")
+    parser.add_argument("--max-jobs", type=int, default=10000, help="Safety cap on jobs per phase")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Fake provider latency")
+    parser.add_argument("--jitter-ms", type=float, default=10, help="Fake provider latency jitter")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of provider calls failing with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of provider calls answered with 429")
+    parser.add_argument("--miss-rate", type=float, default=0.05, help="Fraction of searches with no result")
+    parser.add_argument("--out", default=None, help="Write JSON results to this path")
+    parser.add_argument("--verbose", action="store_true", help="Keep server.py per-row logging")
+    args = parser.parse_args()
+    args.years = [int(y) for y in args.years.split(",") if y.strip()]
+
+    httpd, fake_state = start_fake_server(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        miss_rate=args.miss_rate,
+    )
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    os.environ.update(provider_env(base))
+    os.environ["TMDB_API_KEY"] = "bench"
+    os.environ["OMDB_API_KEY"] = "bench"
+    os.environ.pop("DISABLE_TMDB", None)
+    if not args.verbose:
+        server.log_line = lambda *a, **k: None
+
+    results = {
+        "config": {k: v for k, v in vars(args).items() if k not in {"out", "verbose"}},
+        "python": sys.version.split()[0],
+        "sizes": [],
+    }
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        entry = bench_size(size, args, fake_state)
+        results["sizes"].append(entry)
+        for phase in ("posters", "details"):
+            r = entry[phase]
+            print(
+                f"{size:>7} rows | {phase:<7} | {r['rows_per_s']:>8} rows/s | "
+                f"{r['requests_per_row']} req/row | p95 job {r['job_p95_s']}s | jobs {r['jobs']}",
+                file=sys.stderr,
+            )
+    httpd.shutdown()
+
+    text = json.dumps(results, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+import argparse
+import http.client
+import json
+import multiprocessing
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import server  # noqa: E402
+
+TITLE_WORDS = [
+    "night", "river", "Amélie", "last", "summer", "ghost", "garden", "empire", "little", "silent",
+    "crown", "winter", "city", "dream", "stranger", "harbor", "golden", "wild", "letters", "echo",
+]
+DEFAULT_SCENARIOS = ["years", "rows_year", "rows_all", "rows_stream", "search", "update", "static_js", "static_poster", "mixed"]
+MIXED_WEIGHTS = [
+    ("years", 2),
+    ("rows_year", 6),
+    ("rows_all", 1),
+    ("update", 3),
+    ("static_js", 4),
+    ("static_poster", 4),
+]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def synthetic_rows(size, years):
+    rng = random.Random(size)
+    countries = ["USA", "France", "United Kingdom", "Germany", "Japan", "Poland"]
+    categories = ["Best Picture", "Directing", "Cinematography", "Film Editing", "Sound", "Visual Effects"]
+    rows = []
+    for i in range(size):
+        year = years[i % len(years)]
+        picked = rng.sample(categories, rng.randint(1, 3))
+        rows.append({
+            "title": f"{' '.join(rng.sample(TITLE_WORDS, rng.randint(1, 3))).title()} {i:06d}",
+            "type": "Feature",
+            "oscars_year": year,
+            "watched": "TRUE" if rng.random() < 0.3 else "FALSE",
+            "runtime": f"{rng.randint(80, 180)} min",
+            "country": ", ".join(rng.sample(countries, rng.randint(1, 2))),
+            "nominations_number": len(picked),
+            "nominated_categories": "; ".join(picked),
+            "won_categories": picked[0] if rng.random() < 0.2 else None,
+            "notes": "synthetic row" if rng.random() < 0.1 else None,
+        })
+    return rows
+
+
+def build_dataset(workdir, size, year_count, poster_count, poster_kb):
+    years = list(range(2026 - year_count + 1, 2027))
+    db_path = workdir / "watchlist.sqlite"
+    posters_dir = workdir / "posters"
+    data_dir = workdir / "oscars"
+    posters_dir.mkdir(parents=True, exist_ok=True)
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    server.DB_PATH = db_path
+    server.OSCARS_DATA_DIR = data_dir
+    server.POSTERS_DIR = posters_dir
+    server.LOG_PATH = workdir / "server.log"
+    server.ensure_db()
+    conn = sqlite3.connect(db_path)
+    server.insert_seed(conn, synthetic_rows(size, years))
+    conn.close()
+
+    rng = random.Random(poster_count)
+    names = []
+    for i in range(poster_count):
+        name = f"benchfilm{i:06d}.jpg"
+        (posters_dir / name).write_bytes(rng.randbytes(poster_kb * 1024))
+        names.append(name)
+    return {"db_path": db_path, "posters_dir": posters_dir, "data_dir": data_dir, "years": years, "posters": names}
+
+
+def serve_child(db_path, posters_dir, data_dir, log_path, verbose, workers, queue):
+    server.DB_PATH = Path(db_path)
+    server.POSTERS_DIR = Path(posters_dir)
+    server.POSTER_MIRROR_DIR = server.POSTERS_DIR / "mirror"
+    server.POSTER_PROXY_DIR = Path(log_path).parent / "poster-cache"
+    server.OSCARS_DATA_DIR = Path(data_dir)
+    server.LOG_PATH = Path(log_path)
+    if not verbose:
+        server.log_line = lambda *a, **k: None
+    server.run(host="127.0.0.1", port=0, workers=workers, on_ready=lambda srv: queue.put(srv.server_address[1]))
+
+
+def start_server(dataset, workdir, verbose, workers=1):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(
+        target=serve_child,
+        args=(
+            str(dataset["db_path"]),
+            str(dataset["posters_dir"]),
+            str(dataset["data_dir"]),
+            str(workdir / "server.log"),
+            verbose,
+            workers,
+            queue,
+        ),
+        daemon=True,
+    )
+    proc.start()
+    port = queue.get(timeout=120)
+    return proc, port
+
+
+def request_for(scenario, dataset, row_ids, rng):
+    if scenario == "years":
+        return "GET", "/api/oscars/years", None
+    if scenario == "rows_year":
+        return "GET", f"/api/oscars?year={rng.choice(dataset['years'])}", None
+    if scenario == "rows_all":
+        return "GET", "/api/oscars", None
+    if scenario == "rows_stream":
+        return "GET", "/api/oscars?stream=1", None
+    if scenario == "search":
+        words = rng.sample(TITLE_WORDS, rng.randint(1, 2))
+        q = " ".join(w[:rng.randint(2, len(w))] for w in words)
+        return "GET", f"/api/oscars/search?q={urllib.parse.quote(q)}&limit=20", None
+    if scenario == "update":
+        body = {"id": rng.choice(row_ids), "patch": {"watched": rng.random() < 0.5}}
+        return "POST", "/api/oscars/update", body
+    if scenario == "static_js":
+        return "GET", rng.choice(["/js/oscars.js", "/styles.css", "/js/oscars-api.js"]), None
+    if scenario == "static_poster":
+        if not dataset["posters"]:
+            return "GET", "/styles.css", None
+        return "GET", f"/posters/{rng.choice(dataset['posters'])}", None
+    raise ValueError(f"unknown scenario: {scenario}")
+
+
+def load_replay(path):
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(item, dict) or not str(item.get("path") or "").startswith("/"):
+                continue
+            entries.append((str(item.get("method") or "GET").upper(), item["path"], item.get("body"), item.get("headers") or {}))
+    return entries
+
+
+def do_request(port, method, path, body, headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        hdrs = {"Accept-Encoding": "gzip"}
+        hdrs.update(headers or {})
+        if payload is not None:
+            hdrs["Content-Type"] = "application/json"
+        conn.request(method, path, body=payload, headers=hdrs)
+        resp = conn.getresponse()
+        data = resp.read()
+        return resp.status, len(data)
+    finally:
+        conn.close()
+
+
+def drive(port, next_request, concurrency, duration, max_requests):
+    latencies = []
+    statuses = {}
+    bytes_total = [0]
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+    issued = [0]
+
+    def worker(seed):
+        rng = random.Random(seed)
+        while True:
+            with lock:
+                if time.perf_counter() >= stop_at or (max_requests and issued[0] >= max_requests):
+                    return
+                issued[0] += 1
+            method, path, body, headers = next_request(rng)
+            t0 = time.perf_counter()
+            try:
+                status, size = do_request(port, method, path, body, headers)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+                continue
+            elapsed = time.perf_counter() - t0
+            with lock:
+                latencies.append(elapsed)
+                statuses[status] = statuses.get(status, 0) + 1
+                bytes_total[0] += size
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+    ok = sum(v for k, v in statuses.items() if 200 <= k < 400)
+    return {
+        "requests": len(latencies),
+        "ok": ok,
+        "errors": errors[0] + len(latencies) - ok,
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "bytes_per_s": round(bytes_total[0] / wall) if wall else 0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p90": round(percentile(latencies, 90) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies) * 1000, 2) if latencies else 0.0,
+        },
+    }
+
+
+def scenario_picker(scenario, dataset, row_ids, replay):
+    if scenario == "replay":
+        return lambda rng: rng.choice(replay)
+    if scenario == "mixed":
+        names = [n for n, _ in MIXED_WEIGHTS]
+        weights = [w for _, w in MIXED_WEIGHTS]
+
+        def pick(rng):
+            name = rng.choices(names, weights=weights)[0]
+            return (*request_for(name, dataset, row_ids, rng), None)
+        return pick
+    return lambda rng: (*request_for(scenario, dataset, row_ids, rng), None)
+
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def compare(previous_path, results):
+    try:
+        previous = json.loads(Path(previous_path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"[WARN] cannot read {previous_path}: {exc}", file=sys.stderr)
+        return
+    old = {(r["rows"], r["scenario"], r["concurrency"]): r for r in previous.get("results", [])}
+    for r in results["results"]:
+        prev = old.get((r["rows"], r["scenario"], r["concurrency"]))
+        if not prev:
+            continue
+        rps_delta = (r["throughput_rps"] / prev["throughput_rps"] - 1) * 100 if prev["throughput_rps"] else 0.0
+        p95_delta = (r["latency_ms"]["p95"] / prev["latency_ms"]["p95"] - 1) * 100 if prev["latency_ms"]["p95"] else 0.0
+        print(
+            f"{r['rows']:>7} {r['scenario']:<14} c={r['concurrency']:<3} "
+            f"rps {rps_delta:+6.1f}%  p95 {p95_delta:+6.1f}%",
+            file=sys.stderr,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test server.py endpoints on synthetic data")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated watchlist sizes")
+    parser.add_argument("--years", type=int, default=40, help="Number of oscars_year values to spread rows across")
+    parser.add_argument("--scenarios", default=",".join(DEFAULT_SCENARIOS), help="Comma-separated: " + ", ".join(DEFAULT_SCENARIOS + ["replay"]))
+    parser.add_argument("--concurrency", default="1,8", help="Comma-separated client concurrency levels")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per scenario/concurrency")
+    parser.add_argument("--max-requests", type=int, default=0, help="Cap requests per scenario (0 = time bound only)")
+    parser.add_argument("--posters", type=int, default=200, help="Synthetic poster files")
+    parser.add_argument("--poster-kb", type=int, default=64, help="Size of each synthetic poster")
+    parser.add_argument("--replay", default=None, help="JSONL traffic trace: {method, path, body?, headers?} per line")
+    parser.add_argument("--out", default=None, help="Write JSON results here")
+    parser.add_argument("--compare", default=None, help="Previous results JSON to diff against")
+    parser.add_argument("--workers", type=int, default=1, help="server.py --workers (prefork processes)")
+    parser.add_argument("--verbose", action="store_true", help="Keep server.py request logging")
+    args = parser.parse_args()
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    replay = load_replay(args.replay) if args.replay else []
+    if args.replay and replay and "replay" not in scenarios:
+        scenarios.append("replay")
+    if "replay" in scenarios and not replay:
+        print("[WARN] no usable replay entries; skipping replay scenario", file=sys.stderr)
+        scenarios.remove("replay")
+    concurrency_levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+
+    results = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "git": git_revision(),
+        "python": sys.version.split()[0],
+        "config": {k: v for k, v in vars(args).items() if k not in {"out", "compare", "verbose"}},
+        "results": [],
+    }
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            t0 = time.perf_counter()
+            dataset = build_dataset(workdir, size, args.years, args.posters, args.poster_kb)
+            conn = sqlite3.connect(dataset["db_path"])
+            row_ids = [r[0] for r in conn.execute("SELECT rowid FROM watchlist;")]
+            conn.close()
+            print(f"dataset {size} rows ready in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+            proc, port = start_server(dataset, workdir, args.verbose, args.workers)
+            try:
+                for scenario in scenarios:
+                    picker = scenario_picker(scenario, dataset, row_ids, replay)
+                    for concurrency in concurrency_levels:
+                        stats = drive(port, picker, concurrency, args.duration, args.max_requests)
+                        entry = {"rows": size, "scenario": scenario, "concurrency": concurrency, **stats}
+                        results["results"].append(entry)
+                        print(
+                            f"{size:>7} {scenario:<14} c={concurrency:<3} {stats['throughput_rps']:>9} req/s "
+                            f"p50 {stats['latency_ms']['p50']}ms p95 {stats['latency_ms']['p95']}ms "
+                            f"p99 {stats['latency_ms']['p99']}ms errors {stats['errors']}",
+                            file=sys.stderr,
+                        )
+            finally:
+                proc.terminate()
+                proc.join(timeout=10)
+
+    text = json.dumps(results, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    if args.compare:
+        compare(args.compare, results)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Stand-in for TMDB / OMDb / Wikipedia / Wikidata used by server.py enrichment.
+# Point server.py at it with e.g.
+#   TMDB_API_BASE=http://127.0.0.1:8765/tmdb/3
+#   OMDB_API_BASE=http://127.0.0.1:8765/omdb
+#   WIKIPEDIA_API_BASE=http://127.0.0.1:8765/wikipedia
+#   WIKIDATA_API_BASE=http://127.0.0.1:8765/wikidata
+
+COUNTRIES = ["United States", "France", "United Kingdom", "Germany", "Japan", "Poland", "Italy", "Spain"]
+COUNTRY_QIDS = {f"Q{900 + i}": name for i, name in enumerate(COUNTRIES)}
+# 1x1 transparent GIF; enough for the download/mirror code paths.
+TINY_GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+
+def stable_int(value, mod):
+    return int(hashlib.sha1(str(value).encode("utf-8")).hexdigest()[:12], 16) % mod
+
+
+def film_id(title):
+    return 10000 + stable_int((title or "").strip().lower(), 900000)
+
+
+def film_runtime(key):
+    return 80 + stable_int(f"runtime:{key}", 100)
+
+
+def film_countries(key):
+    first = stable_int(f"country:{key}", len(COUNTRIES))
+    out = [COUNTRIES[first]]
+    if stable_int(f"coprod:{key}", 3) == 0:
+        out.append(COUNTRIES[(first + 1) % len(COUNTRIES)])
+    return out
+
+
+def qid_for(title):
+    return f"Q{100000 + stable_int((title or '').strip().lower(), 900000)}"
+
+
+class FakeState:
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, throttle_rate=0.0, miss_rate=0.0,
+                 retry_after=1, recordings=None, seed=1):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.miss_rate = miss_rate
+        self.retry_after = retry_after
+        self.recordings = recordings or {}
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {}
+
+    def count(self, provider):
+        with self.lock:
+            self.counts[provider] = self.counts.get(provider, 0) + 1
+            self.counts["total"] = self.counts.get("total", 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts)
+
+    def roll(self):
+        with self.lock:
+            return self.random.random()
+
+
+def recording_key(path, query):
+    params = {k: v for k, v in parse_qs(query).items() if k not in {"api_key", "apikey"}}
+    return f"{path}?{json.dumps(params, sort_keys=True)}" if params else path
+
+
+def tmdb_response(base, path, params, state):
+    if path == "/configuration":
+        return {"images": {"secure_base_url": f"{base}/img/", "poster_sizes": ["w92", "w185", "original"]}}
+    if path == "/search/movie":
+        query = (params.get("query") or [""])[0]
+        if not query or state.roll() < state.miss_rate:
+            return {"results": []}
+        fid = film_id(query)
+        return {"results": [{"id": fid, "title": query, "poster_path": f"/tmdb-{fid}.gif"}]}
+    m = re.fullmatch(r"/movie/(\d+)", path)
+    if m:
+        fid = int(m.group(1))
+        return {
+            "id": fid,
+            "runtime": film_runtime(fid),
+            "production_countries": [{"name": c} for c in film_countries(fid)],
+            "external_ids": {"imdb_id": f"tt{fid:07d}"},
+        }
+    return None
+
+
+def omdb_response(base, params, state):
+    title = (params.get("t") or params.get("s") or [""])[0]
+    imdb_id = (params.get("i") or [""])[0]
+    key = imdb_id or title
+    if not key or state.roll() < state.miss_rate:
+        return {"Response": "False", "Error": "Movie not found!"}
+    record = {
+        "Title": title or key,
+        "imdbID": imdb_id or f"tt{film_id(key):07d}",
+        "Runtime": f"{film_runtime(key)} min",
+        "Country": ", ".join(film_countries(key)),
+        "Poster": f"{base}/img/omdb-{stable_int(key, 10 ** 9)}.gif",
+        "Response": "True",
+    }
+    if "s" in params:
+        return {"Search": [record], "Response": "True"}
+    return record
+
+
+def wikipedia_response(base, params, state):
+    if (params.get("list") or [""])[0] == "search":
+        term = (params.get("srsearch") or [""])[0]
+        if not term or state.roll() < state.miss_rate:
+            return {"query": {"search": []}}
+        return {"query": {"search": [{"title": term}]}}
+    title = (params.get("titles") or [""])[0]
+    prop = (params.get("prop") or [""])[0]
+    page = {"pageid": stable_int(title, 10 ** 8), "title": title}
+    if prop == "pageimages":
+        page["thumbnail"] = {"source": f"{base}/img/wiki-{page['pageid']}.gif"}
+    elif prop == "pageprops":
+        page["pageprops"] = {"wikibase_item": qid_for(title)}
+    return {"query": {"pages": {str(page["pageid"]): page}}}
+
+
+def wikidata_response(path, params):
+    m = re.fullmatch(r"/wiki/Special:EntityData/(Q\d+)\.json", path)
+    if m:
+        qid = m.group(1)
+        countries = film_countries(qid)
+        qids = [q for q, name in COUNTRY_QIDS.items() if name in countries]
+        return {"entities": {qid: {"claims": {
+            "P2047": [{"mainsnak": {"datavalue": {"value": {
+                "amount": f"+{film_runtime(qid)}",
+                "unit": "http://www.wikidata.org/entity/Q7727",
+            }}}}],
+            "P495": [{"mainsnak": {"datavalue": {"value": {"id": q}}}} for q in qids],
+        }}}}
+    if (params.get("action") or [""])[0] == "wbgetentities":
+        ids = (params.get("ids") or [""])[0].split("|")
+        return {"entities": {
+            q: {"labels": {"en": {"value": COUNTRY_QIDS[q]}}} for q in ids if q in COUNTRY_QIDS
+        }}
+    return None
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type="application/json; charset=utf-8", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        state = self.state
+        parts = urlsplit(self.path)
+        segments = parts.path.split("/", 2)
+        provider = segments[1] if len(segments) > 1 else ""
+        rest = "/" + (segments[2] if len(segments) > 2 else "")
+        params = parse_qs(parts.query)
+        base = f"http://{self.headers.get('Host') or '%s:%s' % self.server.server_address[:2]}"
+        state.count(provider)
+
+        delay = state.latency_ms + (state.roll() * state.jitter_ms if state.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000.0)
+
+        if provider == "img":
+            self.send_body(200, TINY_GIF, content_type="image/gif")
+            return
+        if state.roll() < state.throttle_rate:
+            self.send_body(429, b"{}", headers={"Retry-After": str(state.retry_after)})
+            return
+        if state.roll() < state.error_rate:
+            self.send_body(500, b"{}")
+            return
+
+        key = recording_key(parts.path, parts.query)
+        if key in state.recordings:
+            payload = state.recordings[key]
+        elif provider == "tmdb":
+            payload = tmdb_response(f"{base}", rest[len("/3"):] if rest.startswith("/3") else rest, params, state)
+        elif provider == "omdb":
+            payload = omdb_response(base, params, state)
+        elif provider == "wikipedia":
+            payload = wikipedia_response(base, params, state)
+        elif provider == "wikidata":
+            payload = wikidata_response(rest, params)
+        else:
+            payload = None
+        if payload is None:
+            self.send_body(404, b'{"error": "not found"}')
+            return
+        self.send_body(200, json.dumps(payload).encode("utf-8"))
+
+
+def provider_env(base):
+    return {
+        "TMDB_API_BASE": f"{base}/tmdb/3",
+        "OMDB_API_BASE": f"{base}/omdb",
+        "WIKIPEDIA_API_BASE": f"{base}/wikipedia",
+        "WIKIDATA_API_BASE": f"{base}/wikidata",
+    }
+
+
+def start_fake_server(host="127.0.0.1", port=0, **options):
+    state = FakeState(**options)
+    handler = type("BoundFakeHandler", (FakeHandler,), {"state": state})
+    httpd = ThreadingHTTPServer((host, port), handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, state
+
+
+def load_recordings(path):
+    if not path:
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data if isinstance(data, dict) else {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve fake TMDB/OMDb/Wikipedia/Wikidata responses for server.py")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8765, help="Port (0 = ephemeral)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Base latency added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra latency (uniform 0..N ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of API calls answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of API calls answered with 429")
+    parser.add_argument("--miss-rate", type=float, default=0.0, help="Fraction of searches returning no result")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429")
+    parser.add_argument("--recordings", default=None, help="JSON file mapping request keys to recorded bodies")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for injected faults")
+    args = parser.parse_args()
+
+    httpd, state = start_fake_server(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        miss_rate=args.miss_rate,
+        retry_after=args.retry_after,
+        recordings=load_recordings(args.recordings),
+        seed=args.seed,
+    )
+    base = f"http://{args.host}:{httpd.server_address[1]}"
+    print(f"Fake providers running: {base}")
+    for key, value in provider_env(base).items():
+        print(f"  {key}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(json.dumps(state.snapshot()), file=sys.stderr)
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
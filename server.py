@@ -1,35 +1,239 @@
+import argparse
+import base64
+import cProfile
 import csv
+import email.utils
+import gzip
+import hashlib
+import html
+import http.client
+import io
 import json
+import mmap
 import os
+import pstats
+import queue
 import re
+import signal
+import socket
 import sqlite3
+import ssl
+import threading
 import time
+import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
+from collections import OrderedDict
 from datetime import date, datetime
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from types import SimpleNamespace
 from urllib.parse import urlparse
 
+try:
+    import brotli  # optional, enables .br sidecars
+except ImportError:
+    brotli = None
+
 ROOT = Path(__file__).resolve().parent
 DB_PATH = ROOT / "watchlist.sqlite"
-SEED_JS = ROOT / "js" / "oscars-seed.js"
-SEED_JS_2025 = ROOT / "js" / "oscars-seed-2025.js"
-SEED_JS_2024 = ROOT / "js" / "oscars-seed-2024.js"
-SEED_JS_2023 = ROOT / "js" / "oscars-seed-2023.js"
-SEED_JS_2022 = ROOT / "js" / "oscars-seed-2022.js"
-SEED_JS_1929 = ROOT / "js" / "oscars-seed-1929.js"
 LOG_PATH = ROOT / "server.log"
 LAST_UPDATE = {"empty": True}
 ENV_FILES = [ROOT / ".env.development", ROOT / ".env.production"]
 TMDB_CONFIG = {}
 WIKI_UA = "cleaning-dashboard/1.0"
+HTTP_POOL = {}
+HTTP_POOL_LOCK = threading.Lock()
+HTTP_POOL_IDLE_TIMEOUT = 30
+HTTP_POOL_MAX_IDLE_PER_HOST = 4
+HTTP_POOL_STATS = {
+    "requests": 0,
+    "reused": 0,
+    "connects": 0,
+    "reconnects": 0,
+    "gzip": 0,
+    "cache_hits": 0,
+    "coalesced": 0,
+}
+HTTP_MAX_REDIRECTS = 5
+HTTP_SSL_CONTEXT = ssl.create_default_context()
+PROVIDER_CACHE = OrderedDict()
+PROVIDER_CACHE_TTL = 10 * 60
+PROVIDER_CACHE_MAX = 2048
+SINGLE_FLIGHT = {}
+SINGLE_FLIGHT_LOCK = threading.Lock()
+PROVIDER_BASES = {
+    "tmdb": "https://api.themoviedb.org/3",
+    "omdb": "https://www.omdbapi.com",
+    "wikipedia": "https://en.wikipedia.org",
+    "wikidata": "https://www.wikidata.org",
+}
+PROVIDER_LIMIT_DEFAULTS = {
+    "tmdb": {"rate": 20.0, "max_rate": 40.0, "concurrency": 4.0, "max_concurrency": 8.0},
+    "omdb": {"rate": 5.0, "max_rate": 10.0, "concurrency": 2.0, "max_concurrency": 4.0},
+    "wikipedia": {"rate": 10.0, "max_rate": 20.0, "concurrency": 2.0, "max_concurrency": 4.0},
+    "wikidata": {"rate": 5.0, "max_rate": 10.0, "concurrency": 2.0, "max_concurrency": 4.0},
+}
+PROVIDER_LIMITS = {}
+PROVIDER_LIMIT_COND = threading.Condition()
+PROVIDER_MIN_RATE = 0.5
+PROVIDER_RATE_STEP = 0.5
+PROVIDER_MAX_WAIT = 30
+PROVIDER_BREAKER_THRESHOLD = 5
+PROVIDER_BREAKER_COOLDOWN = 60
 POSTERS_DIR = ROOT / "public" / "posters"
 POSTER_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+POSTER_MIRROR_DIR = POSTERS_DIR / "mirror"
+POSTER_VARIANTS = [("thumb", 200), ("card", 400)]
+POSTER_MAX_BYTES = 10 * 1024 * 1024
+POSTER_LQIP_WIDTH = 16
+POSTER_PLACEHOLDERS = {}
+POSTER_CONTENT_EXTS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
 OSCARS_DATA_DIR = ROOT / "data" / "oscars"
+POSTER_PROXY_DIR = ROOT / "data" / "poster-cache"
+POSTER_PROXY_SOURCES = {"tmdb", "omdb", "wikipedia"}
+POSTER_PROXY_MAX_BYTES = int(os.environ.get("POSTER_PROXY_MAX_BYTES") or 256 * 1024 * 1024)
+POSTER_PROXY_URLS = {}
+POSTER_PROXY_INFLIGHT = {}
+POSTER_PROXY_LOADED = {}
+POSTER_PROXY_LOCK = threading.Lock()
 WINNERS_CSV_URL = "https://huggingface.co/datasets/ceyyyh/oscar_award_winners/resolve/main/oscars_1929_2025.csv"
 WINNERS_CACHE = OSCARS_DATA_DIR / "oscars_1929_2025.csv"
 WINNERS_CACHE_TTL = 60 * 60 * 24 * 30
+WINNERS_INDEX = {}
+READ_SNAPSHOT = threading.local()
+BATCH_MAX_REQUESTS = 16
+STATIC_ETAGS = {}
+STATIC_ETAGS_LOCK = threading.Lock()
+STATIC_CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+STATIC_CACHE_POSTERS = "public, max-age=86400"
+STATIC_CACHE_DEFAULT = "no-cache"
+# Content hashes: hex digests ("app.3f2a9c1d.js") or Rollup's 8-character base64url tokens ("index-B6hUSIXg.js").
+FINGERPRINT_HEX_RE = re.compile(r"[.-][0-9a-f]{8,}\.[A-Za-z0-9]+$")
+FINGERPRINT_TOKEN_RE = re.compile(r"-([A-Za-z0-9_-]{8})\.[A-Za-z0-9]+$")
+COMPRESSIBLE_EXTS = {".js", ".mjs", ".css", ".html", ".json", ".svg", ".txt", ".csv", ".map", ".webmanifest", ".xml"}
+COMPRESS_MIN_BYTES = 1024
+PRECOMPRESS_SKIP_DIRS = {".git", "node_modules", "dist", "reports", "legacy", "__pycache__", "seed-bundles"}
+PRECOMPRESS_DIRS = ("js", "css")
+PRECOMPRESS_ROOT_EXTS = {".html", ".css", ".js"}
+COMPRESSED_CACHE = OrderedDict()
+COMPRESSED_CACHE_LOCK = threading.Lock()
+COMPRESSED_CACHE_MAX_BYTES = 16 * 1024 * 1024
+REQUEST_TIMING = threading.local()
+PROFILE_DIR = ROOT / "data" / "profiles"
+PROFILE_KEEP = 20
+PROFILE_LOCK = threading.Lock()
+SLOW_QUERY_MS_DEFAULT = 100
+RESPONSE_CACHE = {}
+RESPONSE_CACHE_LOCK = threading.Lock()
+RESPONSE_BUILD_LOCKS = {}
+RESPONSE_GENERATION = 0
+RESPONSE_CACHE_MAX_ROWS = int(os.environ.get("RESPONSE_CACHE_MAX_ROWS") or 20000)
+STREAM_BATCH_ROWS = 500
+STREAM_CHUNK_BYTES = 64 * 1024
+NDJSON_TYPE = "application/x-ndjson"
+SEED_YEARS_CACHE = {}
+DATA_VERSION = {}
+DATA_VERSION_LOCK = threading.Lock()
+WORKER_RESTART_WINDOW = 10
+WORKER_RESTART_BURST = 5
+YEARS_RESPONSE = {}
+SEED_WATCH_INTERVAL = float(os.environ.get("SEED_WATCH_INTERVAL") or 2)
+SEED_STAMPS = {}
+SEED_RELOADS = {}
+SEED_BUNDLE_DIR = ROOT / "data" / "seed-bundles"
+SEED_BUNDLE_RE = re.compile(r"^(\d{4})-([0-9a-f]{16})\.json$")
+RUNTIME_HOURS_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*h", re.IGNORECASE)
+RUNTIME_MINUTES_RE = re.compile(r"(\d+)\s*m", re.IGNORECASE)
+RUNTIME_NUMBER_RE = re.compile(r"\d+")
+SEED_BUNDLES = {}
+SEED_BUNDLES_LOCK = threading.Lock()
+WRITE_BATCH_WINDOW = float(os.environ.get("WRITE_BATCH_MS") or 5) / 1000.0
+WRITE_BATCH_MAX = int(os.environ.get("WRITE_BATCH_MAX") or 64)
+WRITE_TIMEOUT_S = float(os.environ.get("WRITE_TIMEOUT_S") or 30)
+WRITE_POLL_S = 1.0
+WRITE_STATE = {}
+WRITE_STATE_LOCK = threading.Lock()
+WRITE_STATS = {"ops": 0, "commits": 0, "errors": 0, "max_batch": 0}
+ADMISSION_LANES = {
+    "interactive": {
+        "limit": int(os.environ.get("ADMIT_INTERACTIVE") or 32),
+        "queue": int(os.environ.get("ADMIT_INTERACTIVE_QUEUE") or 64),
+        "wait": 2.0,
+        "retry_after": 1,
+    },
+    "background": {
+        "limit": int(os.environ.get("ADMIT_BACKGROUND") or 1),
+        "queue": int(os.environ.get("ADMIT_BACKGROUND_QUEUE") or 2),
+        "wait": 1.0,
+        "retry_after": 5,
+    },
+}
+ADMISSION_EXEMPT = {"/api/oscars/debug"}
+BACKGROUND_PATHS = {
+    "/api/oscars/posters",
+    "/api/oscars/details",
+    "/api/oscars/mirror",
+    "/api/oscars/winners",
+    "/api/oscars/reset",
+}
+ADMISSION_CV = threading.Condition()
+ADMISSION_STATS = {
+    lane: {"in_flight": 0, "queued": 0, "admitted": 0, "rejected": 0, "wait_s": 0.0, "wait_max_s": 0.0}
+    for lane in ADMISSION_LANES
+}
+BACKGROUND_YIELD_EVERY = 10
+BACKGROUND_YIELD_MAX = 2.0
+BACKGROUND_YIELDS = {"yields": 0, "waited": 0, "wait_s": 0.0}
+YEAR_SUMMARY_ADD = (
+    "INSERT INTO year_summary (oscars_year, rows, watched, runtime_minutes) "
+    "SELECT NEW.oscars_year, 1, CASE WHEN NEW.watched = 1 THEN 1 ELSE 0 END, "
+    "COALESCE(NEW.runtime_minutes, 0) WHERE NEW.oscars_year IS NOT NULL "
+    "ON CONFLICT(oscars_year) DO UPDATE SET rows = rows + 1, watched = watched + excluded.watched, "
+    "runtime_minutes = runtime_minutes + excluded.runtime_minutes;"
+)
+YEAR_SUMMARY_REMOVE = (
+    "UPDATE year_summary SET rows = rows - 1, "
+    "watched = watched - CASE WHEN OLD.watched = 1 THEN 1 ELSE 0 END, "
+    "runtime_minutes = runtime_minutes - COALESCE(OLD.runtime_minutes, 0) "
+    "WHERE oscars_year = OLD.oscars_year;"
+)
+SEARCH_FTS_COLUMNS = ("title", "notes", "where_to_watch", "country")
+SEARCH_FTS_VALUES = (
+    "NEW.rowid, replace(COALESCE(NEW.title, ''), '&', ' and '), NEW.notes, NEW.where_to_watch, NEW.country"
+)
+SEARCH_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS trg_search_insert AFTER INSERT ON watchlist BEGIN "
+    f"INSERT INTO watchlist_fts (rowid, {', '.join(SEARCH_FTS_COLUMNS)}) VALUES ({SEARCH_FTS_VALUES}); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_search_delete AFTER DELETE ON watchlist BEGIN "
+    "DELETE FROM watchlist_fts WHERE rowid = OLD.rowid; END;",
+    f"CREATE TRIGGER IF NOT EXISTS trg_search_update AFTER UPDATE OF {', '.join(SEARCH_FTS_COLUMNS)} ON watchlist BEGIN "
+    "DELETE FROM watchlist_fts WHERE rowid = OLD.rowid; "
+    f"INSERT INTO watchlist_fts (rowid, {', '.join(SEARCH_FTS_COLUMNS)}) VALUES ({SEARCH_FTS_VALUES}); END;",
+]
+SEARCH_LIMIT_MAX = 100
+FACET_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS trg_facets_insert AFTER INSERT ON watchlist "
+    "BEGIN INSERT OR IGNORE INTO facet_dirty (row_id) VALUES (NEW.rowid); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_facets_update AFTER UPDATE OF country, nominated_categories, won_categories, runtime "
+    "ON watchlist BEGIN INSERT OR IGNORE INTO facet_dirty (row_id) VALUES (NEW.rowid); END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_facets_delete AFTER DELETE ON watchlist BEGIN "
+    "DELETE FROM watchlist_country WHERE row_id = OLD.rowid; "
+    "DELETE FROM watchlist_category WHERE row_id = OLD.rowid; "
+    "DELETE FROM facet_dirty WHERE row_id = OLD.rowid; END;",
+]
+YEAR_SUMMARY_TRIGGERS = [
+    f"CREATE TRIGGER IF NOT EXISTS trg_year_summary_insert AFTER INSERT ON watchlist BEGIN {YEAR_SUMMARY_ADD} END;",
+    f"CREATE TRIGGER IF NOT EXISTS trg_year_summary_delete AFTER DELETE ON watchlist BEGIN {YEAR_SUMMARY_REMOVE} END;",
+    "CREATE TRIGGER IF NOT EXISTS trg_year_summary_update AFTER UPDATE OF oscars_year, watched, runtime_minutes ON watchlist "
+    f"BEGIN {YEAR_SUMMARY_REMOVE} {YEAR_SUMMARY_ADD} END;",
+]
 
 
 def enable_ansi():
@@ -144,8 +348,35 @@ COLUMNS = [
     ("poster_url", "TEXT"),
     ("poster_source", "TEXT"),
     ("oscars_year", "INTEGER"),
+    ("poster_remote_url", "TEXT"),
+    ("poster_hash", "TEXT"),
+    ("poster_lqip", "TEXT"),
+    ("poster_color", "TEXT"),
+    ("film_key", "TEXT"),
+]
+
+FILM_COLUMNS = [
+    ("film_key", "TEXT PRIMARY KEY"),
+    ("imdb_id", "TEXT"),
+    ("title", "TEXT"),
+    ("poster_url", "TEXT"),
+    ("poster_source", "TEXT"),
+    ("poster_remote_url", "TEXT"),
+    ("poster_hash", "TEXT"),
+    ("poster_lqip", "TEXT"),
+    ("poster_color", "TEXT"),
+    ("runtime", "TEXT"),
+    ("country", "TEXT"),
+    ("details_providers", "TEXT"),
+    ("updated_at", "TEXT"),
 ]
 
+FILM_POSTER_FIELDS = ["poster_url", "poster_source", "poster_remote_url", "poster_hash", "poster_lqip", "poster_color"]
+
+# Seed hot-reload never touches the user's own columns, and only overwrites enrichment columns when the seed has a value.
+SEED_USER_COLUMNS = {"watched", "watched_date", "rating_1_10", "notes", "where_to_watch", "won_categories"}
+SEED_FILL_COLUMNS = {"runtime", "country", *FILM_POSTER_FIELDS}
+
 UPDATE_FIELDS = {
     "watched",
     "watched_date",
@@ -155,6 +386,10 @@ UPDATE_FIELDS = {
     "won_categories",
     "poster_url",
     "poster_source",
+    "poster_remote_url",
+    "poster_hash",
+    "poster_lqip",
+    "poster_color",
 }
 
 
@@ -205,6 +440,214 @@ def log_json(title: str, payload, tag: str = "api", level: str = "dim"):
         log_line(f"  {line}", tag=tag, level=level)
 
 
+def timing_reset():
+    REQUEST_TIMING.phases = {}
+    REQUEST_TIMING.statement = None
+
+
+def timing_add(phase, seconds):
+    phases = getattr(REQUEST_TIMING, "phases", None)
+    if phases is None:
+        phases = REQUEST_TIMING.phases = {}
+    phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+def server_timing_header():
+    phases = getattr(REQUEST_TIMING, "phases", None) or {}
+    return ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in phases.items())
+
+
+def slow_query_ms():
+    try:
+        return float(os.environ.get("SLOW_QUERY_MS") or SLOW_QUERY_MS_DEFAULT)
+    except ValueError:
+        return float(SLOW_QUERY_MS_DEFAULT)
+
+
+def db_trace_statement(statement):
+    REQUEST_TIMING.statement = statement
+
+
+def db_trace_done(sql, elapsed):
+    timing_add("db", elapsed)
+    threshold = slow_query_ms()
+    if threshold <= 0 or elapsed * 1000 < threshold:
+        return
+    statement = getattr(REQUEST_TIMING, "statement", None) or sql
+    statement = " ".join(str(statement).split())
+    if len(statement) > 300:
+        statement = statement[:300] + "..."
+    log_line(f"slow query {elapsed * 1000:.1f}ms: {statement}", tag="db", level="warn")
+
+
+class TracedCursor(sqlite3.Cursor):
+    # Times execute + fetch per statement; the total feeds Server-Timing "db" and the slow-query log.
+    trace_sql = None
+    trace_elapsed = 0.0
+
+    def trace_run(self, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.trace_elapsed += time.perf_counter() - t0
+
+    def trace_finish(self):
+        if self.trace_sql is not None:
+            db_trace_done(self.trace_sql, self.trace_elapsed)
+        self.trace_sql = None
+        self.trace_elapsed = 0.0
+
+    def execute(self, sql, params=()):
+        self.trace_finish()
+        self.trace_sql = sql
+        result = self.trace_run(super().execute, sql, params)
+        if self.description is None:
+            self.trace_finish()
+        return result
+
+    def executemany(self, sql, seq_of_params):
+        self.trace_finish()
+        self.trace_sql = sql
+        result = self.trace_run(super().executemany, sql, seq_of_params)
+        self.trace_finish()
+        return result
+
+    def fetchone(self):
+        row = self.trace_run(super().fetchone)
+        if row is None:
+            self.trace_finish()
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self.trace_run(super().fetchmany, size or self.arraysize)
+        if not rows:
+            self.trace_finish()
+        return rows
+
+    def fetchall(self):
+        rows = self.trace_run(super().fetchall)
+        self.trace_finish()
+        return rows
+
+    def __next__(self):
+        try:
+            return self.trace_run(super().__next__)
+        except StopIteration:
+            self.trace_finish()
+            raise
+
+    def close(self):
+        self.trace_finish()
+        super().close()
+
+    def __del__(self):
+        # execute(...).fetchone() never reads the end of the statement; the discarded cursor closes its timing.
+        self.trace_finish()
+
+
+class TracedConnection(sqlite3.Connection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_trace_callback(db_trace_statement)
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        return self.cursor().executemany(sql, seq_of_params)
+
+
+class SnapshotConnection(TracedConnection):
+    # Read by the sub-requests of one /api/batch call, one after another, so they all see the same WAL snapshot.
+    # close()/commit() are left to release(). No trace callback: TracedCursor still times each statement.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_trace_callback(None)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+    def release(self):
+        super().commit()
+        super().close()
+
+
+def db_connect():
+    snapshot = getattr(READ_SNAPSHOT, "conn", None)
+    if snapshot is not None:
+        return snapshot
+    return sqlite3.connect(DB_PATH, factory=TracedConnection)
+
+
+def open_snapshot():
+    conn = sqlite3.connect(DB_PATH, factory=SnapshotConnection)
+    # The first SELECT after BEGIN pins the snapshot.
+    conn.execute("BEGIN;")
+    conn.execute("SELECT COUNT(1) FROM year_summary;").fetchone()
+    return conn
+
+
+def profile_mode():
+    mode = str(os.environ.get("PROFILE_REQUESTS", "")).strip().lower()
+    if mode in {"1", "true", "yes", "on", "all"}:
+        return "all"
+    return "header" if mode == "header" else None
+
+
+def profile_wanted(path, header_value):
+    if not path.startswith("/api/"):
+        return False
+    mode = profile_mode()
+    if mode == "all":
+        return True
+    return mode == "header" and str(header_value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def profile_id_for(method, path):
+    slug = re.sub(r"[^a-z0-9]+", "-", path.lower()).strip("-")[:60] or "root"
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{method.lower()}-{slug}"
+
+
+def profile_save(profiler, profile_id, elapsed):
+    try:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(PROFILE_DIR / f"{profile_id}.prof")
+        saved = sorted(PROFILE_DIR.glob("*.prof"))
+        for old in saved[:-PROFILE_KEEP]:
+            old.unlink(missing_ok=True)
+    except OSError as exc:
+        log_line(f"profile save failed: {profile_id}: {exc}", tag="api", level="warn")
+        return
+    log_line(f"profile {profile_id} ({elapsed * 1000:.1f}ms)", tag="api", level="dim")
+
+
+def profile_report(profile_id, limit=40, sort="cumulative"):
+    if not re.fullmatch(r"[A-Za-z0-9_.-]+", profile_id or ""):
+        return None
+    if sort not in {"cumulative", "tottime", "calls", "ncalls"}:
+        sort = "cumulative"
+    path = PROFILE_DIR / f"{profile_id}.prof"
+    if not path.is_file():
+        return None
+    out = io.StringIO()
+    stats = pstats.Stats(str(path), stream=out)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+def profile_list():
+    if not PROFILE_DIR.exists():
+        return []
+    return [p.stem for p in sorted(PROFILE_DIR.glob("*.prof"), reverse=True)]
+
+
 def set_last_update(payload):
     global LAST_UPDATE
     LAST_UPDATE = payload
@@ -278,15 +721,339 @@ def poster_providers():
     return tmdb, omdb
 
 
-def http_get_json(url, headers=None, timeout=10):
-    req = urllib.request.Request(url, headers=headers or {})
+class ProviderUnavailable(RuntimeError):
+    pass
+
+
+def provider_base(name):
+    # Overridable (e.g. TMDB_API_BASE=http://127.0.0.1:8765/tmdb/3) to point enrichment at a stand-in server.
+    return (os.environ.get(f"{name.upper()}_API_BASE") or PROVIDER_BASES[name]).rstrip("/")
+
+
+def provider_for_url(url):
+    for name in PROVIDER_BASES:
+        base = provider_base(name)
+        if url == base or url.startswith(base + "/") or url.startswith(base + "?"):
+            return name
+    return None
+
+
+def provider_state(name):
+    state = PROVIDER_LIMITS.get(name)
+    if state is None:
+        defaults = PROVIDER_LIMIT_DEFAULTS.get(name) or PROVIDER_LIMIT_DEFAULTS["wikidata"]
+        state = {
+            **defaults,
+            "in_flight": 0,
+            "next_at": 0.0,
+            "failures": 0,
+            "open_until": 0.0,
+            "throttled": 0,
+            "tripped": 0,
+        }
+        PROVIDER_LIMITS[name] = state
+    return state
+
+
+def provider_limits_snapshot():
+    now = time.monotonic()
+    with PROVIDER_LIMIT_COND:
+        out = {}
+        for name, state in PROVIDER_LIMITS.items():
+            out[name] = {
+                "rate": round(state["rate"], 2),
+                "concurrency": int(state["concurrency"]),
+                "in_flight": state["in_flight"],
+                "paused_for": round(max(0.0, state["next_at"] - now - 1.0 / state["rate"]), 2),
+                "failures": state["failures"],
+                "open": state["open_until"] > now,
+                "throttled": state["throttled"],
+                "tripped": state["tripped"],
+            }
+        return out
+
+
+def provider_acquire(name):
+    deadline = time.monotonic() + PROVIDER_MAX_WAIT
+    with PROVIDER_LIMIT_COND:
+        state = provider_state(name)
+        while True:
+            now = time.monotonic()
+            if state["open_until"] > now:
+                raise ProviderUnavailable(f"{name} circuit open for {state['open_until'] - now:.0f}s")
+            if state["next_at"] > deadline:
+                raise ProviderUnavailable(f"{name} rate limited for {state['next_at'] - now:.0f}s")
+            if state["in_flight"] < int(state["concurrency"]) and now >= state["next_at"]:
+                state["in_flight"] += 1
+                state["next_at"] = now + 1.0 / state["rate"]
+                return
+            if now >= deadline:
+                raise ProviderUnavailable(f"{name} busy")
+            wait = state["next_at"] - now if state["in_flight"] < int(state["concurrency"]) else 0.25
+            PROVIDER_LIMIT_COND.wait(timeout=min(max(wait, 0.01), deadline - now))
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def rate_limit_pause(headers):
+    if headers is None:
+        return None
+    retry_after = parse_retry_after(headers.get("Retry-After"))
+    if retry_after is not None:
+        return retry_after
+    remaining = headers.get("X-RateLimit-Remaining") or headers.get("RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset") or headers.get("RateLimit-Reset")
+    try:
+        if remaining is None or int(float(remaining)) > 0 or reset is None:
+            return None
+        reset = float(reset)
+    except ValueError:
+        return None
+    # Some providers send an epoch timestamp, others a delta in seconds.
+    return max(0.0, reset - time.time()) if reset > 1e9 else reset
+
+
+def provider_release(name, status=None, headers=None, error=None):
+    now = time.monotonic()
+    with PROVIDER_LIMIT_COND:
+        state = provider_state(name)
+        state["in_flight"] = max(0, state["in_flight"] - 1)
+        pause = rate_limit_pause(headers)
+        if status in {429, 503}:
+            state["throttled"] += 1
+            state["rate"] = max(PROVIDER_MIN_RATE, state["rate"] / 2)
+            state["concurrency"] = max(1.0, state["concurrency"] / 2)
+            state["next_at"] = max(state["next_at"], now + (pause if pause is not None else 1.0 / state["rate"]))
+        elif error is not None or (status is not None and status >= 500):
+            state["failures"] += 1
+            if state["failures"] >= PROVIDER_BREAKER_THRESHOLD:
+                state["open_until"] = now + PROVIDER_BREAKER_COOLDOWN
+                # After the cooldown a single further failure re-opens the breaker (half-open).
+                state["failures"] = PROVIDER_BREAKER_THRESHOLD - 1
+                state["tripped"] += 1
+                log_line(f"provider {name} circuit open for {PROVIDER_BREAKER_COOLDOWN}s", tag="api", level="warn")
+        else:
+            state["failures"] = 0
+            defaults = PROVIDER_LIMIT_DEFAULTS.get(name) or PROVIDER_LIMIT_DEFAULTS["wikidata"]
+            state["rate"] = min(defaults["max_rate"], state["rate"] + PROVIDER_RATE_STEP)
+            state["concurrency"] = min(defaults["max_concurrency"], state["concurrency"] + 1.0 / state["concurrency"])
+            if pause is not None:
+                state["next_at"] = max(state["next_at"], now + pause)
+        PROVIDER_LIMIT_COND.notify_all()
+
+
+def provider_call(fn, *args, default=None):
+    try:
+        return fn(*args)
+    except ProviderUnavailable as exc:
+        log_line(f"provider skipped: {exc}", tag="api", level="dim")
+        return default
+
+
+def http_pool_stat(key, n=1):
+    with HTTP_POOL_LOCK:
+        HTTP_POOL_STATS[key] += n
+
+
+def http_pool_stats():
+    with HTTP_POOL_LOCK:
+        return dict(HTTP_POOL_STATS)
+
+
+def http_pool_delta(before):
+    after = http_pool_stats()
+    out = {k: after[k] - before.get(k, 0) for k in after}
+    out["reuse_rate"] = round(out["reused"] / out["requests"], 3) if out["requests"] else 0.0
+    return out
+
+
+def http_pool_acquire(scheme, host, port, timeout):
+    key = (scheme, host, port)
+    now = time.monotonic()
+    with HTTP_POOL_LOCK:
+        idle = HTTP_POOL.get(key) or []
+        while idle:
+            conn, last_used = idle.pop()
+            if now - last_used <= HTTP_POOL_IDLE_TIMEOUT:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            conn.close()
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=HTTP_SSL_CONTEXT)
+    else:
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    http_pool_stat("connects")
+    return conn, False
+
+
+def http_pool_release(scheme, host, port, conn):
+    key = (scheme, host, port)
+    with HTTP_POOL_LOCK:
+        idle = HTTP_POOL.setdefault(key, [])
+        if len(idle) >= HTTP_POOL_MAX_IDLE_PER_HOST:
+            conn.close()
+            return
+        idle.append((conn, time.monotonic()))
+
+
+def http_request_urllib(url, headers, timeout, max_bytes):
+    req = urllib.request.Request(url, headers=headers)
     with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = resp.read().decode("utf-8")
+        data = resp.read() if max_bytes is None else resp.read(max_bytes + 1)
+        return resp.status, resp.headers, data
+
+
+def http_request(url, headers=None, timeout=10, max_bytes=None):
+    provider = provider_for_url(url)
+    if not provider:
+        return http_fetch(url, headers=headers, timeout=timeout, max_bytes=max_bytes)
+    for attempt in range(2):
+        provider_acquire(provider)
+        try:
+            result = http_fetch(url, headers=headers, timeout=timeout, max_bytes=max_bytes)
+        except urllib.error.HTTPError as exc:
+            provider_release(provider, status=exc.code, headers=exc.headers)
+            if exc.code in {429, 503} and attempt == 0:
+                continue
+            raise
+        except (OSError, http.client.HTTPException) as exc:
+            provider_release(provider, error=exc)
+            raise
+        except Exception:
+            provider_release(provider)
+            raise
+        provider_release(provider, status=result[0], headers=result[1])
+        return result
+
+
+def http_fetch(url, headers=None, timeout=10, max_bytes=None):
+    headers = dict(headers or {})
+    headers.setdefault("Accept-Encoding", "gzip")
+    for _ in range(HTTP_MAX_REDIRECTS + 1):
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in {"http", "https"} or urllib.request.getproxies().get(scheme):
+            status, resp_headers, data = http_request_urllib(url, headers, timeout, max_bytes)
+        else:
+            host = parsed.hostname
+            port = parsed.port or (443 if scheme == "https" else 80)
+            target = parsed.path or "/"
+            if parsed.query:
+                target = f"{target}?{parsed.query}"
+            http_pool_stat("requests")
+            for attempt in range(2):
+                conn, reused = http_pool_acquire(scheme, host, port, timeout)
+                try:
+                    conn.request("GET", target, headers=headers)
+                    resp = conn.getresponse()
+                    data = resp.read() if max_bytes is None else resp.read(max_bytes + 1)
+                    status, resp_headers = resp.status, resp.headers
+                except (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError, socket.timeout) as exc:
+                    conn.close()
+                    # A pooled socket may have been closed by the server while idle; retry once on a fresh one.
+                    if reused and attempt == 0 and not isinstance(exc, socket.timeout):
+                        http_pool_stat("reconnects")
+                        continue
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+                if reused:
+                    http_pool_stat("reused")
+                if resp.will_close or (max_bytes is not None and len(data) > max_bytes):
+                    conn.close()
+                else:
+                    http_pool_release(scheme, host, port, conn)
+                break
+        if status in {301, 302, 303, 307, 308} and resp_headers.get("Location"):
+            url = urllib.parse.urljoin(url, resp_headers["Location"])
+            continue
+        if status >= 400:
+            raise urllib.error.HTTPError(url, status, f"HTTP Error {status}", resp_headers, None)
+        if max_bytes is not None and len(data) > max_bytes:
+            raise ValueError(f"response larger than {max_bytes} bytes")
+        if (resp_headers.get("Content-Encoding") or "").lower() == "gzip":
+            data = gzip.decompress(data)
+            http_pool_stat("gzip")
+        return status, resp_headers, data
+    raise urllib.error.URLError(f"too many redirects: {url}")
+
+
+def http_get_json(url, headers=None, timeout=10):
+    _, _, raw = http_request(url, headers=headers, timeout=timeout)
+    data = raw.decode("utf-8")
     if not data:
         return {}
     return json.loads(data)
 
 
+def single_flight(key, fn):
+    with SINGLE_FLIGHT_LOCK:
+        call = SINGLE_FLIGHT.get(key)
+        leader = call is None
+        if leader:
+            call = {"event": threading.Event(), "result": None, "error": None}
+            SINGLE_FLIGHT[key] = call
+    if not leader:
+        http_pool_stat("coalesced")
+        call["event"].wait()
+        if call["error"] is not None:
+            raise call["error"]
+        return call["result"]
+    try:
+        call["result"] = fn()
+        return call["result"]
+    except Exception as exc:
+        call["error"] = exc
+        raise
+    finally:
+        with SINGLE_FLIGHT_LOCK:
+            SINGLE_FLIGHT.pop(key, None)
+        call["event"].set()
+
+
+def cached_get_json(url, headers=None, timeout=10):
+    now = time.monotonic()
+    with SINGLE_FLIGHT_LOCK:
+        cached = PROVIDER_CACHE.get(url)
+        if cached and now - cached[0] <= PROVIDER_CACHE_TTL:
+            PROVIDER_CACHE.move_to_end(url)
+            hit = cached[1]
+        else:
+            hit = None
+    if hit is not None:
+        http_pool_stat("cache_hits")
+        return hit
+    data = single_flight(url, lambda: http_get_json(url, headers=headers, timeout=timeout))
+    with SINGLE_FLIGHT_LOCK:
+        PROVIDER_CACHE[url] = (time.monotonic(), data)
+        PROVIDER_CACHE.move_to_end(url)
+        while len(PROVIDER_CACHE) > PROVIDER_CACHE_MAX:
+            PROVIDER_CACHE.popitem(last=False)
+    return data
+
+
+def http_get_bytes(url, headers=None, timeout=15, max_bytes=POSTER_MAX_BYTES):
+    _, resp_headers, data = http_request(
+        url, headers=headers or {"User-Agent": WIKI_UA}, timeout=timeout, max_bytes=max_bytes
+    )
+    content_type = (resp_headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+    return data, content_type
+
+
 def imdb_id_from_url(url):
     if not url:
         return None
@@ -301,8 +1068,8 @@ def get_tmdb_config(api_key):
     if cached:
         return cached
     params = urllib.parse.urlencode({"api_key": api_key})
-    url = f"https://api.themoviedb.org/3/configuration?{params}"
-    data = http_get_json(url, headers={"Accept": "application/json"})
+    url = f"{provider_base('tmdb')}/configuration?{params}"
+    data = cached_get_json(url, headers={"Accept": "application/json"})
     images = data.get("images") or {}
     base_url = images.get("secure_base_url") or images.get("base_url")
     sizes = images.get("poster_sizes") or []
@@ -314,20 +1081,30 @@ def get_tmdb_config(api_key):
     return config
 
 
+def tmdb_search(title, api_key):
+    params = urllib.parse.urlencode({
+        "api_key": api_key,
+        "query": title,
+        "include_adult": "false",
+    })
+    url = f"{provider_base('tmdb')}/search/movie?{params}"
+    data = cached_get_json(url, headers={"Accept": "application/json"})
+    return data.get("results") or []
+
+
+def tmdb_movie(movie_id, api_key):
+    params = urllib.parse.urlencode({"api_key": api_key})
+    url = f"{provider_base('tmdb')}/movie/{movie_id}?{params}"
+    return cached_get_json(url, headers={"Accept": "application/json"})
+
+
 def tmdb_poster(title, api_key):
     if not api_key or not title:
         return None
     config = get_tmdb_config(api_key)
     if not config:
         return None
-    params = urllib.parse.urlencode({
-        "api_key": api_key,
-        "query": title,
-        "include_adult": "false",
-    })
-    url = f"https://api.themoviedb.org/3/search/movie?{params}"
-    data = http_get_json(url, headers={"Accept": "application/json"})
-    for item in data.get("results") or []:
+    for item in tmdb_search(title, api_key):
         poster_path = item.get("poster_path")
         if poster_path:
             return f"{config['base_url']}{config['size']}{poster_path}"
@@ -343,8 +1120,8 @@ def omdb_poster(title, imdb_url, api_key):
         params["i"] = imdb_id
     else:
         params["t"] = title
-    url = f"https://www.omdbapi.com/?{urllib.parse.urlencode(params)}"
-    data = http_get_json(url, headers={"Accept": "application/json"})
+    url = f"{provider_base('omdb')}/?{urllib.parse.urlencode(params)}"
+    data = cached_get_json(url, headers={"Accept": "application/json"})
     if data.get("Response") == "True":
         poster = data.get("Poster")
         if poster and poster != "N/A":
@@ -352,7 +1129,7 @@ def omdb_poster(title, imdb_url, api_key):
     if imdb_id:
         return None
     params = {"apikey": api_key, "s": title}
-    url = f"https://www.omdbapi.com/?{urllib.parse.urlencode(params)}"
+    url = f"{provider_base('omdb')}/?{urllib.parse.urlencode(params)}"
     data = http_get_json(url, headers={"Accept": "application/json"})
     for item in data.get("Search") or []:
         poster = item.get("Poster")
@@ -362,24 +1139,10 @@ def omdb_poster(title, imdb_url, api_key):
 
 
 def wiki_poster(title):
-    if not title:
-        return None
-    headers = {"User-Agent": WIKI_UA}
-    search_params = {
-        "action": "query",
-        "list": "search",
-        "srsearch": title,
-        "format": "json",
-        "srlimit": 1,
-    }
-    search_url = f"https://en.wikipedia.org/w/api.php?{urllib.parse.urlencode(search_params)}"
-    data = http_get_json(search_url, headers=headers)
-    results = (data.get("query") or {}).get("search") or []
-    if not results:
-        return None
-    page_title = results[0].get("title")
+    page_title = wiki_page_title(title)
     if not page_title:
         return None
+    headers = {"User-Agent": WIKI_UA}
     img_params = {
         "action": "query",
         "prop": "pageimages",
@@ -388,7 +1151,7 @@ def wiki_poster(title):
         "piprop": "thumbnail",
         "pithumbsize": 300,
     }
-    img_url = f"https://en.wikipedia.org/w/api.php?{urllib.parse.urlencode(img_params)}"
+    img_url = f"{provider_base('wikipedia')}/w/api.php?{urllib.parse.urlencode(img_params)}"
     data = http_get_json(img_url, headers=headers)
     pages = (data.get("query") or {}).get("pages") or {}
     for page in pages.values():
@@ -401,18 +1164,270 @@ def wiki_poster(title):
 def find_poster(item, tmdb_key, omdb_key):
     title = item.get("title")
     imdb_url = item.get("imdb_url")
-    poster = tmdb_poster(title, tmdb_key) if tmdb_key else None
+    poster = provider_call(tmdb_poster, title, tmdb_key) if tmdb_key else None
     if poster:
         return poster, "tmdb"
-    poster = omdb_poster(title, imdb_url, omdb_key) if omdb_key else None
+    poster = provider_call(omdb_poster, title, imdb_url, omdb_key) if omdb_key else None
     if poster:
         return poster, "omdb"
-    poster = wiki_poster(title)
+    poster = provider_call(wiki_poster, title)
     if poster:
         return poster, "wikipedia"
     return None, None
 
 
+def poster_digest(data):
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
+def poster_variant_name(digest, label, ext):
+    return f"poster-{label}-{digest}{ext}"
+
+
+def poster_mirror_url(name):
+    return f"/posters/mirror/{urllib.parse.quote(name)}"
+
+
+def make_poster_variants(src_path, digest):
+    try:
+        from PIL import Image, features
+    except ImportError:
+        return {}
+    use_webp = features.check("webp")
+    ext = ".webp" if use_webp else ".jpg"
+    out = {}
+    POSTER_MIRROR_DIR.mkdir(parents=True, exist_ok=True)
+    with Image.open(src_path) as im:
+        im = im.convert("RGB")
+        for label, width in POSTER_VARIANTS:
+            name = poster_variant_name(digest, label, ext)
+            target = POSTER_MIRROR_DIR / name
+            if not target.exists():
+                if im.width <= width:
+                    resized = im.copy()
+                else:
+                    height = max(1, round(im.height * width / im.width))
+                    resized = im.resize((width, height), Image.LANCZOS)
+                tmp = target.with_name(target.name + ".tmp")
+                resized.save(tmp, format="WEBP" if use_webp else "JPEG", quality=80, optimize=True)
+                os.replace(tmp, target)
+            out[label] = name
+    return out
+
+
+def mirror_remote_poster(url):
+    data, content_type = http_get_bytes(url)
+    ext = POSTER_CONTENT_EXTS.get(content_type)
+    if not ext:
+        suffix = Path(urllib.parse.urlparse(url).path).suffix.lower()
+        ext = ".jpg" if suffix == ".jpeg" else suffix
+    if ext not in POSTER_EXTS:
+        raise ValueError(f"unsupported poster type: {content_type or ext or 'unknown'}")
+    digest = poster_digest(data)
+    name = poster_variant_name(digest, "src", ext)
+    target = POSTER_MIRROR_DIR / name
+    if not target.exists():
+        POSTER_MIRROR_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+    make_poster_variants(target, digest)
+    return poster_mirror_url(name), digest
+
+
+def mirror_local_poster(name):
+    path = POSTERS_DIR / name
+    digest = poster_digest(path.read_bytes())
+    make_poster_variants(path, digest)
+    return digest
+
+
+def poster_path_from_url(url):
+    current = str(url or "")
+    if not current.startswith("/posters/"):
+        return None
+    name = urllib.parse.unquote(current[len("/posters/"):])
+    if not name or name.startswith("remote/"):
+        return None
+    if name.startswith("mirror/"):
+        path = POSTER_MIRROR_DIR / name[len("mirror/"):]
+    else:
+        path = POSTERS_DIR / name
+    return path if path.is_file() else None
+
+
+def poster_placeholder(path):
+    if not path:
+        return None, None
+    try:
+        from PIL import Image
+    except ImportError:
+        return None, None
+    try:
+        st = path.stat()
+    except OSError:
+        return None, None
+    key = str(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = POSTER_PLACEHOLDERS.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    with Image.open(path) as im:
+        im = im.convert("RGB")
+        r, g, b = im.resize((1, 1), Image.BOX).getpixel((0, 0))
+        height = max(1, round(im.height * POSTER_LQIP_WIDTH / im.width))
+        small = im.resize((POSTER_LQIP_WIDTH, height), Image.BILINEAR)
+    buf = io.BytesIO()
+    small.save(buf, format="JPEG", quality=40, optimize=True)
+    lqip = "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+    result = (lqip, f"#{r:02x}{g:02x}{b:02x}")
+    POSTER_PLACEHOLDERS[key] = (stamp, result)
+    return result
+
+
+def poster_mirror_names():
+    try:
+        return set(os.listdir(POSTER_MIRROR_DIR))
+    except OSError:
+        return set()
+
+
+def poster_srcset(digest, names):
+    if not digest:
+        return None, None
+    entries = []
+    thumb = None
+    for label, width in POSTER_VARIANTS:
+        for ext in (".webp", ".jpg"):
+            name = poster_variant_name(digest, label, ext)
+            if name in names:
+                url = poster_mirror_url(name)
+                entries.append(f"{url} {width}w")
+                if thumb is None:
+                    thumb = url
+                break
+    return (", ".join(entries) if entries else None), thumb
+
+
+def poster_proxy_digest(url):
+    return hashlib.sha1(str(url).encode("utf-8")).hexdigest()[:20]
+
+
+def poster_proxy_register(url):
+    digest = poster_proxy_digest(url)
+    with POSTER_PROXY_LOCK:
+        POSTER_PROXY_URLS[digest] = url
+    return f"/posters/remote/{digest}"
+
+
+def poster_proxy_lookup(digest):
+    # The DB is scanned at most once per response generation, so unknown digests are answered from the map
+    # instead of costing a table scan each.
+    generation = RESPONSE_GENERATION
+    with POSTER_PROXY_LOCK:
+        url = POSTER_PROXY_URLS.get(digest)
+        loaded = POSTER_PROXY_LOADED.get("generation") == generation
+    if url or loaded or not DB_PATH.exists():
+        return url
+    conn = db_connect()
+    try:
+        placeholders = ",".join("?" for _ in POSTER_PROXY_SOURCES)
+        rows = conn.execute(
+            f"SELECT poster_url, poster_remote_url FROM watchlist WHERE poster_source IN ({placeholders});",
+            sorted(POSTER_PROXY_SOURCES),
+        ).fetchall()
+    finally:
+        conn.close()
+    for poster_url, remote_url in rows:
+        for candidate in (poster_url, remote_url):
+            if candidate and str(candidate).startswith(("http://", "https://")):
+                poster_proxy_register(candidate)
+    with POSTER_PROXY_LOCK:
+        POSTER_PROXY_LOADED["generation"] = generation
+        return POSTER_PROXY_URLS.get(digest)
+
+
+def poster_proxy_cached(digest):
+    for ext in dict.fromkeys(POSTER_CONTENT_EXTS.values()):
+        path = POSTER_PROXY_DIR / f"{digest}{ext}"
+        if path.is_file():
+            return path
+    return None
+
+
+def poster_proxy_evict(keep=None):
+    try:
+        entries = [(p.stat(), p) for p in POSTER_PROXY_DIR.iterdir() if p.is_file()]
+    except OSError:
+        return 0
+    total = sum(st.st_size for st, _ in entries)
+    removed = 0
+    for st, path in sorted(entries, key=lambda item: item[0].st_mtime):
+        if total <= POSTER_PROXY_MAX_BYTES:
+            break
+        if keep is not None and path == keep:
+            continue
+        try:
+            path.unlink()
+            total -= st.st_size
+            removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def poster_proxy_fetch(digest, url):
+    with POSTER_PROXY_LOCK:
+        flight = POSTER_PROXY_INFLIGHT.get(digest)
+        leader = flight is None
+        if leader:
+            flight = {"event": threading.Event(), "error": None}
+            POSTER_PROXY_INFLIGHT[digest] = flight
+    if not leader:
+        flight["event"].wait(timeout=30)
+        cached = poster_proxy_cached(digest)
+        if cached:
+            return cached
+        # Followers fail the same way as the leader (502), not as a missing poster.
+        raise RuntimeError(f"poster fetch failed: {flight['error'] or 'timed out'}")
+    try:
+        cached = poster_proxy_cached(digest)
+        if cached:
+            return cached
+        data, content_type = http_get_bytes(url)
+        ext = POSTER_CONTENT_EXTS.get(content_type)
+        if not ext:
+            raise ValueError(f"unsupported poster type: {content_type or 'unknown'}")
+        POSTER_PROXY_DIR.mkdir(parents=True, exist_ok=True)
+        target = POSTER_PROXY_DIR / f"{digest}{ext}"
+        tmp = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+        poster_proxy_evict(keep=target)
+        return target
+    except Exception as exc:
+        flight["error"] = exc
+        raise
+    finally:
+        with POSTER_PROXY_LOCK:
+            POSTER_PROXY_INFLIGHT.pop(digest, None)
+        flight["event"].set()
+
+
+def poster_proxy_file(digest):
+    cached = poster_proxy_cached(digest)
+    if cached:
+        try:
+            os.utime(cached)
+        except OSError:
+            pass
+        return cached
+    url = poster_proxy_lookup(digest)
+    if not url:
+        return None
+    return poster_proxy_fetch(digest, url)
+
+
 def clean_text(value):
     if value is None:
         return None
@@ -424,12 +1439,26 @@ def clean_text(value):
     return s
 
 
-def normalize_country_list(value):
-    if value is None:
+def parse_runtime_minutes(value):
+    # Seeds and providers mix "1h 17min", "137 min" and bare numbers; unparseable text counts as 0.
+    text = clean_text(value)
+    if not text:
         return None
+    hours = RUNTIME_HOURS_RE.search(text)
+    minutes = RUNTIME_MINUTES_RE.search(text)
+    if hours or minutes:
+        total = float(hours.group(1).replace(",", ".")) * 60 if hours else 0
+        return int(round(total + (int(minutes.group(1)) if minutes else 0)))
+    number = RUNTIME_NUMBER_RE.search(text)
+    return int(number.group(0)) if number else 0
+
+
+def split_countries(value):
+    if value is None:
+        return []
     raw = str(value).strip()
     if not raw:
-        return None
+        return []
     aliases = {
         "united states": "USA",
         "united states of america": "USA",
@@ -449,6 +1478,11 @@ def normalize_country_list(value):
         if mapped and mapped not in seen:
             seen.add(mapped)
             out.append(mapped)
+    return out
+
+
+def normalize_country_list(value):
+    out = split_countries(value)
     return ", ".join(out) if out else None
 
 
@@ -529,21 +1563,13 @@ def split_categories(value):
 def tmdb_details(title, api_key):
     if not api_key or not title:
         return {}
-    params = urllib.parse.urlencode({
-        "api_key": api_key,
-        "query": title,
-        "include_adult": "false",
-    })
-    url = f"https://api.themoviedb.org/3/search/movie?{params}"
-    data = http_get_json(url, headers={"Accept": "application/json"})
-    results = data.get("results") or []
+    results = tmdb_search(title, api_key)
     if not results:
         return {}
     movie_id = results[0].get("id")
     if not movie_id:
         return {}
-    details_url = f"https://api.themoviedb.org/3/movie/{movie_id}?{urllib.parse.urlencode({'api_key': api_key})}"
-    details = http_get_json(details_url, headers={"Accept": "application/json"})
+    details = tmdb_movie(movie_id, api_key)
     runtime = details.get("runtime")
     runtime_str = f"{runtime} min" if isinstance(runtime, int) and runtime > 0 else None
     countries = details.get("production_countries") or []
@@ -566,8 +1592,8 @@ def omdb_details(title, imdb_url, api_key):
         params["i"] = imdb_id
     else:
         params["t"] = title
-    url = f"https://www.omdbapi.com/?{urllib.parse.urlencode(params)}"
-    data = http_get_json(url, headers={"Accept": "application/json"})
+    url = f"{provider_base('omdb')}/?{urllib.parse.urlencode(params)}"
+    data = cached_get_json(url, headers={"Accept": "application/json"})
     if data.get("Response") != "True":
         return {}
     runtime = clean_text(data.get("Runtime"))
@@ -591,8 +1617,8 @@ def wiki_page_title(title):
         "format": "json",
         "srlimit": 1,
     }
-    search_url = f"https://en.wikipedia.org/w/api.php?{urllib.parse.urlencode(search_params)}"
-    data = http_get_json(search_url, headers=headers)
+    search_url = f"{provider_base('wikipedia')}/w/api.php?{urllib.parse.urlencode(search_params)}"
+    data = cached_get_json(search_url, headers=headers)
     results = (data.get("query") or {}).get("search") or []
     if not results:
         return None
@@ -611,7 +1637,7 @@ def wikidata_qid_from_title(title):
         "titles": page_title,
         "format": "json",
     }
-    url = f"https://en.wikipedia.org/w/api.php?{urllib.parse.urlencode(params)}"
+    url = f"{provider_base('wikipedia')}/w/api.php?{urllib.parse.urlencode(params)}"
     data = http_get_json(url, headers=headers)
     pages = (data.get("query") or {}).get("pages") or {}
     for page in pages.values():
@@ -632,7 +1658,7 @@ def wikidata_labels(qids):
         "languages": "en",
         "format": "json",
     }
-    url = f"https://www.wikidata.org/w/api.php?{urllib.parse.urlencode(params)}"
+    url = f"{provider_base('wikidata')}/w/api.php?{urllib.parse.urlencode(params)}"
     data = http_get_json(url, headers=headers)
     entities = data.get("entities") or {}
     out = {}
@@ -678,7 +1704,7 @@ def wikidata_details(title):
     if not qid:
         return {}
     headers = {"User-Agent": WIKI_UA}
-    url = f"https://www.wikidata.org/wiki/Special:EntityData/{qid}.json"
+    url = f"{provider_base('wikidata')}/wiki/Special:EntityData/{qid}.json"
     data = http_get_json(url, headers=headers)
     entity = (data.get("entities") or {}).get(qid) or {}
     claims = entity.get("claims") or {}
@@ -712,7 +1738,7 @@ def find_details(item, tmdb_key, omdb_key):
     imdb_url = item.get("imdb_url")
 
     if (not runtime or not country) and tmdb_key:
-        data = tmdb_details(title, tmdb_key)
+        data = provider_call(tmdb_details, title, tmdb_key, default={})
         if data.get("runtime") and not runtime:
             runtime = data["runtime"]
             providers.add("tmdb")
@@ -721,7 +1747,7 @@ def find_details(item, tmdb_key, omdb_key):
             providers.add("tmdb")
 
     if (not runtime or not country) and omdb_key:
-        data = omdb_details(title, imdb_url, omdb_key)
+        data = provider_call(omdb_details, title, imdb_url, omdb_key, default={})
         if data.get("runtime") and not runtime:
             runtime = data["runtime"]
             providers.add("omdb")
@@ -730,7 +1756,7 @@ def find_details(item, tmdb_key, omdb_key):
             providers.add("omdb")
 
     if not runtime or not country:
-        data = wikidata_details(title)
+        data = provider_call(wikidata_details, title, default={})
         if data.get("runtime") and not runtime:
             runtime = data["runtime"]
             providers.add("wikidata")
@@ -825,6 +1851,92 @@ def parse_winners_rows(path):
     return rows
 
 
+def winners_index_path(path):
+    return path.with_name(path.name + ".idx.json")
+
+
+def scan_winners_offsets(mm):
+    # Feed csv.reader one physical line at a time so pos always sits at the end of the last row it returned
+    # (quoted fields may span lines).
+    pos = [0]
+
+    def lines():
+        while pos[0] < len(mm):
+            end = mm.find(b"\n", pos[0])
+            end = len(mm) if end < 0 else end + 1
+            line = mm[pos[0]:end]
+            pos[0] = end
+            yield line.decode("utf-8", errors="replace")
+
+    reader = csv.reader(lines())
+    header = next(reader, None) or []
+    col = header.index("year") if "year" in header else 0
+    years = {}
+    start = pos[0]
+    for row in reader:
+        end = pos[0]
+        try:
+            y = int(row[col])
+        except (IndexError, ValueError):
+            start = end
+            continue
+        ranges = years.setdefault(str(y), [])
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = end
+        else:
+            ranges.append([start, end])
+        start = end
+    return header, years
+
+
+def winners_index(path):
+    st = path.stat()
+    stamp = [st.st_size, st.st_mtime_ns]
+    cached = WINNERS_INDEX.get(str(path))
+    if cached and cached["stamp"] == stamp:
+        return cached
+    sidecar = winners_index_path(path)
+    try:
+        index = json.loads(sidecar.read_text(encoding="utf-8"))
+        if index.get("stamp") == stamp:
+            WINNERS_INDEX[str(path)] = index
+            return index
+    except (OSError, ValueError):
+        pass
+    t0 = time.perf_counter()
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header, years = scan_winners_offsets(mm)
+    index = {"stamp": stamp, "header": header, "years": years}
+    try:
+        tmp = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp, sidecar)
+    except OSError as exc:
+        log_line(f"winners index not written: {exc}", tag="api", level="warn")
+    log_line(
+        f"winners index built: {len(years)} years in {(time.perf_counter() - t0) * 1000:.1f}ms",
+        tag="api",
+        level="dim",
+    )
+    WINNERS_INDEX[str(path)] = index
+    return index
+
+
+def winners_rows_for_year(path, year):
+    if not path.stat().st_size:
+        return []
+    index = winners_index(path)
+    ranges = index["years"].get(str(year)) or []
+    if not ranges:
+        return []
+    rows = []
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start, end in ranges:
+            chunk = mm[start:end].decode("utf-8", errors="replace")
+            rows.extend(csv.DictReader(io.StringIO(chunk, newline=""), fieldnames=index["header"]))
+    return rows
+
+
 def build_winners_map(rows, year=None):
     winners = {}
     for row in rows:
@@ -866,7 +1978,7 @@ def merge_categories(existing, extra):
 
 def update_winners_data(year=None, force=False):
     csv_path = download_winners_csv(force=force)
-    rows = parse_winners_rows(csv_path)
+    rows = winners_rows_for_year(csv_path, year) if year else parse_winners_rows(csv_path)
     winners_map = build_winners_map(rows, year=year)
 
     updated_files = 0
@@ -917,7 +2029,7 @@ def update_winners_data(year=None, force=False):
 
     # Update DB
     if DB_PATH.exists():
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_connect()
         cur = conn.cursor()
         cur.execute("PRAGMA table_info(watchlist);")
         existing_cols = {row[1] for row in cur.fetchall()}
@@ -957,8 +2069,11 @@ def update_winners_data(year=None, force=False):
                         (value, rowid),
                     )
                     updated_rows += 1
+        refresh_facets(conn)
         conn.commit()
         conn.close()
+        if updated_rows:
+            invalidate_responses(year)
 
     return {
         "ok": True,
@@ -969,11 +2084,37 @@ def update_winners_data(year=None, force=False):
         "source": "oscars_1929_2025.csv",
     }
 
-def update_posters(limit=25, force=False, year=None):
-    tmdb_key, omdb_key = poster_providers()
-    local_index = build_local_poster_index()
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+def apply_enrichment_writes(conn, writes, counts=None):
+    # Results gathered off-lock are written in one short transaction. Each UPDATE is guarded by the values the
+    # job read, so a row changed in the meantime is counted as a conflict instead of being overwritten. The
+    # counters a write names under "counts" are only bumped once its UPDATE actually applied.
+    applied = 0
+    conflicts = 0
+    cur = conn.cursor()
+    for write in writes:
+        if write.get("film"):
+            upsert_film(cur, *write["film"])
+        cur.execute(write["sql"], write["params"])
+        if cur.rowcount:
+            applied += 1
+            for name in write.get("counts", ()):
+                counts[name] += 1
+        else:
+            conflicts += 1
+        if write.get("fill"):
+            cur.execute(*write["fill"])
+    refresh_facets(conn)
+    conn.commit()
+    writes.clear()
+    return applied, conflicts
+
+
+def update_posters(limit=25, force=False, year=None):
+    http_before = http_pool_stats()
+    tmdb_key, omdb_key = poster_providers()
+    local_index = build_local_poster_index()
+    conn = db_connect()
+    conn.row_factory = sqlite3.Row
     cur = conn.cursor()
 
     year = parse_year(year)
@@ -984,86 +2125,124 @@ def update_posters(limit=25, force=False, year=None):
         ).fetchall()
     else:
         all_rows = cur.execute("SELECT rowid AS id, * FROM watchlist;").fetchall()
+    # Everything below works from this one read; candidates are filtered in Python instead of re-queried.
+    all_rows = [dict(row) for row in all_rows]
 
     local_updates = 0
+    conflicts = 0
+    writes = []
     if local_index != ({}, []):
-        for row in all_rows:
-            item = dict(row)
+        for item in all_rows:
             local_url = local_poster_url(item.get("title"), local_index)
             if not local_url:
                 continue
             current = str(item.get("poster_url") or "")
-            if current == local_url and (item.get("poster_source") == "local"):
+            try:
+                lqip, poster_color = poster_placeholder(poster_path_from_url(local_url))
+            except Exception as exc:
+                lqip, poster_color = None, None
+                log_line(f"poster placeholder error: {local_url}: {exc}", tag="api", level="dim")
+            if (
+                current == local_url
+                and item.get("poster_source") == "local"
+                and (not lqip or item.get("poster_lqip") == lqip)
+            ):
                 continue
-            cur.execute(
-                "UPDATE watchlist SET poster_url = ?, poster_source = ? WHERE rowid = ?;",
-                (local_url, "local", item["id"]),
-            )
-            local_updates += 1
-        conn.commit()
-
-    if force:
-        if year:
-            rows = cur.execute(
-                "SELECT rowid AS id, * FROM watchlist WHERE oscars_year = ?;",
-                (year,),
-            ).fetchall()
-        else:
-            rows = cur.execute("SELECT rowid AS id, * FROM watchlist;").fetchall()
-    else:
-        if year:
-            rows = cur.execute(
-                "SELECT rowid AS id, * FROM watchlist WHERE oscars_year = ? AND (poster_url IS NULL OR poster_url = '');",
-                (year,),
-            ).fetchall()
-        else:
-            rows = cur.execute(
-                "SELECT rowid AS id, * FROM watchlist WHERE poster_url IS NULL OR poster_url = '';"
-            ).fetchall()
-
-    updated = 0
+            writes.append({
+                "sql": "UPDATE watchlist SET poster_url = ?, poster_source = ?, poster_lqip = ?, poster_color = ?, "
+                "poster_hash = CASE WHEN poster_url = ? THEN poster_hash END WHERE rowid = ? AND poster_url IS ?;",
+                "params": (local_url, "local", lqip, poster_color, local_url, item["id"], item.get("poster_url")),
+            })
+            item["poster_url"] = local_url
+            item["poster_source"] = "local"
+        local_updates, conflicts = apply_enrichment_writes(conn, writes)
+
+    rows = all_rows if force else [item for item in all_rows if not item.get("poster_url")]
+    films = distinct_films(rows)
+    counts = {"updated": 0}
+    reused = 0
     missing = 0
     errors = 0
     limit_n = max(0, int(limit))
-    for row in rows[:limit_n]:
-        item = dict(row)
+    for i, (film_key, item) in enumerate(films[:limit_n]):
+        if i and i % BACKGROUND_YIELD_EVERY == 0:
+            conflicts += apply_enrichment_writes(conn, writes, counts)[1]
+            background_yield(conn)
         try:
             current = str(item.get("poster_url") or "")
             if current.startswith("/posters/"):
                 name = urllib.parse.unquote(current[len("/posters/"):])
                 if name and (POSTERS_DIR / name).exists():
                     continue
-            poster_url, source = find_poster(item, tmdb_key, omdb_key)
-            if poster_url:
-                cur.execute(
-                    "UPDATE watchlist SET poster_url = ?, poster_source = ? WHERE rowid = ?;",
-                    (poster_url, source, item["id"]),
-                )
-                updated += 1
-                log_line(f"poster ok: {item.get('title', '-') } [{source}]", tag="api", level="success")
+            film = None if force else load_film(cur, film_key)
+            film_write = None
+            if film and film.get("poster_url"):
+                fields = {k: film.get(k) for k in FILM_POSTER_FIELDS}
+                reused += 1
             else:
-                missing += 1
+                poster_url, source = find_poster(item, tmdb_key, omdb_key)
+                if not poster_url:
+                    missing += 1
+                    continue
+                remote_url = poster_url
+                digest = None
+                lqip, poster_color = None, None
+                try:
+                    poster_url, digest = mirror_remote_poster(remote_url)
+                    lqip, poster_color = poster_placeholder(poster_path_from_url(poster_url))
+                except Exception as exc:
+                    poster_url = poster_url if digest else remote_url
+                    log_line(f"poster mirror skipped: {item.get('title', '-')}: {exc}", tag="api", level="dim")
+                fields = {
+                    "poster_url": poster_url,
+                    "poster_source": source,
+                    "poster_remote_url": remote_url,
+                    "poster_hash": digest,
+                    "poster_lqip": lqip,
+                    "poster_color": poster_color,
+                }
+                film_write = (film_key, item, fields)
+                log_line(f"poster ok: {item.get('title', '-') } [{source}]", tag="api", level="success")
+            assignments = ", ".join(f"{k} = ?" for k in fields)
+            writes.append({
+                "film": film_write,
+                "counts": ("updated",),
+                "sql": f"UPDATE watchlist SET {assignments} WHERE rowid = ? AND poster_url IS ?;",
+                "params": list(fields.values()) + [item["id"], item.get("poster_url")],
+                "fill": (
+                    f"UPDATE watchlist SET {assignments} "
+                    "WHERE film_key = ? AND rowid != ? AND (poster_url IS NULL OR poster_url = '');",
+                    list(fields.values()) + [film_key, item["id"]],
+                ),
+            })
         except Exception as exc:
             errors += 1
             log_line(f"poster error: {item.get('title', '-')}: {exc}", tag="api", level="warn")
-        time.sleep(0.1)
 
-    conn.commit()
+    conflicts += apply_enrichment_writes(conn, writes, counts)[1]
+    changed = conn.total_changes
     conn.close()
-    attempted = min(len(rows), limit_n)
+    if changed:
+        invalidate_responses()
+    attempted = min(len(films), limit_n)
     return {
         "attempted": attempted,
-        "updated": updated,
+        "updated": counts["updated"],
+        "reused": reused,
         "local_updated": local_updates,
         "missing": missing,
         "errors": errors,
+        "conflicts": conflicts,
         "providers": {"tmdb": bool(tmdb_key), "omdb": bool(omdb_key), "wikipedia": True},
+        "http": http_pool_delta(http_before),
+        "limits": provider_limits_snapshot(),
     }
 
 
 def update_details(limit=25, force=False, year=None):
+    http_before = http_pool_stats()
     tmdb_key, omdb_key = poster_providers()
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_connect()
     conn.row_factory = sqlite3.Row
     cur = conn.cursor()
 
@@ -1084,30 +2263,65 @@ def update_details(limit=25, force=False, year=None):
             item = dict(row)
             if not clean_text(item.get("runtime")) or not clean_text(item.get("country")):
                 rows.append(row)
+    conflicts = 0
+    writes = []
 
-    updated = 0
-    updated_runtime = 0
-    updated_country = 0
+    films = distinct_films(rows)
+    counts = {"updated": 0, "updated_runtime": 0, "updated_country": 0}
+    reused = 0
     missing = 0
     errors = 0
     limit_n = max(0, int(limit))
-    for row in rows[:limit_n]:
-        item = dict(row)
+    for i, (film_key, item) in enumerate(films[:limit_n]):
+        if i and i % BACKGROUND_YIELD_EVERY == 0:
+            conflicts += apply_enrichment_writes(conn, writes, counts)[1]
+            background_yield(conn)
         try:
+            read_runtime, read_country = item.get("runtime"), item.get("country")
             before_runtime = clean_text(item.get("runtime"))
             before_country = clean_text(item.get("country"))
-            runtime, country, providers = find_details(item, tmdb_key, omdb_key)
+            film = None if force else load_film(cur, film_key)
+            film_write = None
+            if film and clean_text(film.get("runtime")) and clean_text(film.get("country")):
+                runtime, country = film["runtime"], film["country"]
+                providers = set((film.get("details_providers") or "").split(",")) - {""}
+                reused += 1
+            else:
+                if film:
+                    item = {
+                        **item,
+                        "runtime": before_runtime or film.get("runtime"),
+                        "country": before_country or film.get("country"),
+                    }
+                runtime, country, providers = find_details(item, tmdb_key, omdb_key)
+                if runtime or country:
+                    film_write = (film_key, item, {
+                        "runtime": runtime,
+                        "country": country,
+                        "details_providers": ",".join(sorted(providers)) or None,
+                    })
             if runtime or country:
-                cur.execute(
-                    "UPDATE watchlist SET runtime = ?, country = ? WHERE rowid = ?;",
-                    (runtime or before_runtime, country or before_country, item["id"]),
-                )
+                changed_fields = []
                 if runtime and runtime != before_runtime:
-                    updated_runtime += 1
+                    changed_fields.append("updated_runtime")
                 if country and country != before_country:
-                    updated_country += 1
-                if (runtime and runtime != before_runtime) or (country and country != before_country):
-                    updated += 1
+                    changed_fields.append("updated_country")
+                writes.append({
+                    "film": film_write,
+                    "counts": tuple(changed_fields + ["updated"]) if changed_fields else (),
+                    "sql": "UPDATE watchlist SET runtime = COALESCE(?, runtime), country = COALESCE(?, country) "
+                    "WHERE rowid = ? AND runtime IS ? AND country IS ?;",
+                    "params": (runtime or before_runtime, country or before_country, item["id"], read_runtime, read_country),
+                    # Other rows of the same film only get their empty fields filled.
+                    "fill": (
+                        "UPDATE watchlist SET runtime = COALESCE(NULLIF(runtime, ''), ?), "
+                        "country = COALESCE(NULLIF(country, ''), ?) "
+                        "WHERE film_key = ? AND rowid != ? "
+                        "AND (runtime IS NULL OR runtime = '' OR country IS NULL OR country = '');",
+                        (runtime or before_runtime, country or before_country, film_key, item["id"]),
+                    ),
+                })
+                if changed_fields:
                     sources = ",".join(sorted(providers)) if providers else "unknown"
                     log_line(f"details ok: {item.get('title', '-') } [{sources}]", tag="api", level="success")
             else:
@@ -1115,37 +2329,143 @@ def update_details(limit=25, force=False, year=None):
         except Exception as exc:
             errors += 1
             log_line(f"details error: {item.get('title', '-')}: {exc}", tag="api", level="warn")
-        time.sleep(0.1)
 
-    conn.commit()
+    conflicts += apply_enrichment_writes(conn, writes, counts)[1]
+    changed = conn.total_changes
     conn.close()
-    attempted = min(len(rows), limit_n)
+    if changed:
+        invalidate_responses()
+    attempted = min(len(films), limit_n)
     return {
         "attempted": attempted,
-        "updated": updated,
-        "updated_runtime": updated_runtime,
-        "updated_country": updated_country,
+        "updated": counts["updated"],
+        "updated_runtime": counts["updated_runtime"],
+        "updated_country": counts["updated_country"],
+        "reused": reused,
         "missing": missing,
         "errors": errors,
+        "conflicts": conflicts,
         "providers": {"tmdb": bool(tmdb_key), "omdb": bool(omdb_key), "wikidata": True},
+        "http": http_pool_delta(http_before),
+        "limits": provider_limits_snapshot(),
     }
 
-def load_seed_rows(path=SEED_JS):
-    if not path.exists():
-        return []
-    raw = path.read_text(encoding="utf-8")
-    if "=" not in raw:
-        return []
-    json_text = raw.split("=", 1)[1].strip()
-    if json_text.endswith(";"):
-        json_text = json_text[:-1]
-    try:
-        data = json.loads(json_text)
-    except json.JSONDecodeError:
-        return []
-    if isinstance(data, dict):
-        data = data.get("rows", [])
-    return data if isinstance(data, list) else []
+def mirror_local_name(item, local_index):
+    current = str(item.get("poster_url") or "")
+    if current.startswith("/posters/"):
+        local_name = urllib.parse.unquote(current[len("/posters/"):])
+        if (POSTERS_DIR / local_name).is_file():
+            return local_name
+    if current.startswith(("http://", "https://")):
+        return None
+    return local_poster_for_title(item.get("title"), local_index)
+
+
+def update_poster_mirror(limit=25, force=False, year=None):
+    http_before = http_pool_stats()
+    local_index = build_local_poster_index()
+    conn = db_connect()
+    conn.row_factory = sqlite3.Row
+    cur = conn.cursor()
+
+    year = parse_year(year)
+    if year:
+        all_rows = cur.execute(
+            "SELECT rowid AS id, * FROM watchlist WHERE oscars_year = ?;",
+            (year,),
+        ).fetchall()
+    else:
+        all_rows = cur.execute("SELECT rowid AS id, * FROM watchlist;").fetchall()
+
+    # Only rows that have something to mirror are candidates; otherwise unmirrorable rows would fill every
+    # limit-sized slice and later jobs would never get past them.
+    rows = []
+    for row in all_rows:
+        if not force and row["poster_hash"]:
+            continue
+        item = dict(row)
+        local_name = mirror_local_name(item, local_index)
+        if local_name or str(item.get("poster_url") or "").startswith(("http://", "https://")):
+            rows.append((item, local_name))
+
+    mirrored = 0
+    local = 0
+    skipped = 0
+    errors = 0
+    conflicts = 0
+    writes = []
+    digests = {}
+    limit_n = max(0, int(limit))
+    for i, (item, local_name) in enumerate(rows[:limit_n]):
+        if i and i % BACKGROUND_YIELD_EVERY == 0:
+            conflicts += apply_enrichment_writes(conn, writes)[1]
+            background_yield(conn)
+        try:
+            current = str(item.get("poster_url") or "")
+            if local_name:
+                digest = digests.get(local_name)
+                if digest is None:
+                    digest = mirror_local_poster(local_name)
+                    digests[local_name] = digest
+                poster_url = f"/posters/{urllib.parse.quote(local_name)}"
+                source = item.get("poster_source") or "local"
+                remote_url = item.get("poster_remote_url")
+                local += 1
+            elif current.startswith(("http://", "https://")):
+                remote_url = current
+                poster_url, digest = digests.get(remote_url) or mirror_remote_poster(remote_url)
+                digests[remote_url] = (poster_url, digest)
+                source = item.get("poster_source")
+                mirrored += 1
+            else:
+                skipped += 1
+                continue
+            lqip, poster_color = poster_placeholder(poster_path_from_url(poster_url))
+            film_write = None
+            if source in POSTER_PROXY_SOURCES:
+                film_write = (item.get("film_key") or film_key_for(item), item, {
+                    "poster_url": poster_url,
+                    "poster_source": source,
+                    "poster_remote_url": remote_url,
+                    "poster_hash": digest,
+                    "poster_lqip": lqip,
+                    "poster_color": poster_color,
+                })
+            writes.append({
+                "film": film_write,
+                "sql": "UPDATE watchlist SET poster_url = ?, poster_source = ?, poster_remote_url = ?, poster_hash = ?, "
+                "poster_lqip = ?, poster_color = ? WHERE rowid = ? AND poster_url IS ? AND poster_hash IS ?;",
+                "params": (
+                    poster_url,
+                    source,
+                    remote_url,
+                    digest,
+                    lqip,
+                    poster_color,
+                    item["id"],
+                    item.get("poster_url"),
+                    item.get("poster_hash"),
+                ),
+            })
+        except Exception as exc:
+            errors += 1
+            log_line(f"poster mirror error: {item.get('title', '-')}: {exc}", tag="api", level="warn")
+
+    conflicts += apply_enrichment_writes(conn, writes)[1]
+    changed = conn.total_changes
+    conn.close()
+    if changed:
+        invalidate_responses()
+    return {
+        "attempted": min(len(rows), limit_n),
+        "mirrored": mirrored,
+        "local": local,
+        "skipped": skipped,
+        "errors": errors,
+        "conflicts": conflicts,
+        "http": http_pool_delta(http_before),
+        "limits": provider_limits_snapshot(),
+    }
 
 
 def load_seed_rows_json(year):
@@ -1162,45 +2482,534 @@ def load_seed_rows_json(year):
         data = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError:
         return []
+    return seed_rows_from(data)
+
+
+def seed_rows_from(data):
     if isinstance(data, dict):
         data = data.get("rows", [])
     return data if isinstance(data, list) else []
 
 
+def seed_bundle_entry(year, stamp, body, digest):
+    return {
+        "stamp": stamp,
+        "year": year,
+        "hash": digest,
+        "name": f"{year}-{digest}.json",
+        "body": body,
+        "etag": f'"{digest}"',
+        "last_modified": email.utils.formatdate(stamp[1] / 1e9, usegmt=True),
+        "encoded": {},
+    }
+
+
+def load_seed_bundle(year, stamp):
+    # A bundle on disk is reused as long as it was written after the seed file last changed.
+    bundles = []
+    for path in SEED_BUNDLE_DIR.glob(f"{year}-*.json"):
+        try:
+            bundles.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            # Pruned by another worker's build_seed_bundle between the listing and the stat.
+            continue
+    if not bundles:
+        return None
+    mtime_ns, path = max(bundles)
+    match = SEED_BUNDLE_RE.match(path.name)
+    if not match or mtime_ns < stamp[1]:
+        return None
+    try:
+        body = path.read_bytes()
+    except OSError:
+        return None
+    if hashlib.sha256(body).hexdigest()[:16] != match.group(2):
+        return None
+    return seed_bundle_entry(year, stamp, body, match.group(2))
+
+
+def build_seed_bundle(year, stamp):
+    rows = load_seed_rows_json(year)
+    body = json.dumps({"year": year, "rows": rows}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    entry = seed_bundle_entry(year, stamp, body, hashlib.sha256(body).hexdigest()[:16])
+    target = SEED_BUNDLE_DIR / entry["name"]
+    try:
+        SEED_BUNDLE_DIR.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            os.utime(target)
+        else:
+            tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, target)
+        for old in SEED_BUNDLE_DIR.glob(f"{year}-*.json"):
+            if old.name != target.name:
+                old.unlink(missing_ok=True)
+    except OSError as exc:
+        log_line(f"seed bundle not written: {target.name}: {exc}", tag="api", level="warn")
+    return entry
+
+
+def seed_bundle(year):
+    path = OSCARS_DATA_DIR / f"{year}.json"
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    stamp = (str(path), st.st_mtime_ns, st.st_size)
+    with SEED_BUNDLES_LOCK:
+        entry = SEED_BUNDLES.get(year)
+    if entry and entry["stamp"] == stamp:
+        return entry
+    entry = load_seed_bundle(year, stamp) or build_seed_bundle(year, stamp)
+    with SEED_BUNDLES_LOCK:
+        SEED_BUNDLES[year] = entry
+    return entry
+
+
+def seed_manifest():
+    years = []
+    for year in list_seed_years():
+        entry = seed_bundle(year)
+        if entry:
+            years.append({
+                "year": year,
+                "hash": entry["hash"],
+                "url": f"/api/oscars/seeds/{entry['name']}",
+                "bytes": len(entry["body"]),
+            })
+    key = tuple(item["hash"] for item in years)
+    with SEED_BUNDLES_LOCK:
+        cached = SEED_BUNDLES.get("manifest")
+    if cached and cached["key"] == key:
+        return cached
+    body = json.dumps({"years": years}).encode("utf-8")
+    entry = {
+        "key": key,
+        "body": body,
+        "etag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        "last_modified": email.utils.formatdate(usegmt=True),
+        "encoded": {},
+    }
+    with SEED_BUNDLES_LOCK:
+        SEED_BUNDLES["manifest"] = entry
+    return entry
+
+
 def list_seed_years():
+    # Seed years only depend on file names, so the glob is redone only when the directory mtime moves.
+    try:
+        stamp = (str(OSCARS_DATA_DIR), OSCARS_DATA_DIR.stat().st_mtime_ns)
+    except OSError:
+        return []
+    cached = SEED_YEARS_CACHE.get("years")
+    if cached and cached[0] == stamp:
+        return list(cached[1])
     years = set()
-    if OSCARS_DATA_DIR.exists():
-        for item in OSCARS_DATA_DIR.glob("*.json"):
-            if item.name.lower() == "years.json":
-                continue
-            name = item.stem
-            if name.isdigit():
-                years.add(int(name))
-    return sorted(years, reverse=True)
+    for item in OSCARS_DATA_DIR.glob("*.json"):
+        if item.name.lower() == "years.json":
+            continue
+        name = item.stem
+        if name.isdigit():
+            years.add(int(name))
+    years = sorted(years, reverse=True)
+    SEED_YEARS_CACHE["years"] = (stamp, years)
+    return list(years)
 
 
 def list_db_years():
+    return [item["year"] for item in year_summary()]
+
+
+def year_summary():
     if not DB_PATH.exists():
         return []
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
+    conn = db_connect()
     try:
-        cur.execute("SELECT DISTINCT oscars_year FROM watchlist WHERE oscars_year IS NOT NULL;")
-        years = [row[0] for row in cur.fetchall() if row and row[0] is not None]
+        rows = conn.execute(
+            "SELECT oscars_year, rows, watched, runtime_minutes FROM year_summary "
+            "WHERE rows > 0 ORDER BY oscars_year DESC;"
+        ).fetchall()
     except sqlite3.Error:
-        years = []
+        rows = []
     conn.close()
-    return years
+    return [
+        {"year": year, "rows": count, "watched": watched, "runtime_minutes": runtime}
+        for year, count, watched, runtime in rows
+    ]
+
+
+def years_response():
+    check_data_version()
+    entry = YEARS_RESPONSE.get("entry")
+    seed_years = list_seed_years()
+    stamp = (RESPONSE_GENERATION, SEED_YEARS_CACHE.get("years", (None,))[0])
+    if entry and entry["stamp"] == stamp:
+        timing_add("cache", 0.0)
+        return entry
+    summary = year_summary()
+    years = sorted(set(seed_years) | {item["year"] for item in summary}, reverse=True)
+    body = json.dumps({"years": years, "summary": summary}).encode("utf-8")
+    entry = {
+        "stamp": stamp,
+        "body": body,
+        "etag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        "last_modified": email.utils.formatdate(usegmt=True),
+        "encoded": {},
+    }
+    YEARS_RESPONSE["entry"] = entry
+    return entry
+
+
+def ensure_year_summary(conn):
+    cur = conn.cursor()
+    cur.execute(
+        "CREATE TABLE IF NOT EXISTS year_summary ("
+        "oscars_year INTEGER PRIMARY KEY, rows INTEGER NOT NULL DEFAULT 0, "
+        "watched INTEGER NOT NULL DEFAULT 0, runtime_minutes INTEGER NOT NULL DEFAULT 0);"
+    )
+    for name in ("trg_year_summary_insert", "trg_year_summary_delete", "trg_year_summary_update"):
+        cur.execute(f"DROP TRIGGER IF EXISTS {name};")
+    for sql in YEAR_SUMMARY_TRIGGERS:
+        cur.execute(sql)
+    # Rebuilt on startup so rows written before the triggers existed are counted too.
+    cur.execute("DELETE FROM year_summary;")
+    cur.execute(
+        "INSERT INTO year_summary (oscars_year, rows, watched, runtime_minutes) "
+        "SELECT oscars_year, COUNT(1), SUM(CASE WHEN watched = 1 THEN 1 ELSE 0 END), "
+        "COALESCE(SUM(runtime_minutes), 0) FROM watchlist "
+        "WHERE oscars_year IS NOT NULL GROUP BY oscars_year;"
+    )
+    conn.commit()
+
+
+def film_key_for(item):
+    imdb_id = imdb_id_from_url(item.get("imdb_url")) or imdb_id_from_url(item.get("imdb_link"))
+    if imdb_id:
+        return imdb_id
+    key = normalize_title_key(item.get("title"))
+    if not key:
+        return None
+    # Seed imdb_url values are often search URLs, so remakes only differ by year.
+    year = normalize_int(item.get("oscars_year"))
+    return f"title:{key}:{year}" if year is not None else f"title:{key}"
+
+
+def distinct_films(rows):
+    films = {}
+    for row in rows:
+        item = dict(row)
+        key = item.get("film_key") or film_key_for(item)
+        if key and key not in films:
+            films[key] = item
+    return list(films.items())
+
+
+def load_film(cur, film_key):
+    if not film_key:
+        return None
+    row = cur.execute("SELECT * FROM films WHERE film_key = ?;", (film_key,)).fetchone()
+    if row is None:
+        return None
+    names = [d[0] for d in cur.description]
+    return dict(zip(names, row))
+
+
+def upsert_film(cur, film_key, item, fields):
+    if not film_key:
+        return
+    values = {
+        "film_key": film_key,
+        "imdb_id": imdb_id_from_url(item.get("imdb_url")) or imdb_id_from_url(item.get("imdb_link")),
+        "title": item.get("title"),
+        **fields,
+        "updated_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    cols = list(values.keys())
+    updates = ", ".join(f"{c} = COALESCE(excluded.{c}, {c})" for c in cols if c != "film_key")
+    cur.execute(
+        f"INSERT INTO films ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)}) "
+        f"ON CONFLICT(film_key) DO UPDATE SET {updates};",
+        list(values.values()),
+    )
+
+
+def apply_film_metadata(conn):
+    cur = conn.cursor()
+    poster_sets = ", ".join(
+        f"{c} = (SELECT f.{c} FROM films f WHERE f.film_key = watchlist.film_key)" for c in FILM_POSTER_FIELDS
+    )
+    cur.execute(
+        f"UPDATE watchlist SET {poster_sets} "
+        "WHERE (poster_url IS NULL OR poster_url = '') AND film_key IN "
+        "(SELECT film_key FROM films WHERE poster_url IS NOT NULL AND poster_url != '');"
+    )
+    cur.execute(
+        "UPDATE watchlist SET "
+        "runtime = COALESCE(NULLIF(runtime, ''), (SELECT f.runtime FROM films f WHERE f.film_key = watchlist.film_key)), "
+        "country = COALESCE(NULLIF(country, ''), (SELECT f.country FROM films f WHERE f.film_key = watchlist.film_key)) "
+        "WHERE (runtime IS NULL OR runtime = '' OR country IS NULL OR country = '') "
+        "AND film_key IN (SELECT film_key FROM films);"
+    )
+
+
+def ensure_facets(conn):
+    cur = conn.cursor()
+    created = not cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'watchlist_country';"
+    ).fetchone()
+    cur.execute(
+        "CREATE TABLE IF NOT EXISTS watchlist_country ("
+        "row_id INTEGER NOT NULL, country TEXT NOT NULL, PRIMARY KEY (row_id, country)) WITHOUT ROWID;"
+    )
+    cur.execute(
+        "CREATE TABLE IF NOT EXISTS watchlist_category ("
+        "row_id INTEGER NOT NULL, category TEXT NOT NULL, won INTEGER NOT NULL DEFAULT 0, "
+        "PRIMARY KEY (row_id, category)) WITHOUT ROWID;"
+    )
+    cur.execute("CREATE TABLE IF NOT EXISTS facet_dirty (row_id INTEGER PRIMARY KEY);")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_watchlist_country ON watchlist_country(country, row_id);")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_watchlist_category ON watchlist_category(category, won, row_id);")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_watchlist_year ON watchlist(oscars_year);")
+    # Recreated so a changed column list reaches databases created by older versions.
+    cur.execute("DROP TRIGGER IF EXISTS trg_facets_update;")
+    for sql in FACET_TRIGGERS:
+        cur.execute(sql)
+    if created:
+        cur.execute("INSERT OR IGNORE INTO facet_dirty (row_id) SELECT rowid FROM watchlist;")
+    cur.execute(
+        "INSERT OR IGNORE INTO facet_dirty (row_id) SELECT rowid FROM watchlist "
+        "WHERE runtime_minutes IS NULL AND runtime IS NOT NULL AND runtime != '';"
+    )
+    refresh_facets(conn)
+    conn.commit()
+
+
+def refresh_facets(conn):
+    # Triggers only flag changed rows; splitting the comma/semicolon strings and parsing runtime text into
+    # runtime_minutes (summed by year_summary) need the Python normalizers.
+    # Runs inside the caller's write transaction so readers never touch facet_dirty; the caller commits.
+    cur = conn.cursor()
+    rows = cur.execute(
+        "SELECT d.row_id, w.country, w.nominated_categories, w.won_categories, w.runtime "
+        "FROM facet_dirty d LEFT JOIN watchlist w ON w.rowid = d.row_id;"
+    ).fetchall()
+    if not rows:
+        return 0
+    ids = [(row[0],) for row in rows]
+    cur.executemany("DELETE FROM watchlist_country WHERE row_id = ?;", ids)
+    cur.executemany("DELETE FROM watchlist_category WHERE row_id = ?;", ids)
+    countries = []
+    categories = []
+    minutes = []
+    for row_id, country, nominated, won, runtime in rows:
+        value = parse_runtime_minutes(runtime)
+        minutes.append((value, row_id, value))
+        countries.extend((row_id, name) for name in split_countries(country))
+        won_list = split_categories(won)
+        won_set = set(won_list)
+        for name in merge_categories(split_categories(nominated), won_list):
+            categories.append((row_id, name, 1 if name in won_set else 0))
+    cur.executemany("INSERT OR IGNORE INTO watchlist_country (row_id, country) VALUES (?, ?);", countries)
+    cur.executemany(
+        "INSERT OR IGNORE INTO watchlist_category (row_id, category, won) VALUES (?, ?, ?);",
+        categories,
+    )
+    # Only rows whose value moved, so the year_summary trigger fires once per real change.
+    cur.executemany(
+        "UPDATE watchlist SET runtime_minutes = ? WHERE rowid = ? AND runtime_minutes IS NOT ?;",
+        minutes,
+    )
+    cur.executemany("DELETE FROM facet_dirty WHERE row_id = ?;", ids)
+    return len(rows)
+
+
+def ensure_search(conn):
+    # unicode61 with remove_diacritics 2 folds accents ("Amélie" matches "amelie"); "&" is indexed as "and" so
+    # "Fast & Furious" and "fast and furious" find the same rows.
+    cur = conn.cursor()
+    created = not cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'watchlist_fts';"
+    ).fetchone()
+    cur.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS watchlist_fts USING fts5({', '.join(SEARCH_FTS_COLUMNS)}, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3');"
+    )
+    for sql in SEARCH_TRIGGERS:
+        cur.execute(sql)
+    if created:
+        cur.execute(
+            f"INSERT INTO watchlist_fts (rowid, {', '.join(SEARCH_FTS_COLUMNS)}) "
+            "SELECT rowid, replace(COALESCE(title, ''), '&', ' and '), notes, where_to_watch, country FROM watchlist;"
+        )
+    conn.commit()
+
+
+def search_match_query(q):
+    tokens = re.findall(r"\w+", str(q or "").replace("&", " and "))
+    return " ".join(f'"{token}"*' for token in tokens[:16])
+
+
+def search_oscars(q, year=None, limit=20):
+    match = search_match_query(q)
+    if not match:
+        return []
+    limit = max(1, min(SEARCH_LIMIT_MAX, int(limit or 20)))
+    sql = (
+        "SELECT w.rowid AS id, w.*, bm25(watchlist_fts, 10.0, 2.0, 1.0, 1.0) AS rank, "
+        "snippet(watchlist_fts, -1, char(2), char(3), '…', 12) AS snippet "
+        "FROM watchlist_fts JOIN watchlist w ON w.rowid = watchlist_fts.rowid "
+        "WHERE watchlist_fts MATCH ?"
+    )
+    params = [match]
+    if year:
+        sql += " AND w.oscars_year = ?"
+        params.append(year)
+    sql += " ORDER BY rank LIMIT ?;"
+    params.append(limit)
+    conn = db_connect()
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+    index, names = poster_row_context()
+    out = []
+    for r in rows:
+        row = decorate_row(dict(r), index, names)
+        snippet = html.escape(row.get("snippet") or "")
+        row["snippet"] = snippet.replace("\x02", "<mark>").replace("\x03", "</mark>")
+        out.append(row)
+    return out
 
 
-def available_years():
-    years = set(list_seed_years())
-    years.update(list_db_years())
-    return sorted(years, reverse=True)
+def parse_facet_filters(query):
+    def flag(name):
+        value = query.get(name, [None])[0]
+        if value in (None, ""):
+            return None
+        return normalize_bool(value) == 1
+
+    filters = {
+        "country": [c for v in query.get("country", []) for c in split_countries(v)],
+        "category": [c for v in query.get("category", []) for c in split_categories(v)],
+        "won": flag("won"),
+        "watched": flag("watched"),
+    }
+    return filters if any(v not in (None, []) for v in filters.values()) else None
+
+
+def facet_where(year=None, filters=None, skip=None):
+    # Facet filters become indexed semi-joins on the junction tables; OR within a facet, AND across facets.
+    clauses = []
+    params = []
+    if year:
+        clauses.append("w.oscars_year = ?")
+        params.append(year)
+    filters = filters or {}
+    if filters.get("watched") is not None:
+        clauses.append("w.watched = ?" if filters["watched"] else "COALESCE(w.watched, 0) != ?")
+        params.append(1)
+    if filters.get("country") and skip != "country":
+        marks = ",".join("?" for _ in filters["country"])
+        clauses.append(f"w.rowid IN (SELECT row_id FROM watchlist_country WHERE country IN ({marks}))")
+        params.extend(filters["country"])
+    if (filters.get("category") or filters.get("won") is not None) and skip != "category":
+        inner = []
+        if filters.get("category"):
+            inner.append(f"category IN ({','.join('?' for _ in filters['category'])})")
+            params.extend(filters["category"])
+        if filters.get("won") is not None:
+            inner.append("won = ?")
+            params.append(1 if filters["won"] else 0)
+        clauses.append(f"w.rowid IN (SELECT row_id FROM watchlist_category WHERE {' AND '.join(inner)})")
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def oscars_facets(year=None, filters=None):
+    conn = db_connect()
+    try:
+        where, params = facet_where(year, filters)
+        total, watched = conn.execute(
+            f"SELECT COUNT(1), COALESCE(SUM(CASE WHEN w.watched = 1 THEN 1 ELSE 0 END), 0) FROM watchlist w{where};",
+            params,
+        ).fetchone()
+        where, params = facet_where(year, filters, skip="country")
+        countries = [
+            {"name": name, "count": count, "watched": seen}
+            for name, count, seen in conn.execute(
+                "SELECT c.country, COUNT(1), SUM(CASE WHEN w.watched = 1 THEN 1 ELSE 0 END) "
+                f"FROM watchlist_country c JOIN watchlist w ON w.rowid = c.row_id{where} "
+                "GROUP BY c.country ORDER BY COUNT(1) DESC, c.country;",
+                params,
+            ).fetchall()
+        ]
+        where, params = facet_where(year, filters, skip="category")
+        categories = [
+            {"name": name, "count": count, "won": won, "watched": seen}
+            for name, count, won, seen in conn.execute(
+                "SELECT k.category, COUNT(1), SUM(k.won), SUM(CASE WHEN w.watched = 1 THEN 1 ELSE 0 END) "
+                f"FROM watchlist_category k JOIN watchlist w ON w.rowid = k.row_id{where} "
+                "GROUP BY k.category;",
+                params,
+            ).fetchall()
+        ]
+    finally:
+        conn.close()
+    categories.sort(key=lambda c: (CANONICAL_ORDER.get(c["name"], 999), c["name"]))
+    return {
+        "year": year,
+        "filters": filters or {},
+        "total": total,
+        "watched": watched,
+        "countries": countries,
+        "categories": categories,
+    }
+
+
+def ensure_films(conn):
+    cur = conn.cursor()
+    cols_sql = ", ".join(f"{name} {ctype}" for name, ctype in FILM_COLUMNS)
+    cur.execute(f"CREATE TABLE IF NOT EXISTS films ({cols_sql});")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_watchlist_film_key ON watchlist(film_key);")
+    # Title keys written before they carried the year are re-keyed as well.
+    rows = cur.execute(
+        "SELECT rowid, title, imdb_url, imdb_link, oscars_year, film_key FROM watchlist "
+        "WHERE film_key IS NULL OR (film_key LIKE 'title:%' AND film_key NOT LIKE 'title:%:%');"
+    ).fetchall()
+    rekeyed = {}
+    for rowid, title, imdb_url, imdb_link, oscars_year, old_key in rows:
+        key = film_key_for({"title": title, "imdb_url": imdb_url, "imdb_link": imdb_link, "oscars_year": oscars_year})
+        cur.execute("UPDATE watchlist SET film_key = ? WHERE rowid = ?;", (key, rowid))
+        if old_key and key != old_key:
+            rekeyed.setdefault(old_key, set()).add(key)
+    for old_key, keys in rekeyed.items():
+        if len(keys) == 1:
+            cur.execute("UPDATE OR IGNORE films SET film_key = ? WHERE film_key = ?;", (keys.pop(), old_key))
+        # A key shared by several years may hold the wrong film; let enrichment refill it.
+        cur.execute("DELETE FROM films WHERE film_key = ?;", (old_key,))
+    if cur.execute("SELECT COUNT(1) FROM films;").fetchone()[0] == 0:
+        # Seed films from metadata that earlier versions stored only on watchlist rows.
+        sources = sorted(POSTER_PROXY_SOURCES)
+        enriched = cur.execute(
+            "SELECT film_key, title, imdb_url, imdb_link, runtime, country, "
+            f"{', '.join(FILM_POSTER_FIELDS)} FROM watchlist WHERE film_key IS NOT NULL "
+            f"AND (poster_source IN ({','.join('?' for _ in sources)}) "
+            "OR (runtime IS NOT NULL AND runtime != '') OR (country IS NOT NULL AND country != ''));",
+            sources,
+        ).fetchall()
+        for row in enriched:
+            film_key, title, imdb_url, imdb_link, runtime, country = row[:6]
+            poster = dict(zip(FILM_POSTER_FIELDS, row[6:]))
+            fields = {"runtime": clean_text(runtime), "country": clean_text(country)}
+            if poster.get("poster_source") in POSTER_PROXY_SOURCES:
+                fields.update(poster)
+            upsert_film(cur, film_key, {"title": title, "imdb_url": imdb_url, "imdb_link": imdb_link}, fields)
+    conn.commit()
 
 
 def ensure_db():
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_connect()
+    conn.execute("PRAGMA journal_mode=WAL;")
     cur = conn.cursor()
     cols_sql = ", ".join(f"{name} {ctype}" for name, ctype in COLUMNS)
     cur.execute(f"CREATE TABLE IF NOT EXISTS watchlist ({cols_sql});")
@@ -1211,11 +3020,20 @@ def ensure_db():
     for name, ctype in COLUMNS:
         if name not in existing:
             cur.execute(f"ALTER TABLE watchlist ADD COLUMN {name} {ctype};")
+    if "runtime_minutes" not in existing:
+        # Derived from runtime by refresh_facets, so it is not a seed column.
+        cur.execute("ALTER TABLE watchlist ADD COLUMN runtime_minutes INTEGER;")
     conn.commit()
 
     cur.execute("UPDATE watchlist SET oscars_year = ? WHERE oscars_year IS NULL;", (2026,))
     conn.commit()
 
+    ensure_films(conn)
+    ensure_facets(conn)
+    ensure_year_summary(conn)
+    ensure_search(conn)
+    ensure_seed_files(conn)
+
     years = list_seed_years()
     cur.execute("SELECT COUNT(1) FROM watchlist;")
     count = cur.fetchone()[0]
@@ -1234,64 +3052,245 @@ def ensure_db():
                     insert_seed(conn, rows, default_year=year)
     conn.close()
 
+def seed_row(item, default_year=None):
+    row = {}
+    for col, _ in COLUMNS:
+        val = item.get(col)
+        if val == "":
+            val = None
+        if col == "watched":
+            val = normalize_bool(val)
+        elif col == "rating_1_10":
+            val = normalize_float(val)
+        elif col == "nominations_number":
+            val = normalize_int(val)
+        elif col == "oscars_year":
+            val = normalize_int(val)
+            if val is None and default_year is not None:
+                val = int(default_year)
+        elif col == "film_key":
+            val = val or film_key_for({**item, "oscars_year": row["oscars_year"]})
+        row[col] = val
+    return row
+
+
 def insert_seed(conn, seed_rows, default_year=None):
     cols = [name for name, _ in COLUMNS]
     placeholders = ",".join("?" for _ in cols)
     rows = []
     for item in seed_rows:
-        row = []
-        for col in cols:
-            val = item.get(col)
-            if val == "":
-                val = None
-            if col == "watched":
-                val = normalize_bool(val)
-            elif col == "rating_1_10":
-                val = normalize_float(val)
-            elif col == "nominations_number":
-                val = normalize_int(val)
-            elif col == "oscars_year":
-                val = normalize_int(val)
-                if val is None and default_year is not None:
-                    val = int(default_year)
-            row.append(val)
-        rows.append(row)
+        row = seed_row(item, default_year=default_year)
+        rows.append([row[col] for col in cols])
 
     cur = conn.cursor()
     cur.executemany(
         f"INSERT INTO watchlist ({','.join(cols)}) VALUES ({placeholders});",
         rows,
     )
+    apply_film_metadata(conn)
+    refresh_facets(conn)
     conn.commit()
+    invalidate_responses()
 
-def fetch_all(year=None):
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-    if year:
-        rows = cur.execute(
-            "SELECT rowid AS id, * FROM watchlist WHERE oscars_year = ?;",
-            (year,),
-        ).fetchall()
-    else:
-        rows = cur.execute("SELECT rowid AS id, * FROM watchlist;").fetchall()
-    conn.close()
-    result = [dict(r) for r in rows]
+def poster_row_context():
+    t0 = time.perf_counter()
     index = build_local_poster_index()
+    names = poster_mirror_names()
+    timing_add("index", time.perf_counter() - t0)
+    return index, names
+
+
+def decorate_row(row, index, names):
     if index != ({}, []):
-        for row in result:
-            current = str(row.get("poster_url") or "")
-            if current.startswith("/posters/"):
-                name = urllib.parse.unquote(current[len("/posters/"):])
-                if name and (POSTERS_DIR / name).exists():
-                    row["poster_source"] = row.get("poster_source") or "local"
-                    continue
+        current = str(row.get("poster_url") or "")
+        name = urllib.parse.unquote(current[len("/posters/"):]) if current.startswith("/posters/") else None
+        if name and (POSTERS_DIR / name).exists():
+            row["poster_source"] = row.get("poster_source") or "local"
+        else:
             local_url = local_poster_url(row.get("title"), index)
             if local_url:
+                if local_url != current:
+                    row["poster_hash"] = None
+                    row["poster_lqip"] = None
+                    row["poster_color"] = None
                 row["poster_url"] = local_url
                 row["poster_source"] = "local"
+    srcset, thumb = poster_srcset(row.get("poster_hash"), names)
+    row["poster_srcset"] = srcset
+    row["poster_thumb_url"] = thumb
+    current = str(row.get("poster_url") or "")
+    if row.get("poster_source") in POSTER_PROXY_SOURCES and current.startswith(("http://", "https://")):
+        row["poster_remote_url"] = row.get("poster_remote_url") or current
+        row["poster_url"] = poster_proxy_register(current)
+    return row
+
+
+def select_rows(cur, year=None, filters=None):
+    if filters:
+        where, params = facet_where(year, filters)
+        return cur.execute(f"SELECT w.rowid AS id, w.* FROM watchlist w{where};", params)
+    if year:
+        return cur.execute(
+            "SELECT rowid AS id, * FROM watchlist WHERE oscars_year = ?;",
+            (year,),
+        )
+    return cur.execute("SELECT rowid AS id, * FROM watchlist;")
+
+
+def fetch_all(year=None, filters=None):
+    conn = db_connect()
+    conn.row_factory = sqlite3.Row
+    rows = select_rows(conn.cursor(), year, filters).fetchall()
+    conn.close()
+    index, names = poster_row_context()
+    t0 = time.perf_counter()
+    result = [decorate_row(dict(r), index, names) for r in rows]
+    timing_add("rows", time.perf_counter() - t0)
     return result
 
+
+def iter_rows(year=None, filters=None, batch=STREAM_BATCH_ROWS):
+    # Cursor-backed generator for streamed responses: only one batch of rows is alive at a time.
+    conn = db_connect()
+    conn.row_factory = sqlite3.Row
+    try:
+        cur = select_rows(conn.cursor(), year, filters)
+        index, names = poster_row_context()
+        while True:
+            rows = cur.fetchmany(batch)
+            if not rows:
+                break
+            for r in rows:
+                yield decorate_row(dict(r), index, names)
+    finally:
+        conn.close()
+
+
+def count_rows(year=None):
+    conn = db_connect()
+    try:
+        if year:
+            return conn.execute("SELECT COUNT(1) FROM watchlist WHERE oscars_year = ?;", (year,)).fetchone()[0]
+        return conn.execute("SELECT COUNT(1) FROM watchlist;").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def response_stamp():
+    # fetch_all also depends on the poster dirs (local matches, mirror srcsets); adding a file bumps the dir mtime.
+    stamp = []
+    for path in (POSTERS_DIR, POSTER_MIRROR_DIR):
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def check_data_version():
+    # PRAGMA data_version moves whenever another connection (any worker process, or a script) commits, which keeps
+    # the per-process response caches coherent under --workers.
+    with DATA_VERSION_LOCK:
+        conn = DATA_VERSION.get("conn")
+        if conn is None or DATA_VERSION.get("path") != DB_PATH:
+            if conn is not None:
+                conn.close()
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+            DATA_VERSION.update({"conn": conn, "path": DB_PATH, "value": None})
+        value = conn.execute("PRAGMA data_version;").fetchone()[0]
+        previous = DATA_VERSION["value"]
+        DATA_VERSION["value"] = value
+    if previous is not None and value != previous:
+        invalidate_responses()
+
+
+def invalidate_responses(year=None):
+    global RESPONSE_GENERATION
+    with RESPONSE_CACHE_LOCK:
+        RESPONSE_GENERATION += 1
+        if year:
+            RESPONSE_CACHE.pop(year, None)
+            RESPONSE_CACHE.pop(None, None)
+        else:
+            RESPONSE_CACHE.clear()
+
+
+def build_oscars_response(year):
+    with RESPONSE_CACHE_LOCK:
+        generation = RESPONSE_GENERATION
+    stamp = response_stamp()
+    rows = fetch_all(year)
+    t0 = time.perf_counter()
+    body = json.dumps({"rows": rows}).encode("utf-8")
+    timing_add("serialize", time.perf_counter() - t0)
+    entry = {
+        "stamp": stamp,
+        "body": body,
+        "etag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        "last_modified": email.utils.formatdate(usegmt=True),
+        "encoded": {},
+    }
+    with RESPONSE_CACHE_LOCK:
+        if RESPONSE_GENERATION == generation:
+            RESPONSE_CACHE[year] = entry
+    return entry
+
+
+def oscars_response(year=None):
+    # None means "too big to hold in memory": the caller streams rows from the cursor instead.
+    check_data_version()
+    stamp = response_stamp()
+    with RESPONSE_CACHE_LOCK:
+        entry = RESPONSE_CACHE.get(year)
+    if entry and entry["stamp"] == stamp:
+        timing_add("cache", 0.0)
+        return entry
+    if count_rows(year) > RESPONSE_CACHE_MAX_ROWS:
+        return None
+    with RESPONSE_CACHE_LOCK:
+        lock = RESPONSE_BUILD_LOCKS.setdefault(year, threading.Lock())
+    with lock:
+        with RESPONSE_CACHE_LOCK:
+            entry = RESPONSE_CACHE.get(year)
+        if entry and entry["stamp"] == stamp:
+            return entry
+        return build_oscars_response(year)
+
+
+def encoded_response(entry, accept_encoding):
+    body = entry["body"]
+    if len(body) < COMPRESS_MIN_BYTES:
+        return None, body
+    for encoding in accepted_encodings(accept_encoding):
+        data = entry["encoded"].get(encoding)
+        if data is None:
+            data = compress_bytes(body, encoding, dynamic=True)
+            if data is None:
+                continue
+            entry["encoded"][encoding] = data
+        return encoding, data
+    return None, body
+
+
+def warm_response_cache():
+    t0 = time.perf_counter()
+    built = 0
+    for year in [None] + list_db_years():
+        try:
+            entry = oscars_response(year)
+            if entry is None:
+                continue
+            for encoding in ("br", "gzip"):
+                encoded_response(entry, encoding)
+            built += 1
+        except Exception as exc:
+            log_line(f"response cache warm-up failed: {year or 'all'}: {exc}", tag="api", level="warn")
+    log_line(
+        f"Response cache warm: {built} responses in {(time.perf_counter() - t0) * 1000:.0f}ms",
+        tag="api",
+        level="info",
+    )
+
 def normalize_patch(patch: dict):
     out = {}
     if "watched" in patch:
@@ -1338,10 +3337,282 @@ def normalize_patch(patch: dict):
         else:
             out["poster_url"] = str(val)
             out["poster_source"] = "manual"
+        out["poster_remote_url"] = None
+        out["poster_hash"] = None
+        out["poster_lqip"] = None
+        out["poster_color"] = None
 
     return out
 
 
+def write_queue():
+    # One writer thread per process (workers fork after import, so key it by pid).
+    pid = os.getpid()
+    with WRITE_STATE_LOCK:
+        if WRITE_STATE.get("pid") != pid:
+            WRITE_STATE.clear()
+            WRITE_STATE["pid"] = pid
+            WRITE_STATE["queue"] = queue.Queue()
+        thread = WRITE_STATE.get("thread")
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(target=db_writer, args=(WRITE_STATE["queue"],), daemon=True)
+            thread.start()
+            WRITE_STATE["thread"] = thread
+        return WRITE_STATE["queue"]
+
+
+def writer_connect():
+    conn = sqlite3.connect(DB_PATH, factory=TracedConnection, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def take_write_batch(ops):
+    batch = [ops.get()]
+    deadline = time.perf_counter() + WRITE_BATCH_WINDOW
+    while len(batch) < WRITE_BATCH_MAX:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(ops.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def run_write_batch(conn, batch):
+    conn.execute("BEGIN IMMEDIATE;")
+    try:
+        for op in batch:
+            conn.execute("SAVEPOINT op;")
+            try:
+                op["result"] = op["fn"](conn)
+                conn.execute("RELEASE op;")
+            except Exception as exc:
+                conn.execute("ROLLBACK TO op;")
+                conn.execute("RELEASE op;")
+                op["error"] = exc
+        conn.execute("COMMIT;")
+        return True
+    except Exception as exc:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK;")
+        for op in batch:
+            op["result"] = None
+            op["error"] = exc
+        return False
+
+
+def db_writer(ops):
+    conn = None
+    conn_path = None
+    while True:
+        batch = take_write_batch(ops)
+        committed = False
+        try:
+            if conn is None or conn_path != DB_PATH:
+                if conn is not None:
+                    conn.close()
+                conn_path = DB_PATH
+                conn = writer_connect()
+            committed = run_write_batch(conn, batch)
+        except Exception as exc:
+            log_line(f"write batch failed: {exc}", tag="db", level="error")
+            if conn is not None:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            conn = None
+            for op in batch:
+                op["result"] = None
+                op["error"] = exc
+        finally:
+            # Callers block on done; nothing above may leave them waiting.
+            with WRITE_STATE_LOCK:
+                WRITE_STATS["ops"] += len(batch)
+                WRITE_STATS["commits"] += 1 if committed else 0
+                WRITE_STATS["errors"] += sum(1 for op in batch if op.get("error"))
+                WRITE_STATS["max_batch"] = max(WRITE_STATS["max_batch"], len(batch))
+            for op in batch:
+                op["done"].set()
+
+
+def submit_write(fn):
+    op = {"fn": fn, "done": threading.Event(), "result": None, "error": None}
+    t0 = time.perf_counter()
+    write_queue().put(op)
+    # Poll so a writer thread that died is restarted (write_queue checks liveness) instead of waiting forever.
+    while not op["done"].wait(WRITE_POLL_S):
+        if time.perf_counter() - t0 >= WRITE_TIMEOUT_S:
+            timing_add("write", time.perf_counter() - t0)
+            raise TimeoutError(f"write not applied after {WRITE_TIMEOUT_S:g}s")
+        write_queue()
+    timing_add("write", time.perf_counter() - t0)
+    if op["error"] is not None:
+        raise op["error"]
+    return op["result"]
+
+
+def write_stats():
+    with WRITE_STATE_LOCK:
+        stats = dict(WRITE_STATS)
+    stats["ops_per_commit"] = round(stats["ops"] / stats["commits"], 2) if stats["commits"] else None
+    return stats
+
+
+def debug_info():
+    info = dict(LAST_UPDATE)
+    info["db_path"] = str(DB_PATH)
+    info["provider_limits"] = provider_limits_snapshot()
+    info["writes"] = write_stats()
+    info["admission"] = admission_stats()
+    info["seed_reloads"] = SEED_RELOADS
+    return info
+
+
+def batch_call(target):
+    parsed = urlparse(str(target or ""))
+    path = parsed.path
+    query = urllib.parse.parse_qs(parsed.query)
+    year = parse_year(query.get("year", [None])[0])
+    if path == "/api/oscars/years":
+        summary = year_summary()
+        years = sorted(set(list_seed_years()) | {item["year"] for item in summary}, reverse=True)
+        return 200, {"years": years, "summary": summary}
+    if path == "/api/oscars":
+        if count_rows(year) > RESPONSE_CACHE_MAX_ROWS:
+            return 413, {"error": "Too many rows for a batch, use GET /api/oscars"}
+        return 200, {"rows": fetch_all(year, parse_facet_filters(query))}
+    if path == "/api/oscars/facets":
+        return 200, oscars_facets(year, parse_facet_filters(query))
+    if path == "/api/oscars/search":
+        q = query.get("q", [""])[0]
+        try:
+            results = search_oscars(q, year=year, limit=query.get("limit", [20])[0])
+        except ValueError:
+            return 400, {"error": "Invalid limit"}
+        except sqlite3.OperationalError as exc:
+            return 400, {"error": f"Invalid search: {exc}"}
+        return 200, {"q": q, "year": year, "count": len(results), "results": results}
+    if path == "/api/oscars/debug":
+        return 200, debug_info()
+    return 404, {"error": "Not found"}
+
+
+def run_batch(requests_list):
+    check_data_version()
+    conn = open_snapshot()
+    responses = []
+    READ_SNAPSHOT.conn = conn
+    try:
+        # Sequential on purpose: a sqlite3 connection shared across threads serialises on its mutex anyway.
+        for item in requests_list:
+            conn.row_factory = None
+            try:
+                status, body = batch_call(item.get("path"))
+            except Exception as exc:
+                status, body = 500, {"error": str(exc)}
+            responses.append({"id": item.get("id"), "path": item.get("path"), "status": status, "body": body})
+    finally:
+        READ_SNAPSHOT.conn = None
+        conn.release()
+    return responses
+
+
+def request_lane(command, path):
+    if not path.startswith("/api/") or path in ADMISSION_EXEMPT:
+        return None
+    if command == "POST" and path in BACKGROUND_PATHS:
+        return "background"
+    if command in {"GET", "POST"}:
+        return "interactive"
+    return None
+
+
+def lane_ready(lane):
+    if ADMISSION_STATS[lane]["in_flight"] >= ADMISSION_LANES[lane]["limit"]:
+        return False
+    # Background jobs only start once no interactive request is waiting for a slot.
+    return lane != "background" or ADMISSION_STATS["interactive"]["queued"] == 0
+
+
+def admit(lane):
+    conf = ADMISSION_LANES[lane]
+    stats = ADMISSION_STATS[lane]
+    t0 = time.perf_counter()
+    with ADMISSION_CV:
+        if not lane_ready(lane):
+            if stats["queued"] >= conf["queue"]:
+                stats["rejected"] += 1
+                return False
+            stats["queued"] += 1
+            try:
+                ready = ADMISSION_CV.wait_for(lambda: lane_ready(lane), timeout=conf["wait"])
+            finally:
+                stats["queued"] -= 1
+                ADMISSION_CV.notify_all()
+            if not ready:
+                stats["rejected"] += 1
+                return False
+        waited = time.perf_counter() - t0
+        stats["in_flight"] += 1
+        stats["admitted"] += 1
+        stats["wait_s"] += waited
+        stats["wait_max_s"] = max(stats["wait_max_s"], waited)
+    timing_add("queue", waited)
+    return True
+
+
+def release(lane):
+    with ADMISSION_CV:
+        ADMISSION_STATS[lane]["in_flight"] -= 1
+        ADMISSION_CV.notify_all()
+
+
+def interactive_idle():
+    stats = ADMISSION_STATS["interactive"]
+    return stats["in_flight"] == 0 and stats["queued"] == 0
+
+
+def background_yield(conn):
+    # Enrichment loops call this between batches: commit so queued row updates are not stuck behind our write
+    # lock, then stay out of the way while interactive requests are in flight (bounded, so jobs still progress).
+    if conn.in_transaction:
+        conn.commit()
+    t0 = time.perf_counter()
+    with ADMISSION_CV:
+        busy = not interactive_idle()
+        if busy:
+            ADMISSION_CV.wait_for(interactive_idle, timeout=BACKGROUND_YIELD_MAX)
+        BACKGROUND_YIELDS["yields"] += 1
+        if busy:
+            BACKGROUND_YIELDS["waited"] += 1
+            BACKGROUND_YIELDS["wait_s"] += time.perf_counter() - t0
+
+
+def admission_stats():
+    with ADMISSION_CV:
+        lanes = {}
+        for lane, stats in ADMISSION_STATS.items():
+            admitted = stats["admitted"]
+            lanes[lane] = {
+                "limit": ADMISSION_LANES[lane]["limit"],
+                "in_flight": stats["in_flight"],
+                "queued": stats["queued"],
+                "admitted": admitted,
+                "rejected": stats["rejected"],
+                "wait_ms_avg": round(stats["wait_s"] * 1000 / admitted, 2) if admitted else 0.0,
+                "wait_ms_max": round(stats["wait_max_s"] * 1000, 2),
+            }
+        yields = dict(BACKGROUND_YIELDS)
+    yields["wait_s"] = round(yields["wait_s"], 3)
+    return {"lanes": lanes, "background_yields": yields}
+
+
 def update_row(row_id, patch):
     if row_id is None:
         return None
@@ -1349,20 +3620,243 @@ def update_row(row_id, patch):
     if not fields:
         return None
 
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
     assignments = ", ".join(f"{k} = ?" for k in fields.keys())
     values = list(fields.values()) + [row_id]
-    cur.execute(f"UPDATE watchlist SET {assignments} WHERE rowid = ?;", values)
-    conn.commit()
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-    row = cur.execute(
-        "SELECT rowid AS id, * FROM watchlist WHERE rowid = ?;",
-        (row_id,),
-    ).fetchone()
-    conn.close()
-    return dict(row) if row else None
+
+    def apply(conn):
+        conn.execute(f"UPDATE watchlist SET {assignments} WHERE rowid = ?;", values)
+        refresh_facets(conn)
+        row = conn.execute(
+            "SELECT rowid AS id, * FROM watchlist WHERE rowid = ?;",
+            (row_id,),
+        ).fetchone()
+        return dict(row) if row else None
+
+    row = submit_write(apply)
+    invalidate_responses(row["oscars_year"] if row else None)
+    return row
+
+
+def static_etag(path, st=None):
+    st = st or path.stat()
+    key = str(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with STATIC_ETAGS_LOCK:
+        cached = STATIC_ETAGS.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    etag = f'"{digest.hexdigest()}"'
+    with STATIC_ETAGS_LOCK:
+        STATIC_ETAGS[key] = (stamp, etag)
+    return etag
+
+
+def is_fingerprinted(name):
+    name = name or ""
+    if FINGERPRINT_HEX_RE.search(name):
+        return True
+    match = FINGERPRINT_TOKEN_RE.search(name)
+    if not match:
+        return False
+    # Words like "Conclave" or "Brutalist" are not hashes: a token has to mix letters and digits.
+    token = match.group(1)
+    return any(c.isdigit() for c in token) and any(c.isalpha() for c in token)
+
+
+def static_cache_control(path):
+    # Posters can be replaced in place, so they never get the immutable policy whatever their name looks like.
+    if path.parent == POSTERS_DIR:
+        return STATIC_CACHE_POSTERS
+    if is_fingerprinted(path.name):
+        return STATIC_CACHE_IMMUTABLE
+    return STATIC_CACHE_DEFAULT
+
+
+def etag_matches(header, etag):
+    if not header:
+        return False
+    header = header.strip()
+    if header == "*":
+        return True
+    for part in header.split(","):
+        tag = part.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def parse_range(header, size):
+    # Returns (start, end) inclusive, None for "serve full body", or False for unsatisfiable.
+    if not header:
+        return None
+    m = re.match(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", header)
+    if not m:
+        return None
+    first, last = m.group(1), m.group(2)
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            return False
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+
+def is_compressible(path):
+    return path.suffix.lower() in COMPRESSIBLE_EXTS
+
+
+def accepted_encodings(header):
+    accepted = {}
+    for part in (header or "").split(","):
+        bits = [b.strip() for b in part.split(";")]
+        name = bits[0].lower()
+        if not name:
+            continue
+        q = 1.0
+        for bit in bits[1:]:
+            if bit.startswith("q="):
+                try:
+                    q = float(bit[2:])
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    out = []
+    for name in ("br", "gzip"):
+        q = accepted.get(name, accepted.get("*", 0.0))
+        if q > 0:
+            out.append((q, name))
+    out.sort(key=lambda item: -item[0])
+    return [name for _, name in out]
+
+
+def compress_bytes(data, encoding, dynamic=False):
+    # Max levels for static assets compressed once; cheaper levels for API bodies rebuilt after writes.
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6 if dynamic else 9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=5 if dynamic else 11)
+    return None
+
+
+def static_sidecar(path, st, encoding):
+    ext = ".br" if encoding == "br" else ".gz"
+    sidecar = path.with_name(path.name + ext)
+    try:
+        side_st = sidecar.stat()
+    except OSError:
+        return None
+    # Sidecars are stamped with the source mtime; gzip also records the source size in its trailer.
+    if side_st.st_mtime_ns != st.st_mtime_ns:
+        return None
+    if encoding != "br" and gzip_source_size(sidecar) != st.st_size % (1 << 32):
+        return None
+    if encoding == "br" and not static_sidecar(path, st, "gzip"):
+        return None
+    return sidecar
+
+
+def gzip_source_size(path):
+    try:
+        with path.open("rb") as f:
+            f.seek(-4, os.SEEK_END)
+            return int.from_bytes(f.read(4), "little")
+    except OSError:
+        return None
+
+
+def compressed_static(path, st, encoding):
+    key = (str(path), encoding)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with COMPRESSED_CACHE_LOCK:
+        cached = COMPRESSED_CACHE.get(key)
+        if cached and cached[0] == stamp:
+            COMPRESSED_CACHE.move_to_end(key)
+            return cached[1]
+    data = compress_bytes(path.read_bytes(), encoding)
+    if data is None or len(data) > COMPRESSED_CACHE_MAX_BYTES:
+        return data
+    with COMPRESSED_CACHE_LOCK:
+        COMPRESSED_CACHE[key] = (stamp, data)
+        COMPRESSED_CACHE.move_to_end(key)
+        total = sum(len(v[1]) for v in COMPRESSED_CACHE.values())
+        while total > COMPRESSED_CACHE_MAX_BYTES and COMPRESSED_CACHE:
+            _, (_, dropped) = COMPRESSED_CACHE.popitem(last=False)
+            total -= len(dropped)
+    return data
+
+
+def select_static_variant(path, st, accept_encoding):
+    if st.st_size < COMPRESS_MIN_BYTES:
+        return None, None, None
+    encodings = accepted_encodings(accept_encoding)
+    for encoding in encodings:
+        sidecar = static_sidecar(path, st, encoding)
+        if sidecar:
+            return encoding, sidecar, None
+    for encoding in encodings:
+        body = compressed_static(path, st, encoding)
+        if body is not None and len(body) < st.st_size:
+            return encoding, None, body
+    return None, None, None
+
+
+def precompress_candidates(root=ROOT):
+    for path in sorted(root.iterdir()):
+        if path.is_file() and path.suffix.lower() in PRECOMPRESS_ROOT_EXTS:
+            yield path
+    for name in PRECOMPRESS_DIRS:
+        for dirpath, dirnames, filenames in os.walk(root / name):
+            dirnames[:] = [d for d in dirnames if d not in PRECOMPRESS_SKIP_DIRS and not d.startswith(".")]
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                if is_compressible(path):
+                    yield path
+
+
+def precompress_static_assets(root=ROOT):
+    written = 0
+    fresh = 0
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+    for path in precompress_candidates(root):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if st.st_size < COMPRESS_MIN_BYTES:
+            continue
+        data = None
+        for encoding in encodings:
+            if static_sidecar(path, st, encoding):
+                fresh += 1
+                continue
+            if data is None:
+                data = path.read_bytes()
+            out = compress_bytes(data, encoding)
+            if out is None or len(out) >= st.st_size:
+                continue
+            ext = ".br" if encoding == "br" else ".gz"
+            sidecar = path.with_name(path.name + ext)
+            tmp = sidecar.with_name(sidecar.name + ".tmp")
+            try:
+                tmp.write_bytes(out)
+                os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+                os.replace(tmp, sidecar)
+                written += 1
+            except OSError as exc:
+                log_line(f"precompress failed: {path.name}: {exc}", tag="api", level="warn")
+    return {"written": written, "fresh": fresh, "encodings": encodings}
 
 
 class Handler(SimpleHTTPRequestHandler):
@@ -1383,62 +3877,426 @@ class Handler(SimpleHTTPRequestHandler):
             pass
         super().log_message(format, *args)
 
+    def handle_one_request(self):
+        timing_reset()
+        self.profiler = None
+        self.profile_id = None
+        self.lane = None
+        t0 = time.perf_counter()
+        try:
+            super().handle_one_request()
+        finally:
+            if self.lane:
+                release(self.lane)
+                self.lane = None
+            if self.profiler:
+                self.profiler.disable()
+                PROFILE_LOCK.release()
+                profile_save(self.profiler, self.profile_id, time.perf_counter() - t0)
+                self.profiler = None
+
+    def parse_request(self):
+        if not super().parse_request():
+            return False
+        path = urlparse(self.path).path
+        lane = request_lane(self.command, path)
+        if lane:
+            if not admit(lane):
+                self.send_overloaded(lane)
+                return False
+            self.lane = lane
+        if profile_wanted(path, self.headers.get("X-Profile")) and PROFILE_LOCK.acquire(blocking=False):
+            self.profile_id = profile_id_for(self.command, path)
+            self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+            except ValueError:
+                self.profiler = None
+                PROFILE_LOCK.release()
+        return True
+
+    def send_overloaded(self, lane):
+        # The request body (if any) is left unread, so the connection cannot be reused.
+        self.close_connection = True
+        data = json.dumps({"error": "Server busy, retry later", "lane": lane}).encode("utf-8")
+        self.send_response(503)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Retry-After", str(ADMISSION_LANES[lane]["retry_after"]))
+        self.send_header("Connection", "close")
+        self.send_header("Cache-Control", "no-store, max-age=0")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "Retry-After")
+        self.end_headers()
+        self.wfile.write(data)
+
     def send_json(self, payload, status=200):
+        t0 = time.perf_counter()
         data = json.dumps(payload).encode("utf-8")
+        timing_add("serialize", time.perf_counter() - t0)
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(data)))
+        self.send_header("Server-Timing", server_timing_header())
+        self.send_header("Timing-Allow-Origin", "*")
+        if self.profiler:
+            self.send_header("X-Profile-Id", self.profile_id)
+            self.send_header("Access-Control-Expose-Headers", "X-Profile-Id")
         self.send_header("Cache-Control", "no-store, max-age=0")
         self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, X-Profile")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_cached_json(self, entry, cache_control="no-cache"):
+        if etag_matches(self.headers.get("If-None-Match"), entry["etag"]):
+            self.send_not_modified(entry["etag"], cache_control, entry["last_modified"], vary=True)
+            return
+        encoding, data = encoded_response(entry, self.headers.get("Accept-Encoding"))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("ETag", entry["etag"])
+        self.send_header("Last-Modified", entry["last_modified"])
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Server-Timing", server_timing_header())
+        self.send_header("Timing-Allow-Origin", "*")
+        if self.profiler:
+            self.send_header("X-Profile-Id", self.profile_id)
+            self.send_header("Access-Control-Expose-Headers", "X-Profile-Id")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, X-Profile")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
         self.end_headers()
         self.wfile.write(data)
 
+    def write_stream(self, data, chunked, head=b"", last=False):
+        # One send per chunk: a headers-only or terminator-only segment would wait out Nagle + delayed ACK.
+        if chunked:
+            if data:
+                data = f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n"
+            if last:
+                data += b"0\r\n\r\n"
+        if head or data:
+            self.wfile.write(head + data)
+
+    def send_json_stream(self, year, filters=None, ndjson=False):
+        rows = iter_rows(year, filters)
+        # Pull the first row before the status line so a failing query still becomes a JSON 500.
+        first = next(rows, None)
+        gzipped = "gzip" in accepted_encodings(self.headers.get("Accept-Encoding"))
+        chunked = self.request_version == "HTTP/1.1"
+        count = 0
+        try:
+            try:
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (AttributeError, OSError):
+                pass
+            if chunked:
+                self.protocol_version = "HTTP/1.1"
+            self.send_response(200)
+            content_type = NDJSON_TYPE if ndjson else "application/json"
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            if chunked:
+                self.send_header("Transfer-Encoding", "chunked")
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Vary", "Accept, Accept-Encoding")
+            self.send_header("Cache-Control", "no-store, max-age=0")
+            self.send_header("Connection", "close")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type, X-Profile")
+            self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+            # Hold the header block back and send it with the first chunk instead of end_headers().
+            head = b"".join(self._headers_buffer) + b"\r\n"
+            self._headers_buffer = []
+            self.close_connection = True
+
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzipped else None
+            parts = [] if ndjson else ['{"rows": [']
+            size = 0
+            row = first
+            while row is not None:
+                text = json.dumps(row)
+                if ndjson:
+                    parts.append(text + "\n")
+                else:
+                    parts.append(", " + text if count else text)
+                count += 1
+                size += len(text)
+                if size >= STREAM_CHUNK_BYTES:
+                    data = "".join(parts).encode("utf-8")
+                    if compressor:
+                        data = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                    self.write_stream(data, chunked, head)
+                    head, parts, size = b"", [], 0
+                row = next(rows, None)
+            if not ndjson:
+                parts.append("]}")
+            data = "".join(parts).encode("utf-8")
+            if compressor:
+                data = compressor.compress(data) + compressor.flush()
+            self.write_stream(data, chunked, head, last=True)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except Exception as exc:
+            log_line(f"stream aborted after {count} rows: {exc}", tag="api", level="error")
+        finally:
+            rows.close()
+
+    def send_static(self, head_only=False, fs_path=None, cache_control=None):
+        fs_path = fs_path or Path(self.translate_path(self.path))
+        if fs_path.is_dir() and urlparse(self.path).path.endswith("/"):
+            index = fs_path / "index.html"
+            if index.is_file():
+                fs_path = index
+        if not fs_path.is_file():
+            if head_only:
+                super().do_HEAD()
+            else:
+                super().do_GET()
+            return
+        compressible = is_compressible(fs_path)
+        try:
+            f = fs_path.open("rb")
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+        try:
+            st = os.fstat(f.fileno())
+            etag = static_etag(fs_path, st)
+            cache_control = cache_control or static_cache_control(fs_path)
+            last_modified = self.date_time_string(st.st_mtime)
+
+            encoding, sidecar, body = None, None, None
+            if compressible:
+                encoding, sidecar, body = select_static_variant(
+                    fs_path, st, self.headers.get("Accept-Encoding")
+                )
+            if encoding:
+                etag = f'{etag[:-1]}-{encoding}"'
+            if sidecar:
+                f.close()
+                f = sidecar.open("rb")
+                size = os.fstat(f.fileno()).st_size
+            elif body is not None:
+                size = len(body)
+            else:
+                size = st.st_size
+
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_not_modified(etag, cache_control, last_modified, compressible)
+                return
+            if not self.headers.get("If-None-Match") and self.headers.get("If-Modified-Since"):
+                try:
+                    since = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+                except (TypeError, ValueError, IndexError, OverflowError):
+                    since = None
+                if since is not None and int(st.st_mtime) <= since.timestamp():
+                    self.send_not_modified(etag, cache_control, last_modified, compressible)
+                    return
+
+            byte_range = None
+            if not encoding:
+                byte_range = parse_range(self.headers.get("Range"), size)
+                if_range = self.headers.get("If-Range")
+                if byte_range and if_range and if_range.strip() != etag:
+                    byte_range = None
+            if byte_range is False:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            if byte_range:
+                start, end = byte_range
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            else:
+                start, end = 0, size - 1
+                self.send_response(200)
+            count = end - start + 1 if size else 0
+            self.send_header("Content-Type", self.guess_type(str(fs_path)))
+            self.send_header("Content-Length", str(count))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if compressible:
+                self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("ETag", etag)
+            if not encoding:
+                self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            if head_only or count <= 0:
+                return
+            if body is not None:
+                self.wfile.write(body)
+                return
+            # socket.sendfile uses os.sendfile where available and falls back to send() elsewhere.
+            self.connection.sendfile(f, offset=start, count=count)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            f.close()
+
+    def send_not_modified(self, etag, cache_control, last_modified, vary=False):
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Last-Modified", last_modified)
+        if vary:
+            self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+
     def do_OPTIONS(self):
         self.send_response(204)
         self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, X-Profile")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
         self.end_headers()
 
+    def poster_fs_path(self, path):
+        rel = urllib.parse.unquote(path[len("/posters/"):])
+        root = POSTERS_DIR.resolve()
+        target = (root / rel).resolve()
+        if target != root and root not in target.parents:
+            return None
+        return target
+
     def do_GET(self):
         parsed = urlparse(self.path)
         path = parsed.path
+        if path.startswith("/posters/remote/"):
+            self.send_proxy_poster(path[len("/posters/remote/"):])
+            return
         if path.startswith("/posters/"):
+            fs_path = self.poster_fs_path(path)
+            if not fs_path:
+                self.send_error(404, "File not found")
+                return
             self.path = f"/public{path}"
-            super().do_GET()
+            self.send_static(fs_path=fs_path)
             return
         if path == "/api/oscars/years":
             try:
-                years = available_years()
-                self.send_json({"years": years})
+                self.send_cached_json(years_response())
+            except Exception as exc:
+                self.send_json({"error": str(exc)}, status=500)
+            return
+        if path == "/api/oscars/seeds":
+            try:
+                self.send_cached_json(seed_manifest())
             except Exception as exc:
                 self.send_json({"error": str(exc)}, status=500)
             return
+        if path.startswith("/api/oscars/seeds/"):
+            name = path[len("/api/oscars/seeds/"):]
+            match = SEED_BUNDLE_RE.match(name)
+            entry = seed_bundle(int(match.group(1))) if match else None
+            if not entry or entry["name"] != name:
+                self.send_json({"error": "Not found"}, status=404)
+                return
+            self.send_cached_json(entry, cache_control=STATIC_CACHE_IMMUTABLE)
+            return
         if path == "/api/oscars":
             try:
                 query = urllib.parse.parse_qs(parsed.query)
                 year = parse_year(query.get("year", [None])[0])
-                rows = fetch_all(year)
-                self.send_json({"rows": rows})
+                filters = parse_facet_filters(query)
+                ndjson = NDJSON_TYPE in (self.headers.get("Accept") or "") or query.get("format", [""])[0] == "ndjson"
+                stream = str(query.get("stream", [""])[0]).lower() in {"1", "true", "yes"}
+                entry = None if ndjson or stream or filters else oscars_response(year)
+                if entry is None:
+                    self.send_json_stream(year, filters=filters, ndjson=ndjson)
+                else:
+                    self.send_cached_json(entry)
+            except Exception as exc:
+                self.send_json({"error": str(exc)}, status=500)
+            return
+        if path == "/api/oscars/search":
+            try:
+                query = urllib.parse.parse_qs(parsed.query)
+                q = query.get("q", [""])[0]
+                year = parse_year(query.get("year", [None])[0])
+                results = search_oscars(q, year=year, limit=query.get("limit", [20])[0])
+                self.send_json({"q": q, "year": year, "count": len(results), "results": results})
+            except ValueError:
+                self.send_json({"error": "Invalid limit"}, status=400)
+            except sqlite3.OperationalError as exc:
+                self.send_json({"error": f"Invalid search: {exc}"}, status=400)
+            except Exception as exc:
+                self.send_json({"error": str(exc)}, status=500)
+            return
+        if path == "/api/oscars/facets":
+            try:
+                query = urllib.parse.parse_qs(parsed.query)
+                year = parse_year(query.get("year", [None])[0])
+                self.send_json(oscars_facets(year, parse_facet_filters(query)))
             except Exception as exc:
                 self.send_json({"error": str(exc)}, status=500)
             return
         if path == "/api/oscars/debug":
-            info = dict(LAST_UPDATE)
-            info["db_path"] = str(DB_PATH)
-            self.send_json(info)
+            self.send_json(debug_info())
             return
-        super().do_GET()
+        if path == "/api/oscars/profile":
+            query = urllib.parse.parse_qs(parsed.query)
+            profile_id = query.get("id", [None])[0]
+            if not profile_id:
+                self.send_json({"profiles": profile_list()})
+                return
+            report = profile_report(profile_id, sort=query.get("sort", ["cumulative"])[0])
+            if report is None:
+                self.send_json({"error": "Profile not found"}, status=404)
+                return
+            self.send_json({"id": profile_id, "report": report})
+            return
+        self.send_static()
+
+    def send_proxy_poster(self, digest, head_only=False):
+        if not re.fullmatch(r"[0-9a-f]{20}", digest or ""):
+            self.send_error(404, "File not found")
+            return
+        try:
+            cached = poster_proxy_file(digest)
+        except Exception as exc:
+            log_line(f"poster proxy error: {digest}: {exc}", tag="api", level="warn")
+            self.send_error(502, "Upstream poster fetch failed")
+            return
+        if not cached:
+            self.send_error(404, "File not found")
+            return
+        self.send_static(head_only=head_only, fs_path=cached, cache_control=STATIC_CACHE_IMMUTABLE)
+
+    def do_HEAD(self):
+        path = urlparse(self.path).path
+        if path.startswith("/posters/remote/"):
+            self.send_proxy_poster(path[len("/posters/remote/"):], head_only=True)
+            return
+        if path.startswith("/posters/"):
+            fs_path = self.poster_fs_path(path)
+            if not fs_path:
+                self.send_error(404, "File not found")
+                return
+            self.path = f"/public{path}"
+            self.send_static(head_only=True, fs_path=fs_path)
+            return
+        self.send_static(head_only=True)
 
     def do_POST(self):
         path = urlparse(self.path).path
         if path not in {
+            "/api/batch",
             "/api/oscars/update",
             "/api/oscars/reset",
             "/api/oscars/posters",
             "/api/oscars/details",
+            "/api/oscars/mirror",
             "/api/oscars/winners",
         }:
             self.send_json({"error": "Not found"}, status=404)
@@ -1453,6 +4311,17 @@ class Handler(SimpleHTTPRequestHandler):
             return
 
         try:
+            if path == "/api/batch":
+                items = payload.get("requests") if isinstance(payload, dict) else None
+                if not isinstance(items, list) or not items or not all(isinstance(i, dict) for i in items):
+                    self.send_json({"error": "Expected a non-empty requests list"}, status=400)
+                    return
+                if len(items) > BATCH_MAX_REQUESTS:
+                    self.send_json({"error": f"At most {BATCH_MAX_REQUESTS} requests per batch"}, status=400)
+                    return
+                self.send_json({"responses": run_batch(items)})
+                return
+
             if path == "/api/oscars/posters":
                 limit = int(payload.get("limit") or 25)
                 force = bool(payload.get("force"))
@@ -1469,6 +4338,14 @@ class Handler(SimpleHTTPRequestHandler):
                 self.send_json({"ok": True, **result})
                 return
 
+            if path == "/api/oscars/mirror":
+                limit = int(payload.get("limit") or 25)
+                force = bool(payload.get("force"))
+                year = parse_year(payload.get("year"))
+                result = update_poster_mirror(limit=limit, force=force, year=year)
+                self.send_json({"ok": True, **result})
+                return
+
             if path == "/api/oscars/winners":
                 force = bool(payload.get("force"))
                 year = parse_year(payload.get("year"))
@@ -1508,7 +4385,7 @@ class Handler(SimpleHTTPRequestHandler):
 
 def reset_db(year=None):
     year = parse_year(year)
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_connect()
     cur = conn.cursor()
 
     if year:
@@ -1518,6 +4395,7 @@ def reset_db(year=None):
             insert_seed(conn, rows, default_year=year)
         conn.commit()
         conn.close()
+        invalidate_responses(year)
         return len(rows)
 
     cur.execute("DELETE FROM watchlist;")
@@ -1530,17 +4408,275 @@ def reset_db(year=None):
             total += len(rows)
     conn.commit()
     conn.close()
+    invalidate_responses()
     return total
 
-def run():
+def ensure_seed_files(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS seed_files (oscars_year INTEGER PRIMARY KEY, sha1 TEXT);")
+    conn.commit()
+
+
+def sync_seed_year(conn, year, seed_rows):
+    cols = [name for name, _ in COLUMNS]
+    cur = conn.cursor()
+    existing = {}
+    for values in cur.execute(
+        f"SELECT rowid, {', '.join(cols)} FROM watchlist WHERE oscars_year = ? ORDER BY rowid;",
+        (year,),
+    ).fetchall():
+        row = dict(zip(["id"] + cols, values))
+        existing.setdefault(normalize_title_key(row["title"]), []).append(row)
+
+    counts = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+    inserts = []
+    for item in seed_rows:
+        new = seed_row(item, default_year=year)
+        new["oscars_year"] = year
+        matches = existing.get(normalize_title_key(new["title"]))
+        if not matches:
+            inserts.append([new[col] for col in cols])
+            continue
+        current = matches.pop(0)
+        changes = {}
+        for col in cols:
+            if col in SEED_USER_COLUMNS or col == "oscars_year":
+                continue
+            if new[col] is None and col in SEED_FILL_COLUMNS:
+                continue
+            if new[col] != current[col]:
+                changes[col] = new[col]
+        if not changes:
+            counts["unchanged"] += 1
+            continue
+        assignments = ", ".join(f"{k} = ?" for k in changes)
+        cur.execute(
+            f"UPDATE watchlist SET {assignments} WHERE rowid = ?;",
+            list(changes.values()) + [current["id"]],
+        )
+        counts["updated"] += 1
+
+    stale = [(row["id"],) for rows in existing.values() for row in rows]
+    if stale:
+        cur.executemany("DELETE FROM watchlist WHERE rowid = ?;", stale)
+        counts["deleted"] = len(stale)
+    if inserts:
+        cur.executemany(
+            f"INSERT INTO watchlist ({','.join(cols)}) VALUES ({','.join('?' for _ in cols)});",
+            inserts,
+        )
+        counts["inserted"] = len(inserts)
+    if inserts or counts["updated"]:
+        apply_film_metadata(conn)
+    refresh_facets(conn)
+    return counts
+
+
+def reload_seed_year(year):
+    path = OSCARS_DATA_DIR / f"{year}.json"
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha1(raw).hexdigest()
+    conn = db_connect()
+    try:
+        cur = conn.cursor()
+        known = cur.execute("SELECT sha1 FROM seed_files WHERE oscars_year = ?;", (year,)).fetchone()
+        if known and known[0] == digest:
+            return None
+        has_rows = cur.execute("SELECT 1 FROM watchlist WHERE oscars_year = ? LIMIT 1;", (year,)).fetchone()
+        if known is None and has_rows:
+            # First sighting of a year that is already loaded: remember the file, diff on the next edit.
+            cur.execute("INSERT INTO seed_files (oscars_year, sha1) VALUES (?, ?);", (year, digest))
+            conn.commit()
+            return None
+        try:
+            seed_rows = seed_rows_from(json.loads(raw.decode("utf-8")))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            log_line(f"seed reload skipped: {path.name}: {exc}", tag="api", level="warn")
+            return None
+        counts = sync_seed_year(conn, year, seed_rows)
+        cur.execute(
+            "INSERT INTO seed_files (oscars_year, sha1) VALUES (?, ?) "
+            "ON CONFLICT(oscars_year) DO UPDATE SET sha1 = excluded.sha1;",
+            (year, digest),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    if counts["inserted"] or counts["updated"] or counts["deleted"]:
+        invalidate_responses(year)
+    SEED_RELOADS[year] = {**counts, "at": datetime.now().isoformat(timespec="seconds")}
+    log_line(
+        f"seed reload {year}: +{counts['inserted']} ~{counts['updated']} -{counts['deleted']}",
+        tag="api",
+        level="success",
+    )
+    return counts
+
+
+def poll_seed_files():
+    for year in list_seed_years():
+        try:
+            st = (OSCARS_DATA_DIR / f"{year}.json").stat()
+        except OSError:
+            continue
+        stamp = (st.st_mtime_ns, st.st_size)
+        if SEED_STAMPS.get(year) == stamp:
+            continue
+        SEED_STAMPS[year] = stamp
+        try:
+            reload_seed_year(year)
+        except Exception as exc:
+            SEED_STAMPS.pop(year, None)
+            log_line(f"seed reload failed: {year}: {exc}", tag="api", level="error")
+
+
+def watch_seed_files():
+    while True:
+        try:
+            poll_seed_files()
+        except Exception as exc:
+            log_line(f"seed watcher poll failed: {exc}", tag="api", level="error")
+        time.sleep(SEED_WATCH_INTERVAL)
+
+
+def start_seed_watcher():
+    if SEED_WATCH_INTERVAL > 0:
+        threading.Thread(target=watch_seed_files, daemon=True).start()
+
+
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def serve_worker(host, port, worker, ready_fd=None):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    DATA_VERSION.clear()
+    server = ReusePortHTTPServer((host, port), Handler)
+    if ready_fd is not None:
+        os.write(ready_fd, b"1")
+        os.close(ready_fd)
+    log_line(f"Worker {worker} ready (pid {os.getpid()})", tag="api", level="dim")
+    threading.Thread(target=warm_response_cache, daemon=True).start()
+    if worker == 0:
+        start_seed_watcher()
+    server.serve_forever()
+
+
+def spawn_worker(host, port, worker, ready_fd=None):
+    pid = os.fork()
+    if pid:
+        return pid
+    code = 0
+    try:
+        serve_worker(host, port, worker, ready_fd)
+    except BaseException as exc:
+        log_line(f"Worker {worker} crashed: {exc}", tag="api", level="error")
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def run_workers(host, port, workers, on_ready=None):
+    # Each worker binds its own SO_REUSEPORT socket so the kernel spreads connections across processes.
+    # The supervisor keeps a bound (not listening) socket to pin the port when port 0 was requested.
+    probe = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    probe.bind((host, port))
+    host, port = probe.getsockname()[:2]
+    pids = {}
+    ready_r, ready_w = os.pipe()
+    for worker in range(workers):
+        pids[spawn_worker(host, port, worker, ready_w)] = worker
+    os.close(ready_w)
+    ready = 0
+    deadline = time.monotonic() + 30
+    while ready < workers and time.monotonic() < deadline:
+        chunk = os.read(ready_r, workers - ready)
+        if not chunk:
+            break
+        ready += len(chunk)
+    os.close(ready_r)
+    log_line(f"Server running: http://{host}:{port} ({workers} workers)", tag="api", level="success")
+
+    stopping = []
+
+    def stop(signum, frame):
+        stopping.append(signum)
+        for pid in list(pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    if on_ready:
+        on_ready(SimpleNamespace(server_address=(host, port), workers=pids))
+    restarts = []
+    while pids:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        worker = pids.pop(pid, None)
+        if worker is None or stopping:
+            continue
+        log_line(f"Worker {worker} (pid {pid}) exited with status {status}; restarting", tag="api", level="warn")
+        now = time.monotonic()
+        restarts = [t for t in restarts if now - t < WORKER_RESTART_WINDOW] + [now]
+        if len(restarts) > WORKER_RESTART_BURST:
+            time.sleep(1)
+        pids[spawn_worker(host, port, worker)] = worker
+    probe.close()
+
+
+def run(host="127.0.0.1", port=8000, on_ready=None, workers=1):
     log_line("Server starting...", tag="api", level="info")
     load_env_files()
     ensure_db()
-    port = 8000
-    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
-    log_line(f"Server running: http://127.0.0.1:{port}", tag="api", level="success")
+    stats = precompress_static_assets()
+    log_line(
+        f"Static precompress: {stats['written']} written, {stats['fresh']} fresh ({', '.join(stats['encodings'])})",
+        tag="api",
+        level="dim",
+    )
+    if workers > 1:
+        if hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT"):
+            run_workers(host, port, workers, on_ready=on_ready)
+            return
+        log_line("--workers needs fork() and SO_REUSEPORT; running a single process", tag="api", level="warn")
+    server = ThreadingHTTPServer((host, port), Handler)
+    host, port = server.server_address[:2]
+    log_line(f"Server running: http://{host}:{port}", tag="api", level="success")
+    threading.Thread(target=warm_response_cache, daemon=True).start()
+    start_seed_watcher()
+    if on_ready:
+        on_ready(server)
     server.serve_forever()
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Serve the dashboard and the Oscars watchlist API")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8000, help="Port (0 = ephemeral)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("SERVER_WORKERS") or 1),
+        help="Worker processes sharing the port via SO_REUSEPORT (default 1)",
+    )
+    args = parser.parse_args()
+    run(host=args.host, port=args.port, workers=max(1, args.workers))
+
+
 if __name__ == "__main__":
-    run()
+    main()
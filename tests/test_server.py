@@ -0,0 +1,112 @@
+import json
+import shutil
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # WHY: every test gets its own copy of the watchlist so triggers and summaries start from a known state.
+    path = tmp_path / "watchlist.sqlite"
+    shutil.copy(server.ROOT / "watchlist.sqlite", path)
+    monkeypatch.setattr(server, "DB_PATH", path)
+    monkeypatch.setattr(server, "LOG_PATH", tmp_path / "server.log")
+    server.ensure_db()
+    conn = server.db_connect()
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    "value, minutes",
+    [
+        ("1h 17min", 77),
+        ("2h 5min", 125),
+        ("2h", 120),
+        ("1h05m", 65),
+        ("137 min", 137),
+        ("95min", 95),
+        ("90", 90),
+        (104, 104),
+        ("", None),
+        (None, None),
+        ("N/A", None),
+    ],
+)
+def test_parse_runtime_minutes(value, minutes):
+    # WHY: seed runtimes mix "1h 17min" and "137 min"; CAST(... AS INTEGER) read the former as 1.
+    assert server.parse_runtime_minutes(value) == minutes
+
+
+def year_runtime(conn, year):
+    return conn.execute("SELECT runtime_minutes FROM year_summary WHERE oscars_year = ?;", (year,)).fetchone()[0]
+
+
+def test_year_summary_sums_hour_minute_runtimes(db):
+    seed = json.loads((server.OSCARS_DATA_DIR / "2026.json").read_text(encoding="utf-8"))
+    rows = seed if isinstance(seed, list) else seed.get("rows", [])
+    assert any("h" in str(row.get("runtime") or "") for row in rows)
+    stored = db.execute("SELECT runtime FROM watchlist WHERE oscars_year = 2026;").fetchall()
+    expected = sum(server.parse_runtime_minutes(runtime) or 0 for (runtime,) in stored)
+    assert year_runtime(db, 2026) == expected
+    summary = {item["year"]: item for item in server.year_summary()}
+    assert summary[2026]["runtime_minutes"] == expected
+
+
+def test_year_summary_follows_runtime_writes(db):
+    before = year_runtime(db, 2026)
+    row_id, minutes = db.execute(
+        "SELECT rowid, COALESCE(runtime_minutes, 0) FROM watchlist WHERE oscars_year = 2026 LIMIT 1;"
+    ).fetchone()
+    db.execute("UPDATE watchlist SET runtime = '1h 17min' WHERE rowid = ?;", (row_id,))
+    server.refresh_facets(db)
+    db.commit()
+    assert year_runtime(db, 2026) == before - minutes + 77
+
+    cols = [name for name, _ in server.COLUMNS]
+    row = server.seed_row({"title": "Runtime Probe", "runtime": "2h 5min"}, default_year=2026)
+    db.execute(
+        f"INSERT INTO watchlist ({','.join(cols)}) VALUES ({','.join('?' for _ in cols)});",
+        [row[col] for col in cols],
+    )
+    server.refresh_facets(db)
+    db.commit()
+    assert year_runtime(db, 2026) == before - minutes + 77 + 125
+
+    db.execute("DELETE FROM watchlist WHERE title = 'Runtime Probe';")
+    db.commit()
+    assert year_runtime(db, 2026) == before - minutes + 77
+
+    # The startup rebuild must agree with what the triggers maintained.
+    server.ensure_year_summary(db)
+    assert year_runtime(db, 2026) == before - minutes + 77
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["The-Brutalist.jpg", "poster-Conclave.jpg", "Anora-Poster2024.jpg", "oscars.js", "styles.css", "index.html"],
+)
+def test_plain_names_are_not_fingerprinted(name):
+    # WHY: a false positive pins a mutable file in browser caches for a year.
+    assert not server.is_fingerprinted(name)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["index-B6hUSIXg.js", "vendor-a1B2_c3D.css", "index-B6h-SIXg.js", "app.3f2a9c1d.js", "logo-0123456789abcdef.svg"],
+)
+def test_hashed_names_are_fingerprinted(name):
+    assert server.is_fingerprinted(name)
+
+
+@pytest.mark.parametrize("name", ["The-Brutalist.jpg", "Anora-Poster2024.jpg", "dune-3f2a9c1d.jpg"])
+def test_posters_never_get_immutable_cache(name):
+    # WHY: posters can be replaced in place, even when the file name looks hashed.
+    assert server.static_cache_control(server.POSTERS_DIR / name) == server.STATIC_CACHE_POSTERS
+
+
+def test_hashed_assets_get_immutable_cache():
+    assert server.static_cache_control(server.ROOT / "assets" / "index-B6hUSIXg.js") == server.STATIC_CACHE_IMMUTABLE
+    assert server.static_cache_control(server.ROOT / "js" / "oscars.js") == server.STATIC_CACHE_DEFAULT